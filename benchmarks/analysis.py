@@ -0,0 +1,58 @@
+"""Analysis throughput of a capture, across 1, 2, 4 and 8 worker processes.
+
+A temporary pcap is written with the retransmissions of many publishers, each one with a few events,
+then analyzed as a whole. The number of CPUs is printed first, as the speedup depends on it.
+
+Run from the repository root:
+
+    python -m benchmarks.analysis
+"""
+from os import cpu_count, path
+from struct import pack
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from py61850.goose.analysis import analyze
+from py61850.goose.publisher import Publisher
+from py61850.types import Boolean, VisibleString
+from py61850.types.floating_point import DoublePrecision
+
+PUBLISHERS = 100
+FRAMES = 2_000  # per publisher
+WORKERS = (1, 2, 4, 8)
+
+
+def write(name: str) -> int:
+    publishers = []
+    for app_id in range(1, PUBLISHERS + 1):
+        publisher = Publisher(app_id=app_id, all_data=(Boolean(True), VisibleString('Okay'), DoublePrecision(1.5)))
+        iter(publisher)
+        publishers.append(publisher)
+    with open(name, 'wb') as file:
+        file.write(pack('<IHHiIII', 0xA1B2C3D4, 2, 4, 0, 0, 0xFFFF, 1))
+        for index in range(FRAMES):
+            for publisher in publishers:
+                if index % 500 == 499:
+                    publisher.protocol_data_unit.all_data[2] = index / 10
+                frame = bytes(next(publisher))
+                file.write(pack('<IIII', index, 0, len(frame), len(frame)) + frame)
+    return PUBLISHERS * FRAMES
+
+
+def main():
+    print(f'{cpu_count()} CPUs')
+    print(f'{"workers":>8}{"seconds":>10}{"frames/s":>12}{"speedup":>9}')
+    with TemporaryDirectory() as directory:
+        name = path.join(directory, 'capture.pcap')
+        frames = write(name)
+        baseline = None
+        for workers in WORKERS:
+            start = perf_counter()
+            analyze(name, workers)
+            seconds = perf_counter() - start
+            baseline = baseline or seconds
+            print(f'{workers:>8}{seconds:>10.2f}{frames / seconds:>12.0f}{baseline / seconds:>9.2f}')
+
+
+if __name__ == '__main__':
+    main()
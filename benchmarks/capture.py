@@ -0,0 +1,57 @@
+"""Scanning time and Python memory of a capture, whatever its size.
+
+A temporary pcap is written with one GOOSE frame out of ten, among other frames,
+then only the GOOSE frames are handed over and their APPID read.
+
+Run from the repository root:
+
+    python -m benchmarks.capture
+"""
+from os import path
+from struct import pack
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from tracemalloc import get_traced_memory, start, stop
+
+from py61850.goose.capture import Capture
+from py61850.goose.frame import Frame
+from py61850.goose.publisher import Publisher
+
+FRAMES = (100_000, 1_000_000)
+GOOSE = bytes(Publisher())
+OTHER = b'\xFF' * 12 + b'\x08\x00' + b'\x00' * 1000
+
+
+def write(name: str, number: int) -> int:
+    with open(name, 'wb') as file:
+        file.write(pack('<IHHiIII', 0xA1B2C3D4, 2, 4, 0, 0, 0xFFFF, 1))
+        for index in range(number):
+            frame = GOOSE if index % 10 == 0 else OTHER
+            file.write(pack('<IIII', index, 0, len(frame), len(frame)) + frame)
+    return path.getsize(name)
+
+
+def scan(name: str) -> None:
+    with Capture(name) as capture:
+        for frame in capture:
+            Frame.unpack_header(frame.data)
+
+
+def main():
+    print(f'{"frames":>10}{"MB":>8}{"seconds":>10}{"MB/s":>8}{"peak KiB":>10}')
+    with TemporaryDirectory() as directory:
+        for number in FRAMES:
+            name = path.join(directory, f'{number}.pcap')
+            size = write(name, number) / 1e6
+            begin = perf_counter()
+            scan(name)
+            seconds = perf_counter() - begin
+            start()  # traced apart, as tracing slows the scan down
+            scan(name)
+            peak = get_traced_memory()[1]
+            stop()
+            print(f'{number:>10}{size:>8.0f}{seconds:>10.2f}{size / seconds:>8.0f}{peak / 1024:>10.1f}')
+
+
+if __name__ == '__main__':
+    main()
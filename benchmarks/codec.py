@@ -0,0 +1,42 @@
+"""Encoding and decoding time, object path versus functional path.
+
+Run from the repository root:
+
+    python -m benchmarks.codec
+"""
+from timeit import timeit
+
+from py61850.goose.pdu import StatusNumber
+from py61850.types import Boolean, VisibleString
+from py61850.types.floating_point import DoublePrecision
+from py61850.types.integer import Unsigned
+
+NUMBER = 100_000
+
+TYPES = (
+    ('Boolean', Boolean, True),
+    ('Unsigned', Unsigned, 1000),
+    ('DoublePrecision', DoublePrecision, 1.5),
+    ('VisibleString', VisibleString, 'Content'),
+    ('StatusNumber', StatusNumber, 1),
+)
+
+
+def microseconds(statement) -> float:
+    return timeit(statement, number=NUMBER) / NUMBER * 1e6
+
+
+def main():
+    print(f'{"type":<18}{"encode obj":>12}{"encode fn":>12}{"decode obj":>12}{"decode fn":>12}  (us/call)')
+    for name, data_type, value in TYPES:
+        byte_stream = data_type.encode(value)
+        raw_value = byte_stream[2:]
+        print(f'{name:<18}'
+              f'{microseconds(lambda: bytes(data_type(value))):>12.2f}'
+              f'{microseconds(lambda: data_type.encode(value)):>12.2f}'
+              f'{microseconds(lambda: data_type(raw_value).value):>12.2f}'
+              f'{microseconds(lambda: data_type.decode(byte_stream)):>12.2f}')
+
+
+if __name__ == '__main__':
+    main()
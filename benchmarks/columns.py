@@ -0,0 +1,87 @@
+"""Decoding many frames into columns, and encoding `AllData` from columns, through objects versus NumPy arrays.
+
+Run from the repository root (NumPy is required):
+
+    python -m benchmarks.columns
+"""
+from timeit import timeit
+
+import numpy
+
+from py61850.goose.columns import decode_columns, encode_all_data
+from py61850.goose.frame import Frame
+from py61850.goose.pdu import AllData
+from py61850.goose.publisher import Publisher
+from py61850.types import Boolean
+from py61850.types.floating_point import DoublePrecision, SinglePrecision
+from py61850.types.integer import Signed, Unsigned
+
+NUMBER = 100_000
+PUBLISHERS = 100
+LAYOUT = (('stVal', Boolean), ('mag', DoublePrecision), ('ops', Unsigned))
+ROWS = 10_000  # publishers encoded at once
+ENCODED = (('stVal', Boolean), ('mag', SinglePrecision), ('ang', DoublePrecision), ('count', Signed)) * 4
+
+
+def write() -> list:
+    publishers = []
+    for app_id in range(1, PUBLISHERS + 1):
+        publisher = Publisher(app_id=app_id, all_data=(Boolean(True), DoublePrecision(1.5), Unsigned(1000)))
+        iter(publisher)
+        publishers.append(publisher)
+    frames = []
+    for index in range(NUMBER // PUBLISHERS):
+        for publisher in publishers:
+            if index % 100 == 99:
+                publisher.protocol_data_unit.all_data[1] = index / 10
+            frames.append(bytes(next(publisher)))
+    return frames
+
+
+def decode():
+    frames = write()
+
+    def objects():
+        columns = {name: [] for name in ('app_id', 'stNum', 'sqNum', 'stVal', 'mag', 'ops')}
+        for frame in frames:
+            frame = Frame(frame)
+            pdu = frame.protocol_data_unit
+            columns['app_id'].append(int(frame.app_id, 16))
+            columns['stNum'].append(pdu.status_number.value)
+            columns['sqNum'].append(pdu.sequence_number.value)
+            for name, data in zip(('stVal', 'mag', 'ops'), pdu.all_data):
+                columns[name].append(data.value)
+
+    def arrays():
+        decode_columns(frames, LAYOUT)
+
+    print(f'{"path":<16}{"us/frame":>10}  ({NUMBER} frames)')
+    for name, statement in (('Frame', objects), ('decode_columns', arrays)):
+        print(f'{name:<16}{timeit(statement, number=1) / NUMBER * 1e6:>10.2f}')
+
+
+def encode():
+    generator = numpy.random.default_rng(0)
+    columns = {'stVal': generator.random(ROWS) > 0.5, 'mag': generator.standard_normal(ROWS).astype(numpy.float32),
+               'ang': generator.standard_normal(ROWS), 'count': generator.integers(-100_000, 100_000, ROWS)}
+    rows = [{name: column[row].item() for name, column in columns.items()} for row in range(ROWS)]
+
+    def objects():
+        for row in rows:
+            bytes(AllData(*[data_type(row[name]) for name, data_type in ENCODED]))
+
+    def arrays():
+        encode_all_data(columns, ENCODED)
+
+    print(f'{"path":<16}{"us/row":>10}  ({ROWS} rows of {len(ENCODED)} data set entries)')
+    for name, statement in (('AllData', objects), ('encode_all_data', arrays)):
+        print(f'{name:<16}{timeit(statement, number=1) / ROWS * 1e6:>10.2f}')
+
+
+def main():
+    decode()
+    encode()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""Decoding the frames of a fixed-length encoded publisher, through `Frame` and `Subscriber` versus at fixed offsets.
+
+Run from the repository root:
+
+    python -m benchmarks.fixed_length
+"""
+from timeit import timeit
+
+from py61850.goose.fixed_length import FixedLengthDecoder
+from py61850.goose.frame import Frame
+from py61850.goose.publisher import Publisher
+from py61850.goose.subscriber import Subscriber
+from py61850.types import Boolean
+from py61850.types.floating_point import DoublePrecision, SinglePrecision
+from py61850.types.integer import Signed
+
+NUMBER = 20_000
+FRAMES = 1000
+MEMBERS = ((Boolean, True), (SinglePrecision, 0.5), (DoublePrecision, 1.5), (Signed, -1000)) * 4
+
+
+def write() -> list:
+    publisher = Publisher(all_data=[data_type(value) for data_type, value in MEMBERS], fixed_length=True, compiled=True)
+    iter(publisher)
+    frames = []
+    for index in range(FRAMES):
+        if index % 10 == 9:  # an event every ten frames
+            publisher.protocol_data_unit.all_data[3] = -index
+        frames.append(bytes(next(publisher)))
+    return frames
+
+
+def main():
+    frames = write()
+    decoder = FixedLengthDecoder(frames[0])
+    subscriber = Subscriber()
+    paths = (('Frame (whole decode)', lambda: [Frame(frame).protocol_data_unit.all_data for frame in frames]),
+             ('Subscriber.receive', lambda: [subscriber.receive(frame) for frame in frames]),
+             ('FixedLengthDecoder', lambda: [decoder.decode(frame) for frame in frames]))
+    print(f'{"path":<24}{"us/frame":>10}')
+    for path, decode in paths:
+        number = max(1, NUMBER // FRAMES)
+        print(f'{path:<24}{timeit(decode, number=number) / number / FRAMES * 1e6:>10.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""Bytes allocated per object, for each type.
+
+Run from the repository root:
+
+    python -m benchmarks.memory
+"""
+from tracemalloc import get_traced_memory, start, stop
+
+from py61850.goose.pdu import AllData, GooseControlBlockReference, GooseTimestamp, SequenceNumber, StatusNumber
+from py61850.types import Boolean, VisibleString
+from py61850.types.boolean import InternedBoolean
+from py61850.types.floating_point import DoublePrecision, SinglePrecision
+from py61850.types.integer import InternedUnsigned, Signed, Unsigned
+from py61850.types.times import Quality, Timestamp
+
+COUNT = 100_000
+
+TYPES = (
+    ('Boolean', lambda: Boolean(True)),
+    ('Unsigned', lambda: Unsigned(1000)),
+    ('Signed', lambda: Signed(-1000)),
+    ('SinglePrecision', lambda: SinglePrecision(1.5)),
+    ('DoublePrecision', lambda: DoublePrecision(1.5)),
+    ('VisibleString', lambda: VisibleString('Content')),
+    ('Quality', lambda: Quality()),
+    ('Timestamp', lambda: Timestamp(1.5, Quality())),
+    ('StatusNumber', lambda: StatusNumber(1)),
+    ('SequenceNumber', lambda: SequenceNumber(0)),
+    ('GooseControlBlockReference', lambda: GooseControlBlockReference('IED_CFG/LLN0$GO$ControlBlockReference')),
+    ('GooseTimestamp', lambda: GooseTimestamp(1.5, Quality())),
+    ('AllData', lambda: AllData(Boolean(True), Unsigned(1))),
+    ('InternedBoolean', lambda: InternedBoolean(True)),
+    ('InternedUnsigned', lambda: InternedUnsigned(1)),
+    ('AllData (interned)', lambda: AllData(InternedBoolean(True), InternedUnsigned(1))),
+)
+
+
+def bytes_per_object(factory) -> float:
+    start()
+    objects = [factory() for _ in range(COUNT)]
+    size = get_traced_memory()[0]
+    stop()
+    del objects
+    return size / COUNT
+
+
+def main():
+    print(f'{"type":<28}{"bytes/object":>14}')
+    for name, factory in TYPES:
+        print(f'{name:<28}{bytes_per_object(factory):>14.1f}')
+
+
+if __name__ == '__main__':
+    main()
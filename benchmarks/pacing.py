@@ -0,0 +1,40 @@
+"""Send-time error, `time.sleep` versus `Pacer`, waiting along the first retransmissions after an event.
+
+Run from the repository root:
+
+    python -m benchmarks.pacing
+"""
+from time import sleep
+
+from py61850.communication.pacing import Pacer, perf_counter_ns
+from py61850.goose.retransmission import RetransmissionCurve
+
+ROUNDS = 20
+CURVE = RetransmissionCurve(t0=0.064, t1=0.002)
+
+
+def errors(wait) -> list:
+    late = []
+    for _ in range(ROUNDS):
+        deadline = perf_counter_ns()
+        for sequence_number in range(6):  # 2, 4, 8, 16, 32 and 64 ms
+            deadline += int(CURVE.interval(sequence_number) * 1_000_000_000)
+            wait(deadline)
+            late.append(perf_counter_ns() - deadline)
+    return late
+
+
+def sleep_until(deadline: int) -> None:
+    sleep(max(0, deadline - perf_counter_ns()) / 1_000_000_000)
+
+
+def main():
+    print(f'{"wait":<10}{"median":>10}{"p90":>10}{"max":>10}  (us late)')
+    for name, wait in (('sleep', sleep_until), ('pacer', Pacer().wait)):
+        late = sorted(errors(wait))
+        median, p90 = (late[int(len(late) * quantile)] / 1000 for quantile in (0.5, 0.9))
+        print(f'{name:<10}{median:>10.1f}{p90:>10.1f}{late[-1] / 1000:>10.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""Scheduler overhead per frame, for many simulated control blocks.
+
+Each control block sends a heartbeat every second, with a random phase, while the clock is
+simulated one millisecond at a time, thus only the scheduler itself is measured.
+
+Run from the repository root:
+
+    python -m benchmarks.scheduler
+"""
+from random import Random
+from time import perf_counter
+
+from py61850.communication.scheduler import Scheduler
+
+CONTROL_BLOCKS = (10_000, 50_000, 100_000)
+SECONDS = 3
+
+
+class ControlBlock:
+    __slots__ = ()
+    next_goose_timer = 1.0
+
+    def __iter__(self) -> 'ControlBlock':
+        return self
+
+    def __next__(self) -> bytes:
+        return b''
+
+
+class NullTransmitter:
+    __slots__ = ('frames',)
+
+    def __init__(self) -> None:
+        self.frames = 0
+
+    def queue_publisher(self, _) -> None:
+        self.frames += 1
+
+    def flush(self) -> None:
+        pass
+
+
+def measure(control_blocks: int) -> float:
+    random = Random(control_blocks)
+    clock = [0.0]
+    transmitter = NullTransmitter()
+    scheduler = Scheduler(transmitter, clock=lambda: clock[0])
+    for _ in range(control_blocks):
+        scheduler.add(ControlBlock(), delay=random.random())
+    start = perf_counter()
+    for millisecond in range(1, SECONDS * 1000 + 1):
+        scheduler.advance(millisecond / 1000)
+    return (perf_counter() - start) / transmitter.frames * 1e9
+
+
+def main():
+    print(f'{"control blocks":>16}{"ns/frame":>12}')
+    for control_blocks in CONTROL_BLOCKS:
+        print(f'{control_blocks:>16}{measure(control_blocks):>12.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+"""Receiving time of a retransmission, decoding the whole frame versus tracking its stream.
+
+Run from the repository root:
+
+    python -m benchmarks.subscriber
+"""
+from timeit import timeit
+
+from py61850.goose.frame import Frame
+from py61850.goose.publisher import Publisher
+from py61850.goose.subscriber import Subscriber
+from py61850.types import Boolean, VisibleString
+from py61850.types.floating_point import DoublePrecision
+from py61850.types.integer import Unsigned
+
+NUMBER = 20_000
+ALL_DATA = (Boolean(True), VisibleString('Okay'), DoublePrecision(1.5), Unsigned(1000)) * 4
+
+
+def main():
+    publisher = Publisher(all_data=ALL_DATA)
+    iter(publisher)
+    frames = [bytes(next(publisher)) for _ in range(NUMBER)]
+    subscriber = Subscriber()
+    subscriber.receive(frames[0])
+
+    def decode():
+        for frame in frames:
+            Frame(frame).protocol_data_unit.all_data[0]
+
+    def receive():
+        for frame in frames:
+            subscriber.receive(frame)
+
+    print(f'{"path":<12}{"us/frame":>10}  ({len(ALL_DATA)} data set entries)')
+    for name, statement in (('Frame', decode), ('Subscriber', receive)):
+        print(f'{name:<12}{timeit(statement, number=1) / NUMBER * 1e6:>10.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""Supervision overhead per received frame, for many subscribed streams.
+
+Each stream is refreshed by a heartbeat every second, with a random phase, and carries a time
+allowed to live of two seconds, while 1 % of the streams go silent after the first second.
+The clock is simulated one millisecond at a time, checking for timeouts on every step.
+
+Run from the repository root:
+
+    python -m benchmarks.supervision
+"""
+from random import Random
+from time import perf_counter
+
+from py61850.goose.subscriber import Stream
+from py61850.goose.supervision import Supervisor
+
+STREAMS = (10_000, 50_000, 100_000)
+SECONDS = 5
+
+
+def measure(number: int) -> tuple:
+    random = Random(number)
+    streams = []
+    for app_id in range(number):
+        stream = Stream(app_id, 'IED_CFG/LLN0$GO$ControlBlockReference')
+        stream.time_allowed_to_live = 2000
+        streams.append(stream)
+    # the streams refreshed on each millisecond
+    refreshes = [[] for _ in range(SECONDS * 1000)]
+    for index, stream in enumerate(streams):
+        silent = index % 100 == 0
+        phase = random.randrange(1000)
+        for second in range(1 if silent else SECONDS):
+            refreshes[second * 1000 + phase].append(stream)
+
+    timeouts = []
+    supervisor = Supervisor(timeouts.append, clock=lambda: 0.0)
+    start = perf_counter()
+    for millisecond, due in enumerate(refreshes):
+        now = millisecond / 1000
+        for stream in due:
+            supervisor.refresh(stream, now)
+        supervisor.check(now)
+    seconds = perf_counter() - start
+    frames = sum(len(due) for due in refreshes)
+    return seconds / frames * 1e9, len(timeouts)
+
+
+def main():
+    print(f'{"streams":>10}{"ns/frame":>12}{"timeouts":>10}')
+    for number in STREAMS:
+        nanoseconds, timeouts = measure(number)
+        print(f'{number:>10}{nanoseconds:>12.0f}{timeouts:>10}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+import os
+from time import perf_counter, sleep
+from typing import Iterator, NamedTuple, Optional
+
+from py61850.goose.publisher import Publisher
+
+try:
+    from time import perf_counter_ns
+except ImportError:  # Python 3.6
+    def perf_counter_ns() -> int:
+        return int(perf_counter() * 1_000_000_000)
+
+
+class PacingStats(NamedTuple):
+    """How late each wait ended, in nanoseconds."""
+    count: int
+    mean: float
+    minimum: int
+    maximum: int
+
+
+class Pacer:
+    """Wait for deadlines within tens of microseconds, sleeping coarsely then spinning for the final stretch.
+
+    `time.sleep` and the asyncio timers wake up late by up to a millisecond or more, thus the pacer
+    only sleeps until `spin` seconds before the deadline, then spins on `perf_counter_ns`.
+    The error of each wait (how late it ended) is recorded, see `statistics`.
+
+    Args:
+        spin: The seconds spent spinning before each deadline.
+        realtime: Whether to pin the process to `cpu` and run it under `SCHED_FIFO`, see `set_realtime`.
+        cpu: The CPU to pin the process to, defaults to the last allowed one.
+        priority: The `SCHED_FIFO` priority.
+
+    Raises:
+        ValueError: If `spin` is out of the supported range.
+    """
+
+    def __init__(self, spin: float = 0.002, realtime: bool = False, cpu: Optional[int] = None,
+                 priority: int = 50) -> None:
+        if spin < 0:
+            raise ValueError('spin out of supported range')
+        self._spin = int(spin * 1_000_000_000)
+        self._realtime = set_realtime(cpu, priority) if realtime else False
+        self.reset()
+
+    def wait(self, deadline: int) -> int:
+        """Return at `deadline` (nanoseconds of `perf_counter_ns`), or right away if past,
+        then return how late it was, in nanoseconds."""
+        remaining = deadline - perf_counter_ns()
+        if remaining > self._spin:
+            sleep((remaining - self._spin) / 1_000_000_000)
+        now = perf_counter_ns()
+        while now < deadline:
+            now = perf_counter_ns()
+        error = now - deadline
+        self._count += 1
+        self._total += error
+        self._minimum = error if self._count == 1 else min(self._minimum, error)
+        self._maximum = error if self._count == 1 else max(self._maximum, error)
+        return error
+
+    def pace(self, publisher: Publisher) -> Iterator[bytes]:
+        """Yield each frame of `publisher` when due, following its retransmission curve.
+
+        Each frame is rendered ahead, so it is handed over as soon as its deadline is met.
+        """
+        deadline = perf_counter_ns()
+        for _ in publisher:
+            frame = bytes(publisher)
+            self.wait(deadline)
+            yield frame
+            deadline += int(publisher.next_goose_timer * 1_000_000_000)
+
+    def statistics(self) -> PacingStats:
+        """Return the errors of every wait, since created or reset."""
+        if not self._count:
+            return PacingStats(0, 0.0, 0, 0)
+        return PacingStats(self._count, self._total / self._count, self._minimum, self._maximum)
+
+    def reset(self) -> None:
+        """Forget the recorded errors."""
+        self._count = 0
+        self._total = 0
+        self._minimum = 0
+        self._maximum = 0
+
+    @property
+    def spin(self) -> float:
+        return self._spin / 1_000_000_000
+
+    @property
+    def realtime(self) -> bool:
+        """Whether the process was pinned and runs under `SCHED_FIFO`."""
+        return self._realtime
+
+
+def set_realtime(cpu: Optional[int] = None, priority: int = 50) -> bool:
+    """Pin the process to `cpu` (the last allowed one by default), then run it under `SCHED_FIFO`.
+
+    Returns:
+        Whether the process now runs under `SCHED_FIFO`, i.e. `False` if not permitted or not supported
+        by the platform, or if `cpu` is not allowed, in which case the original affinity is restored.
+    """
+    try:
+        affinity = os.sched_getaffinity(0)
+    except (AttributeError, OSError):
+        return False
+    try:
+        os.sched_setaffinity(0, {max(affinity) if cpu is None else cpu})
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+    except (AttributeError, OSError):
+        try:
+            os.sched_setaffinity(0, affinity)
+        except (AttributeError, OSError):
+            pass
+        return False
+    return True
@@ -0,0 +1,49 @@
+"""Linux `AF_PACKET` socket options and memory mapped ring layouts, see `packet(7)`."""
+from struct import Struct
+
+SO_ATTACH_FILTER = 26
+SO_DETACH_FILTER = 27
+
+SOL_PACKET = 263
+PACKET_ADD_MEMBERSHIP = 1
+PACKET_RX_RING = 5
+PACKET_STATISTICS = 6
+PACKET_VERSION = 10
+PACKET_TX_RING = 13
+PACKET_QDISC_BYPASS = 20
+
+# sockaddr_ll.sll_pkttype
+PACKET_OUTGOING = 4
+
+TPACKET_V2 = 1
+TPACKET_V3 = 2
+TPACKET_ALIGNMENT = 16
+
+# tpacket2_hdr.tp_status, when transmitting
+TP_STATUS_AVAILABLE = 0
+TP_STATUS_SEND_REQUEST = 1
+TP_STATUS_SENDING = 2
+TP_STATUS_WRONG_FORMAT = 4
+
+# tpacket_block_desc.hdr.bh1.block_status, when receiving
+TP_STATUS_KERNEL = 0
+TP_STATUS_USER = 1
+
+# tpacket3_hdr.tp_status, when receiving
+TP_STATUS_VLAN_VALID = 0x10
+
+# where the frame starts within a TPACKET_V2 transmit slot, right after its tpacket2_hdr
+TPACKET2_DATA_OFFSET = 32
+
+# native byte order, as the kernel writes them
+U16 = Struct('=H')
+U32 = Struct('=I')
+TPACKET_REQ = Struct('=IIII')  # block_size, block_nr, frame_size, frame_nr
+TPACKET_REQ3 = Struct('=IIIIIII')  # tpacket_req, retire_blk_tov, sizeof_priv, feature_req_word
+TPACKET3_HDR = Struct('=IIII')  # tp_next_offset, tp_sec, tp_nsec, tp_snaplen
+TPACKET_STATS_V3 = Struct('=III')  # packets, drops, freeze_q_cnt
+
+
+def packet_align(length: int, alignment: int = TPACKET_ALIGNMENT) -> int:
+    """Round `length` up to `alignment`."""
+    return (length + alignment - 1) & ~(alignment - 1)
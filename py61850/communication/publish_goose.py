@@ -1,15 +1,17 @@
-from socket import AF_PACKET, socket, SOCK_RAW
+from asyncio import get_event_loop, sleep
 from sys import argv
 from time import time, time_ns
 
+from py61850.communication.runner import PublisherRunner
+from py61850.communication.transmitter import new_transmitter
 from py61850.goose.publisher import Publisher
 from py61850.types import Boolean, VisibleString
 from py61850.types.floating_point import DoublePrecision, SinglePrecision
 from py61850.types.integer import Signed, Unsigned
 from py61850.types.times import Quality, Timestamp
 
-nic = socket(AF_PACKET, SOCK_RAW)
-nic.bind((argv[1], 0))
+# e.g. python3 -m py61850.communication.publish_goose lo --tx-ring
+transmitter = new_transmitter(argv[1], tx_ring='--tx-ring' in argv[2:])
 
 now = time_ns()
 
@@ -51,12 +53,19 @@ data = {
 
 publisher = Publisher(**data)
 
-goose = bytes(publisher)
-nic.send(goose)
 
-for index, goose in enumerate(publisher):
-    nic.send(bytes(goose))
-    if index == 0xF:
-        break
+async def publish():
+    # heartbeat, then an event retransmitted fast again, see RetransmissionCurve
+    runner = PublisherRunner(transmitter)
+    runner.add(publisher)
+    await sleep(1)
+    publisher.protocol_data_unit.all_data[1] = 'New Content'
+    runner.notify(publisher)
+    await sleep(1)
+    runner.stop()
 
-print(f'{(time_ns() - now) / 1000}us')
+
+get_event_loop().run_until_complete(publish())
+transmitter.close()
+
+print(f'{(time_ns() - now) / 1000}us, {transmitter.frames} frames, {transmitter.system_calls} system calls')
@@ -0,0 +1,141 @@
+from mmap import MAP_SHARED, mmap, PAGESIZE, PROT_READ, PROT_WRITE
+from select import POLLERR, POLLIN, poll
+from socket import AF_PACKET, socket, SOCK_RAW
+from typing import Iterator, NamedTuple, Optional, Tuple
+
+from py61850.communication.packet import PACKET_OUTGOING, PACKET_RX_RING, PACKET_STATISTICS, PACKET_VERSION, SOL_PACKET
+from py61850.communication.packet import TP_STATUS_KERNEL, TP_STATUS_USER, TPACKET_REQ3, TPACKET_STATS_V3, TPACKET_V3
+from py61850.communication.packet import TP_STATUS_VLAN_VALID, TPACKET3_HDR, U16, U32
+from py61850.communication.socket_filter import attach_filter
+from py61850.goose.frame import is_goose
+
+ETH_P_ALL = 0x0003
+
+
+class ReceivedFrame(NamedTuple):
+    """A frame still within the ring, valid until the iteration moves to the next block."""
+    data: memoryview  # the frame, whose 802.1Q tag may have been stripped by the kernel into `tci`
+    tci: Optional[int]  # the VLAN tag control information, `None` if untagged
+    time_ns: int  # when the kernel received it, in nanoseconds since the epoch
+
+
+class RingReceiver:
+    """Receive GOOSE frames through a memory mapped `PACKET_RX_RING` (`TPACKET_V3`).
+
+    The kernel fills whole blocks of frames, handed over as `memoryview` over the ring,
+    thus nothing is copied, nor any system call made, per frame.
+    Blocks are given back to the kernel as soon as the iteration moves past them.
+
+    The socket captures every protocol, so the kernel keeps the 802.1Q tag information,
+    then only GOOSE frames (tagged or not) are handed over. Attach a filter (`attach_filter`)
+    to keep the others in the kernel.
+
+    Args:
+        interface: The network interface to capture from.
+        block_size: The size of each block of the ring, a multiple of the page size.
+        block_number: How many blocks the ring has.
+        frame_size: The greatest size of a captured frame, including its ring header.
+        block_timeout: The milliseconds after which a block is handed over, even if not full.
+        outgoing: Also hand over the frames sent from this host.
+
+    Raises:
+        ValueError: If `block_size` or `frame_size` are out of the supported range.
+        OSError: If the ring cannot be set up, e.g. not permitted.
+    """
+
+    def __init__(self, interface: str, block_size: int = 1 << 20, block_number: int = 32, frame_size: int = 2048,
+                 block_timeout: int = 8, outgoing: bool = False) -> None:
+        if block_size <= 0 or block_size % PAGESIZE:
+            raise ValueError('block_size out of supported range')
+        if frame_size <= 0 or frame_size % 16 or block_size % frame_size:
+            raise ValueError('frame_size out of supported range')
+        self._block_size = block_size
+        self._block_number = block_number
+        self._outgoing = outgoing
+        self._block = 0
+        self._nic = socket(AF_PACKET, SOCK_RAW, 0)
+        try:
+            self._nic.setsockopt(SOL_PACKET, PACKET_VERSION, TPACKET_V3)
+            self._nic.setsockopt(SOL_PACKET, PACKET_RX_RING, TPACKET_REQ3.pack(
+                block_size, block_number, frame_size, block_size // frame_size * block_number, block_timeout, 0, 0))
+            self._ring = mmap(self._nic.fileno(), block_size * block_number, MAP_SHARED, PROT_READ | PROT_WRITE)
+            self._nic.bind((interface, ETH_P_ALL))
+        except BaseException:
+            self._nic.close()
+            raise
+        self._view = memoryview(self._ring)
+        self._poll = poll()
+        self._poll.register(self._nic.fileno(), POLLIN | POLLERR)
+
+    def __enter__(self) -> 'RingReceiver':
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[ReceivedFrame]:
+        return self.frames()
+
+    def frames(self, timeout: Optional[float] = None) -> Iterator[ReceivedFrame]:
+        """Yield every received GOOSE frame.
+
+        Args:
+            timeout: The seconds to wait for a block, `None` to wait forever.
+                The iteration stops when no block arrives in time.
+        """
+        while self._wait(timeout):
+            offset = self._block * self._block_size
+            try:
+                yield from self._block_frames(offset)
+            finally:
+                U32.pack_into(self._view, offset + 8, TP_STATUS_KERNEL)  # block_status
+                self._block = (self._block + 1) % self._block_number
+
+    def statistics(self) -> Tuple[int, int]:
+        """Return how many frames were received and dropped by the kernel, since last called."""
+        packets, drops, _ = TPACKET_STATS_V3.unpack(
+            self._nic.getsockopt(SOL_PACKET, PACKET_STATISTICS, TPACKET_STATS_V3.size))
+        return packets, drops
+
+    def attach_filter(self, program: bytes) -> None:
+        """Keep in the kernel every frame rejected by `program`, see `socket_filter.compile_filter`."""
+        attach_filter(self._nic, program)
+
+    def fileno(self) -> int:
+        return self._nic.fileno()
+
+    def close(self) -> None:
+        """Close the socket and unmap the ring, or leave it to the garbage collector
+        while any `ReceivedFrame` is still referenced."""
+        self._nic.close()
+        try:
+            self._view.release()
+            self._ring.close()
+        except BufferError:
+            pass
+
+    def _wait(self, timeout: Optional[float]) -> bool:
+        # whether the current block was handed over by the kernel within `timeout`
+        offset = self._block * self._block_size + 8
+        if U32.unpack_from(self._view, offset)[0] & TP_STATUS_USER:
+            return True
+        self._poll.poll(None if timeout is None else timeout * 1000)
+        return bool(U32.unpack_from(self._view, offset)[0] & TP_STATUS_USER)
+
+    def _block_frames(self, block: int) -> Iterator[ReceivedFrame]:
+        # tpacket_block_desc: version, offset_to_priv, block_status, num_pkts, offset_to_first_pkt, ...
+        view = self._view
+        number = U32.unpack_from(view, block + 12)[0]
+        offset = block + U32.unpack_from(view, block + 16)[0]
+        for _ in range(number):
+            # tpacket3_hdr: tp_next_offset, tp_sec, tp_nsec, tp_snaplen, tp_len, tp_status, tp_mac, ... tp_vlan_tci
+            next_offset, seconds, nanoseconds, length = TPACKET3_HDR.unpack_from(view, offset)
+            status = U32.unpack_from(view, offset + 20)[0]
+            start = offset + U16.unpack_from(view, offset + 24)[0]
+            # the sockaddr_ll follows the aligned tpacket3_hdr, sll_pkttype at 10
+            if self._outgoing or view[offset + 58] != PACKET_OUTGOING:
+                data = view[start:start + length]
+                if is_goose(data):
+                    tci = U32.unpack_from(view, offset + 32)[0] if status & TP_STATUS_VLAN_VALID else None
+                    yield ReceivedFrame(data, tci, seconds * 1_000_000_000 + nanoseconds)
+            offset += next_offset
@@ -0,0 +1,81 @@
+from asyncio import AbstractEventLoop, Future, get_event_loop, Handle, sleep
+from typing import Dict, Optional
+
+from py61850.communication.transmitter import Transmitter
+from py61850.goose.publisher import Publisher
+
+
+class PublisherRunner:
+    """Drive many publishers from a single asyncio event loop, following their retransmission curves.
+
+    Each publisher has a single timer within the loop, when it fires the next GOOSE is
+    rendered into the transmitter queue, and the next timer is set to `next_goose_timer`.
+    Every GOOSE due within the same loop iteration is sent by a single flush.
+
+    After an event (e.g. `all_data` changed), call `notify` to send the new status right away,
+    then the publisher retransmits fast again (see `RetransmissionCurve`).
+
+    Args:
+        transmitter: Where the GOOSE are queued, e.g. `Transmitter` or `RingTransmitter`.
+        loop: The event loop, defaults to the current one.
+    """
+
+    def __init__(self, transmitter: Transmitter, loop: Optional[AbstractEventLoop] = None) -> None:
+        self._transmitter = transmitter
+        self._loop = get_event_loop() if loop is None else loop
+        self._handles: Dict[Publisher, Handle] = {}
+        self._flush_handle = None
+        self._stopped = None
+
+    def add(self, publisher: Publisher) -> None:
+        """Start publishing `publisher`, its first GOOSE is sent right away."""
+        if publisher in self._handles:
+            raise ValueError('publisher already added')
+        iter(publisher)
+        self._handles[publisher] = self._loop.call_soon(self._send, publisher)
+
+    def remove(self, publisher: Publisher) -> None:
+        """Stop publishing `publisher`."""
+        self._handles.pop(publisher).cancel()
+
+    def notify(self, publisher: Publisher) -> None:
+        """Send the next GOOSE of `publisher` right away, e.g. after an event."""
+        self._handles[publisher].cancel()
+        self._handles[publisher] = self._loop.call_soon(self._send, publisher)
+
+    async def run(self, duration: Optional[float] = None) -> None:
+        """Publish until `stop` is called, or for `duration` seconds."""
+        self._stopped = self._loop.create_future()
+        try:
+            if duration is None:
+                await self._stopped
+            else:
+                await sleep(duration)
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        """Stop every publisher, then send whatever is still queued."""
+        for handle in self._handles.values():
+            handle.cancel()
+        self._handles.clear()
+        self._flush()
+        stopped, self._stopped = self._stopped, None
+        if isinstance(stopped, Future) and not stopped.done():
+            stopped.set_result(None)
+
+    def _send(self, publisher: Publisher) -> None:
+        self._transmitter.queue_publisher(publisher)
+        self._handles[publisher] = self._loop.call_later(publisher.next_goose_timer, self._send, publisher)
+        if self._flush_handle is None:
+            self._flush_handle = self._loop.call_soon(self._flush)
+
+    def _flush(self) -> None:
+        self._flush_handle = None
+        if self._transmitter.queued:
+            self._transmitter.flush()
+
+    @property
+    def publishers(self) -> int:
+        """How many publishers are running."""
+        return len(self._handles)
@@ -0,0 +1,105 @@
+from time import perf_counter, sleep
+from typing import Callable, Dict, Optional
+
+from py61850.communication.pacing import Pacer, perf_counter_ns
+from py61850.communication.transmitter import Transmitter
+from py61850.goose.publisher import Publisher
+from py61850.utils.timing_wheel import TimingWheel
+
+
+class Scheduler:
+    """Own the retransmission deadlines of many publishers, within a single `TimingWheel`.
+
+    Adding, moving and expiring a deadline are O(1), whatever the number of publishers.
+    Every GOOSE due by the same `advance` is queued into the transmitter, then sent by a single flush.
+
+    Args:
+        transmitter: Where the GOOSE are queued, e.g. `Transmitter` or `RingTransmitter`.
+        resolution: The seconds of each tick.
+        slots: How many ticks a turn of the wheel has.
+        clock: Returns the current time, in seconds.
+        pacer: Waits between ticks within `run`, instead of `time.sleep`, for sub-millisecond accuracy
+            (along with a finer `resolution`).
+
+    Raises:
+        ValueError: If `resolution` or `slots` are out of the supported range.
+    """
+
+    def __init__(self, transmitter: Transmitter, resolution: float = 0.001, slots: int = 1024,
+                 clock: Callable[[], float] = perf_counter, pacer: Optional[Pacer] = None) -> None:
+        self._wheel = TimingWheel(clock(), resolution, slots)
+        self._transmitter = transmitter
+        self._clock = clock
+        self._pacer = pacer
+        self._due: Dict[Publisher, None] = {}  # the publishers due with the next `advance`, in order
+
+    def add(self, publisher: Publisher, delay: float = 0.0) -> None:
+        """Schedule the first GOOSE of `publisher` after `delay` seconds."""
+        if publisher in self._wheel or publisher in self._due:
+            raise ValueError('publisher already added')
+        iter(publisher)
+        deadline = self._clock() + delay
+        if self._wheel.to_tick(deadline) <= self._wheel.tick:
+            self._due[publisher] = None
+        else:
+            self._wheel.schedule(publisher, deadline)
+
+    def remove(self, publisher: Publisher) -> None:
+        """Stop publishing `publisher`."""
+        if publisher in self._due:
+            del self._due[publisher]
+        else:
+            self._wheel.cancel(publisher)
+
+    def notify(self, publisher: Publisher) -> None:
+        """Send the next GOOSE of `publisher` with the next `advance`, e.g. after an event."""
+        if publisher in self._wheel:
+            self._wheel.cancel(publisher)
+        self._due[publisher] = None
+
+    def advance(self, now: Optional[float] = None) -> int:
+        """Send every GOOSE due up to `now` (defaults to the clock), then return how many were sent."""
+        sent = 0
+        for time, publisher in self._wheel.expire(self._clock() if now is None else now):
+            self._send(publisher, time)
+            sent += 1
+        due, self._due = self._due, {}
+        for publisher in due:
+            self._send(publisher, self._wheel.time)
+            sent += 1
+        if sent:
+            self._transmitter.flush()
+        return sent
+
+    def run(self, duration: float) -> int:
+        """Keep advancing for `duration` seconds, sleeping between ticks, then return how many GOOSE were sent."""
+        end = self._clock() + duration
+        sent = 0
+        while self._clock() < end:
+            sent += self.advance()
+            self._wait(min(self._wheel.time + self._wheel.resolution, end))
+        return sent
+
+    def _wait(self, time: float) -> None:
+        remaining = time - self._clock()
+        if self._pacer is None:
+            sleep(max(0.0, remaining))
+        else:
+            self._pacer.wait(perf_counter_ns() + int(remaining * 1_000_000_000))
+
+    def _send(self, publisher: Publisher, time: float) -> None:
+        # the next deadline follows the tick, not the clock, so the intervals do not drift
+        self._transmitter.queue_publisher(publisher)
+        self._wheel.schedule(publisher, time + publisher.next_goose_timer)
+
+    @property
+    def publishers(self) -> int:
+        """How many publishers are scheduled."""
+        return len(self._wheel) + len(self._due)
+
+    @property
+    def next_deadline(self) -> Optional[float]:
+        """When the earliest GOOSE is due, `None` if nothing is scheduled."""
+        if self._due:
+            return self._wheel.time
+        return self._wheel.next_deadline
@@ -0,0 +1,208 @@
+"""Classic BPF socket filters, keeping in the kernel the GOOSE frames nobody subscribed to."""
+from ctypes import addressof, create_string_buffer
+from socket import socket, SOL_SOCKET
+from struct import Struct
+from typing import Iterable, List, Optional, Tuple, Union
+
+from py61850.communication.packet import PACKET_OUTGOING, SO_ATTACH_FILTER, SO_DETACH_FILTER
+from py61850.goose.ethernet import Ethernet
+from py61850.goose.pdu import GooseControlBlockReference
+from py61850.utils.codec import UINT16, UINT32
+from py61850.utils.errors import raise_type
+from py61850.utils.tags import GOOSE_ETHER_TYPE, VIRTUAL_LAN_ETHER_TYPE
+
+# instruction classes, sizes and modes, see linux/filter.h
+LD_IMM = 0x00
+LD_W_ABS = 0x20
+LD_H_ABS = 0x28
+LD_W_IND = 0x40
+LD_H_IND = 0x48
+LD_B_IND = 0x50
+LDX_IMM = 0x01
+ALU_ADD_X = 0x0C
+MISC_TAX = 0x07
+JMP_JA = 0x05
+JMP_JEQ_K = 0x15
+JMP_JGE_K = 0x35
+RET_K = 0x06
+
+SKF_AD_PKTTYPE = 0xFFFFF000 + 4  # SKF_AD_OFF + 4
+SKF_AD_VLAN_TAG_PRESENT = 0xFFFFF000 + 48
+BPF_MAXINSNS = 4096
+SNAP_LENGTH = 0x40000  # the whole frame
+
+SOCK_FILTER = Struct('=HBBI')  # code, jt, jf, k
+SOCK_FPROG = Struct('@HP')  # len, filter
+
+GOOSE, VIRTUAL_LAN = UINT16.unpack(GOOSE_ETHER_TYPE)[0], UINT16.unpack(VIRTUAL_LAN_ETHER_TYPE)[0]
+
+# the layouts emitted by `Publisher`, i.e. the offsets of the ether type, the APPID and the PDU
+TAGGED = (16, 18, 26)
+UNTAGGED = (12, 14, 22)
+
+Label = Union[int, str]
+
+
+def compile_filter(app_ids: Optional[Iterable[int]] = None,
+                   destinations: Optional[Iterable[Union[bytes, int, str]]] = None,
+                   virtual_lan: Optional[bool] = None, outgoing: bool = False,
+                   goose_control_block_references: Optional[Iterable[str]] = None) -> bytes:
+    """Compile the subscription criteria into a classic BPF program, accepting GOOSE frames only.
+
+    Both the 802.1Q tagged and untagged layouts are handled, including tags already
+    stripped by the kernel (e.g. by the receive path), which are checked through
+    the `vlan_tag_present` ancillary data.
+
+    Args:
+        app_ids: The accepted APPIDs, any if `None`.
+        destinations: The accepted destination addresses, any if `None`.
+            Each one must be a GOOSE multicast address, see `Ethernet.assert_destination`.
+        virtual_lan: Whether to only accept tagged frames, untagged frames, or `None` for both.
+        outgoing: Also accept the frames sent from this host.
+        goose_control_block_references: The accepted gocbRef, any if `None`.
+
+    Returns:
+        The packed `sock_filter` instructions, see `attach_filter`.
+
+    Raises:
+        TypeError: If any criteria is not of its type.
+        ValueError: If any criteria is out of the supported range, or if the program is too long.
+    """
+    assembler = _Assembler()
+    if not outgoing:
+        assembler.jump_if(LD_W_ABS, SKF_AD_PKTTYPE, PACKET_OUTGOING, 'reject')
+    assembler.jump_if(LD_H_ABS, 12, VIRTUAL_LAN, 'tagged')
+    _compile_layout(assembler, UNTAGGED, virtual_lan)
+    assembler.jump('app_id')
+    assembler.label('tagged')
+    if virtual_lan is False:
+        assembler.jump('reject')
+    _compile_layout(assembler, TAGGED, None)
+    assembler.label('app_id')
+    if app_ids is not None:
+        for app_id in app_ids:
+            if not isinstance(app_id, int):
+                raise_type('app_id', int, type(app_id))
+            if not 0 <= app_id <= 0xFFFF:
+                raise ValueError('app_id out of supported range')
+            assembler.jump_if(None, None, app_id, 'destination')
+        assembler.jump('reject')
+    assembler.label('destination')
+    if destinations is not None:
+        for destination in destinations:
+            raw_destination = Ethernet.pack_mac_address(destination)
+            Ethernet.assert_destination(raw_destination)
+            high, low = UINT16.unpack(raw_destination[:2])[0], UINT32.unpack(raw_destination[2:])[0]
+            # ldh [0]; jeq #high, 0, 3; ld [2]; jeq #low, 0, 1; ja accept
+            assembler.append(LD_H_ABS, 0, 0, 0)
+            assembler.append(JMP_JEQ_K, 0, 3, high)
+            assembler.append(LD_W_ABS, 0, 0, 2)
+            assembler.append(JMP_JEQ_K, 0, 1, low)
+            assembler.jump('reference')
+        assembler.jump('reject')
+    assembler.label('reference')
+    if goose_control_block_references is not None:
+        _compile_references(assembler, goose_control_block_references)
+    assembler.label('accept')
+    assembler.append(RET_K, 0, 0, SNAP_LENGTH)
+    assembler.label('reject')
+    assembler.append(RET_K, 0, 0, 0)
+    return assembler.assemble()
+
+
+def _compile_layout(assembler: '_Assembler', layout: Tuple[int, int], virtual_lan: Optional[bool]) -> None:
+    # reject anything but GOOSE, then check the stripped tag, then load the PDU offset (into X) and the APPID
+    ether_type, app_id, pdu = layout
+    assembler.append(LD_H_ABS, 0, 0, ether_type)
+    assembler.append(JMP_JEQ_K, 1, 0, GOOSE)
+    assembler.jump('reject')
+    if virtual_lan is not None:
+        assembler.append(LD_W_ABS, 0, 0, SKF_AD_VLAN_TAG_PRESENT)
+        assembler.append(JMP_JEQ_K, 1, 0, 1 if virtual_lan else 0)
+        assembler.jump('reject')
+    assembler.append(LDX_IMM, 0, 0, pdu)
+    assembler.append(LD_H_ABS, 0, 0, app_id)
+
+
+def _compile_references(assembler: '_Assembler', references: Iterable[str]) -> None:
+    # move X past the PDU tag and length, i.e. onto the gocbRef, whichever the form of the length
+    # ldb [x+1]; jge #0x80, 0, 7; jeq #0x81, 2, 0; jeq #0x82, 3, 0; ja reject
+    # ld #3; ja 3; ld #4; ja 1; ld #2; add x; tax
+    assembler.append(LD_B_IND, 0, 0, 1)
+    assembler.append(JMP_JGE_K, 0, 7, 0x80)
+    assembler.append(JMP_JEQ_K, 2, 0, 0x81)
+    assembler.append(JMP_JEQ_K, 3, 0, 0x82)
+    assembler.jump('reject')
+    for header_length, skip in ((3, 3), (4, 1), (2, None)):
+        assembler.append(LD_IMM, 0, 0, header_length)
+        if skip is not None:
+            assembler.append(JMP_JA, 0, 0, skip)
+    assembler.append(ALU_ADD_X, 0, 0, 0)
+    assembler.append(MISC_TAX, 0, 0, 0)
+    # then compare the whole gocbRef (tag, length and value) against each one, a word at a time
+    for reference in references:
+        if not isinstance(reference, str):
+            raise_type('goose_control_block_reference', str, type(reference))
+        raw_reference = bytes(GooseControlBlockReference(reference))
+        loads = []
+        offset = 0
+        for code, size in ((LD_W_IND, 4), (LD_H_IND, 2), (LD_B_IND, 1)):
+            while len(raw_reference) - offset >= size:
+                loads.append((code, offset, int.from_bytes(raw_reference[offset:offset + size], 'big')))
+                offset += size
+        # on mismatch, skip the remaining loads and comparisons, and the final `ja accept`
+        for index, (code, offset, k) in enumerate(loads):
+            assembler.append(code, 0, 0, offset)
+            assembler.append(JMP_JEQ_K, 0, 2 * (len(loads) - index - 1) + 1, k)
+        assembler.jump('accept')
+    assembler.jump('reject')
+
+
+class _Assembler:
+    # instructions with forward labels, conditional jumps are kept short, `ja` reaches the far ones
+
+    def __init__(self) -> None:
+        self._instructions: List[Tuple[int, int, int, Label]] = []
+        self._labels = {}
+
+    def append(self, code: int, jt: int, jf: int, k: int) -> None:
+        self._instructions.append((code, jt, jf, k))
+
+    def jump(self, label: str) -> None:
+        self._instructions.append((JMP_JA, 0, 0, label))
+
+    def jump_if(self, code: Optional[int], offset: Optional[int], k: int, label: str) -> None:
+        # load from `offset` (unless `code` is `None`), then jump to `label` if it equals `k`
+        if code is not None:
+            self.append(code, 0, 0, offset)
+        self.append(JMP_JEQ_K, 0, 1, k)
+        self.jump(label)
+
+    def label(self, name: str) -> None:
+        self._labels[name] = len(self._instructions)
+
+    def assemble(self) -> bytes:
+        if len(self._instructions) > BPF_MAXINSNS:
+            raise ValueError('filter out of supported length')
+        program = []
+        for index, (code, jt, jf, k) in enumerate(self._instructions):
+            if isinstance(k, str):
+                k = self._labels[k] - index - 1
+            program.append(SOCK_FILTER.pack(code, jt, jf, k))
+        return b''.join(program)
+
+
+def attach_filter(nic: socket, program: bytes) -> None:
+    """Attach `program` (see `compile_filter`) to `nic`, replacing any previous one."""
+    if not isinstance(program, bytes):
+        raise_type('program', bytes, type(program))
+    if not program or len(program) % SOCK_FILTER.size:
+        raise ValueError('program out of supported length')
+    instructions = create_string_buffer(program, len(program))
+    program_size = len(program) // SOCK_FILTER.size
+    nic.setsockopt(SOL_SOCKET, SO_ATTACH_FILTER, SOCK_FPROG.pack(program_size, addressof(instructions)))
+
+
+def detach_filter(nic: socket) -> None:
+    """Detach the filter attached to `nic`."""
+    nic.setsockopt(SOL_SOCKET, SO_DETACH_FILTER, 0)
@@ -0,0 +1,353 @@
+from ctypes import addressof, c_int, c_size_t, c_uint, c_uint32, c_void_p, CDLL, get_errno, pointer, POINTER
+from ctypes import sizeof, Structure
+from ctypes.util import find_library
+from mmap import MAP_SHARED, mmap, PAGESIZE, PROT_READ, PROT_WRITE
+from os import strerror
+from socket import AF_PACKET, socket, SOCK_RAW
+from time import perf_counter
+from typing import Iterable, NamedTuple, Tuple, Union
+
+from py61850.communication.packet import packet_align, PACKET_QDISC_BYPASS, PACKET_TX_RING, PACKET_VERSION
+from py61850.communication.packet import SOL_PACKET, TP_STATUS_AVAILABLE, TP_STATUS_SEND_REQUEST
+from py61850.communication.packet import TP_STATUS_WRONG_FORMAT, TPACKET2_DATA_OFFSET, TPACKET_REQ, TPACKET_V2, U32
+from py61850.goose.publisher import Publisher
+from py61850.utils.errors import raise_type
+
+# Ethernet frame, including the 802.1Q tag, excluding the frame check sequence
+MAX_FRAME_SIZE = 1518
+
+
+class IoVec(Structure):
+    _fields_ = [('iov_base', c_void_p), ('iov_len', c_size_t)]
+
+
+class MsgHdr(Structure):
+    _fields_ = [('msg_name', c_void_p), ('msg_namelen', c_uint32), ('msg_iov', POINTER(IoVec)),
+                ('msg_iovlen', c_size_t), ('msg_control', c_void_p), ('msg_controllen', c_size_t), ('msg_flags', c_int)]
+
+
+class MMsgHdr(Structure):
+    _fields_ = [('msg_hdr', MsgHdr), ('msg_len', c_uint)]
+
+
+def _sendmmsg():
+    # `sendmmsg` from the C library, `None` if not available (e.g. not Linux)
+    try:
+        function = CDLL(find_library('c'), use_errno=True).sendmmsg
+    except (AttributeError, OSError):  # pragma: no cover
+        return None
+    function.argtypes = (c_int, c_void_p, c_uint, c_int)
+    function.restype = c_int
+    return function
+
+
+SENDMMSG = _sendmmsg()
+
+
+class BatchStats(NamedTuple):
+    """What a single flush sent."""
+    frames: int
+    size: int  # in bytes
+    system_calls: int
+    seconds: float
+
+
+class Transmitter:
+    """Send GOOSE frames through a raw socket, many frames per system call.
+
+    Frames are queued back to back into a preallocated buffer, then sent by `flush`
+    with `sendmmsg`, thus system calls are proportional to batches, not to frames.
+    When `sendmmsg` is not available, each frame is sent by its own `sendmsg`.
+
+    Args:
+        interface: The network interface to bind an `AF_PACKET` socket to, or an already bound socket.
+        batch_size: How many frames are sent per system call, the queue is flushed when full.
+        frame_size: The greatest length of a queued frame.
+
+    Raises:
+        TypeError: If `interface` is neither `str` nor `socket`.
+        ValueError: If `batch_size` or `frame_size` is out of the supported range.
+    """
+
+    def __init__(self, interface: Union[str, socket], batch_size: int = 64, frame_size: int = MAX_FRAME_SIZE) -> None:
+        if isinstance(interface, str):
+            nic = socket(AF_PACKET, SOCK_RAW)
+            nic.bind((interface, 0))
+        elif isinstance(interface, socket):
+            nic = interface
+        else:
+            raise_type('interface', (str, socket), type(interface))
+        if not 0 < batch_size <= 1024:
+            raise ValueError('batch_size out of supported range')
+        if not 0 < frame_size <= 0xFFFF:
+            raise ValueError('frame_size out of supported range')
+        self._nic = nic
+        self._batch_size = batch_size
+        self._frame_size = frame_size
+        self._queued = 0
+        self._queued_size = 0
+        self._frames = 0
+        self._system_calls = 0
+        try:
+            self._allocate()
+        except BaseException:
+            if nic is not interface:
+                nic.close()
+            raise
+
+    def _allocate(self) -> None:
+        # one slot of `frame_size` per queued frame, each one pointed to by its message
+        batch_size, frame_size = self._batch_size, self._frame_size
+        self._buffer = bytearray(batch_size * frame_size)
+        self._view = memoryview(self._buffer)
+        self._iov = (IoVec * batch_size)()
+        self._messages = (MMsgHdr * batch_size)()
+        base = addressof(c_void_p.from_buffer(self._buffer))
+        for index in range(batch_size):
+            self._iov[index].iov_base = base + index * frame_size
+            self._messages[index].msg_hdr.msg_iov = pointer(self._iov[index])
+            self._messages[index].msg_hdr.msg_iovlen = 1
+
+    def __enter__(self) -> 'Transmitter':
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def queue(self, frame: Union[bytes, bytearray, memoryview]) -> Tuple[BatchStats, ...]:
+        """Copy `frame` into the queue.
+
+        Returns:
+            The stats of the batch flushed to make room for `frame`, if any.
+
+        Raises:
+            ValueError: If `frame` is longer than `frame_size`.
+        """
+        if len(frame) > self._frame_size:
+            raise ValueError('frame out of supported length')
+        flushed = self._make_room()
+        self._slot(self._queued)[:len(frame)] = frame
+        self._commit(len(frame))
+        return flushed
+
+    def queue_publisher(self, publisher: Publisher, number: int = 1) -> Tuple[BatchStats, ...]:
+        """Render the next `number` retransmissions of `publisher` straight into the queue.
+
+        Returns:
+            The stats of each batch flushed to make room for the frames, if any.
+        """
+        flushed = ()
+        for _ in range(number):
+            flushed += self._make_room()
+            (_, length), = publisher.render_batch(1, self._slot(self._queued))
+            self._commit(length)
+        return flushed
+
+    def burst(self, publishers: Iterable[Publisher], number: int = 1) -> Tuple[BatchStats, ...]:
+        """Queue the next `number` retransmissions of every publisher, then flush.
+
+        Returns:
+            The stats of each batch sent.
+        """
+        flushed = ()
+        for publisher in publishers:
+            flushed += self.queue_publisher(publisher, number)
+        return flushed + (self.flush(),)
+
+    def flush(self) -> BatchStats:
+        """Send every queued frame.
+
+        Raises:
+            OSError: If the socket fails to send.
+        """
+        start = perf_counter()
+        frames, size, system_calls = self._queued, self._queued_size, 0
+        sent = 0
+        try:
+            while sent < frames:
+                sent += self._send(sent, frames)
+                system_calls += 1
+        finally:
+            self._queued = 0
+            self._queued_size = 0
+            self._frames += sent
+            self._system_calls += system_calls
+        return BatchStats(frames, size, system_calls, perf_counter() - start)
+
+    def close(self) -> None:
+        """Flush the queue, then close the socket."""
+        try:
+            if self._queued:
+                self.flush()
+        finally:
+            self._nic.close()
+
+    def _slot(self, index: int) -> memoryview:
+        # where the queued frame `index` is written
+        start = index * self._frame_size
+        return self._view[start:start + self._frame_size]
+
+    def _commit(self, length: int) -> None:
+        # queue the frame just written into the next slot
+        self._iov[self._queued].iov_len = length
+        self._queued += 1
+        self._queued_size += length
+
+    def _make_room(self) -> Tuple[BatchStats, ...]:
+        if self._queued == self._batch_size:
+            return self.flush(),
+        return ()
+
+    def _send(self, first: int, last: int) -> int:
+        # send the queued frames from `first` to `last`, return how many were sent
+        if SENDMMSG is None:  # pragma: no cover
+            start = first * self._frame_size
+            self._nic.sendmsg([self._view[start:start + self._iov[first].iov_len]])
+            return 1
+        sent = SENDMMSG(self._nic.fileno(), addressof(self._messages) + first * sizeof(MMsgHdr), last - first, 0)
+        if sent < 0:
+            errno = get_errno()
+            raise OSError(errno, strerror(errno))
+        return sent
+
+    @property
+    def queued(self) -> int:
+        """How many frames are waiting for `flush`."""
+        return self._queued
+
+    @property
+    def frames(self) -> int:
+        """How many frames were sent."""
+        return self._frames
+
+    @property
+    def system_calls(self) -> int:
+        """How many system calls were needed to send them."""
+        return self._system_calls
+
+    @property
+    def batch_size(self) -> int:
+        return self._batch_size
+
+    @property
+    def frame_size(self) -> int:
+        return self._frame_size
+
+
+class RingTransmitter(Transmitter):
+    """Send GOOSE frames through a memory mapped `PACKET_TX_RING`, see `Transmitter`.
+
+    Frames are written (or rendered) straight into the slots of the ring shared with
+    the kernel, then a single `send` asks the kernel to transmit every queued slot.
+    Thus nothing is copied between the user and the kernel space.
+
+    Note:
+        Through `lo`, local sockets receive the frames straight from the ring,
+        so they must read them before their slots are written again.
+
+    Args:
+        interface: The network interface to bind an `AF_PACKET` socket to, or an already bound one.
+        batch_size: How many frames are sent per system call, also how many slots the ring has (at least).
+        frame_size: The greatest length of a queued frame.
+        qdisc_bypass: Skip the traffic control layer of the kernel (`PACKET_QDISC_BYPASS`).
+
+    Raises:
+        Same as `Transmitter`.
+        OSError: If the ring cannot be set up, e.g. not permitted, or not an `AF_PACKET` socket.
+    """
+
+    def __init__(self, interface: Union[str, socket], batch_size: int = 64, frame_size: int = MAX_FRAME_SIZE,
+                 qdisc_bypass: bool = False) -> None:
+        self._qdisc_bypass = qdisc_bypass
+        super().__init__(interface, batch_size, frame_size)
+
+    def _allocate(self) -> None:
+        self._slot_size = packet_align(TPACKET2_DATA_OFFSET + self._frame_size)
+        block_size = packet_align(self._slot_size, PAGESIZE)
+        self._slots_per_block = block_size // self._slot_size
+        block_number = -(-self._batch_size // self._slots_per_block)
+        self._block_size = block_size
+        self._slot_number = block_number * self._slots_per_block
+        self._head = 0
+
+        nic = self._nic
+        nic.setsockopt(SOL_PACKET, PACKET_VERSION, TPACKET_V2)
+        if self._qdisc_bypass:
+            nic.setsockopt(SOL_PACKET, PACKET_QDISC_BYPASS, 1)
+        nic.setsockopt(SOL_PACKET, PACKET_TX_RING, TPACKET_REQ.pack(block_size, block_number,
+                                                                    self._slot_size, self._slot_number))
+        self._ring = mmap(nic.fileno(), block_size * block_number, MAP_SHARED, PROT_READ | PROT_WRITE)
+        self._view = memoryview(self._ring)
+
+    def close(self) -> None:
+        """Flush the queue, then unmap the ring and close the socket."""
+        try:
+            super().close()
+        finally:
+            self._view.release()
+            self._ring.close()
+
+    def _offset(self, index: int) -> int:
+        # where the ring slot of the queued frame `index` starts, slots never cross a block
+        position = (self._head + index) % self._slot_number
+        block, slot = divmod(position, self._slots_per_block)
+        return block * self._block_size + slot * self._slot_size
+
+    def _slot(self, index: int) -> memoryview:
+        offset = self._offset(index)
+        status = U32.unpack_from(self._view, offset)[0]
+        if status != TP_STATUS_AVAILABLE:
+            raise OSError(f'ring slot not available, status {status:#x}')
+        start = offset + TPACKET2_DATA_OFFSET
+        return self._view[start:start + self._frame_size]
+
+    def _commit(self, length: int) -> None:
+        offset = self._offset(self._queued)
+        U32.pack_into(self._view, offset + 4, length)  # tp_len
+        U32.pack_into(self._view, offset, TP_STATUS_SEND_REQUEST)
+        self._queued += 1
+        self._queued_size += length
+
+    def _send(self, first: int, last: int) -> int:
+        # a blocking send returns once the kernel transmitted every requested slot,
+        # or fails at the first one of a wrong format, leaving the ones after it requested
+        try:
+            self._nic.send(b'')
+        finally:
+            sent, wrong_format = self._release(first, last)
+            if wrong_format:  # reported instead of the error of the send, e.g. EINVAL
+                raise OSError(f'frames of wrong format, queued at {wrong_format}, the {last - first - sent} '
+                              f'frames from {first + sent} on were not sent')
+        if sent != last - first:
+            raise OSError(f'the {last - first - sent} frames from {first + sent} on were not sent')
+        return sent
+
+    def _release(self, first: int, last: int) -> Tuple[int, Tuple[int, ...]]:
+        # give the slots of a wrong format, and the ones never sent, back to the queue,
+        # then move the head where the kernel stopped, i.e. past the slots it sent (or is sending)
+        sent, wrong_format = None, []
+        for index in range(first, last):
+            offset = self._offset(index)
+            status = U32.unpack_from(self._view, offset)[0]
+            if sent is None and not status & (TP_STATUS_SEND_REQUEST | TP_STATUS_WRONG_FORMAT):
+                continue  # sent, or being sent
+            if sent is None:
+                sent = index - first  # where the kernel stopped
+            if status & TP_STATUS_WRONG_FORMAT:
+                wrong_format.append(index)
+            U32.pack_into(self._view, offset, TP_STATUS_AVAILABLE)
+        sent = last - first if sent is None else sent
+        self._head = (self._head + sent) % self._slot_number
+        return sent, tuple(wrong_format)
+
+    @property
+    def slot_number(self) -> int:
+        """How many slots the ring has."""
+        return self._slot_number
+
+
+def new_transmitter(interface: Union[str, socket], tx_ring: bool = False, **kwargs) -> Transmitter:
+    """Return a `RingTransmitter` if `tx_ring`, otherwise a `Transmitter`, both with the same interface."""
+    if tx_ring:
+        return RingTransmitter(interface, **kwargs)
+    return Transmitter(interface, **kwargs)
@@ -0,0 +1,161 @@
+"""Analyze whole GOOSE captures across many processes, e.g. python3 -m py61850.goose.analysis capture.pcap 4"""
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from os import cpu_count
+from sys import argv
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from py61850.goose.capture import Capture
+from py61850.goose.subscriber import expected_numbers, Stream, Subscriber
+
+CHUNKS_PER_WORKER = 4  # smaller chunks even out the load of the workers
+
+State = Tuple[int, int, int, bytes]  # stNum, sqNum, confRev and the encoded `AllData`
+Key = Tuple[int, str]  # APPID and gocbRef
+
+
+class StreamReport:
+    """What a capture holds of a single GOOSE stream.
+
+    Attributes:
+        app_id: The APPID of the frames.
+        control_block_reference: The gocbRef of the PDU.
+        frames: How many frames were received.
+        events: The time (in nanoseconds), the stNum and the decoded `AllData` of each state change,
+            in order, starting with the first frame.
+        gaps: How many times the stNum and sqNum were not the expected ones, see `Subscriber`.
+        revisions: How many times the confRev changed.
+        first: The state of the first frame.
+        last: The state of the last frame.
+    """
+
+    __slots__ = ('app_id', 'control_block_reference', 'frames', 'events', 'gaps', 'revisions', 'first', 'last')
+
+    def __init__(self, app_id: int, control_block_reference: str) -> None:
+        self.app_id = app_id
+        self.control_block_reference = control_block_reference
+        self.frames = 0
+        self.events: List[Tuple[int, int, Tuple[Any, ...]]] = []
+        self.gaps = 0
+        self.revisions = 0
+        self.first: Optional[State] = None
+        self.last: Optional[State] = None
+
+    def merge(self, following: 'StreamReport') -> None:
+        """Append the report of the same stream, from the part of the capture right after."""
+        events = following.events
+        if self.last is not None and following.first is not None:
+            status_number, sequence_number, revision, raw_all_data = self.last
+            if following.first[:2] != expected_numbers(status_number, sequence_number, following.first[0]):
+                self.gaps += 1
+            if following.first[2] != revision:
+                self.revisions += 1
+            elif following.first[3] == raw_all_data:
+                events = events[1:]  # the first frame did not change the state
+        self.frames += following.frames
+        self.events.extend(events)
+        self.gaps += following.gaps
+        self.revisions += following.revisions
+        self.first = self.first or following.first
+        self.last = following.last or self.last
+
+
+class Analysis(NamedTuple):
+    """The reports of every stream found in a capture."""
+    streams: Dict[Key, StreamReport]
+    frames: int  # GOOSE frames
+    malformed: int  # GOOSE frames which could not be decoded
+
+
+def analyze(path: str, workers: Optional[int] = None) -> Analysis:
+    """Analyze every GOOSE frame of the capture at `path`, split into chunks across `workers` processes.
+
+    Only the byte offsets of each chunk are handed over, each worker finds the first record of its chunk,
+    then decodes it with its own `Subscriber`, then the reports of consecutive chunks are merged,
+    in order, as if the whole capture was decoded by a single one.
+
+    Args:
+        path: The capture file, only pcap captures are split, see `Capture.split`.
+        workers: How many processes decode the chunks, defaults to the number of CPUs.
+            A single one decodes the whole capture within the calling process.
+    """
+    workers = workers or cpu_count() or 1
+    if workers == 1:
+        return _merge([analyze_range(path)])
+    with Capture(path) as capture:
+        ranges = capture.split(workers * CHUNKS_PER_WORKER)
+    with ProcessPoolExecutor(workers) as executor:
+        return _merge(executor.map(analyze_range, repeat(path), *zip(*ranges)))
+
+
+def analyze_range(path: str, start: Optional[int] = None, end: Optional[int] = None) -> Analysis:
+    """Analyze the GOOSE frames of the capture at `path`, between `start` and `end` (see `Capture.frames`)."""
+    collector = _Collector()
+    subscriber = Subscriber(collector.on_change, collector.on_gap, collector.on_revision)
+    malformed = 0
+    with Capture(path) as capture:
+        for frame in capture.frames(start=start, end=end):
+            collector.time_ns = frame.time_ns
+            try:
+                stream = subscriber.receive(frame.data)
+            except ValueError:
+                malformed += 1
+                continue
+            stream_report = collector.report(stream)
+            stream_report.frames += 1
+            if stream_report.first is None:
+                stream_report.first = _state(stream)
+    for stream, stream_report in collector.reports.items():
+        stream_report.last = _state(stream)
+    return Analysis({(stream.app_id, stream.control_block_reference): stream_report
+                     for stream, stream_report in collector.reports.items()},
+                    sum(stream_report.frames for stream_report in collector.reports.values()) + malformed, malformed)
+
+
+class _Collector:
+    # the report of each stream, filled by the callbacks of the subscriber
+
+    def __init__(self) -> None:
+        self.reports: Dict[Stream, StreamReport] = {}
+        self.time_ns = 0  # of the frame being received
+
+    def report(self, stream: Stream) -> StreamReport:
+        if stream not in self.reports:
+            self.reports[stream] = StreamReport(stream.app_id, stream.control_block_reference)
+        return self.reports[stream]
+
+    def on_change(self, stream: Stream) -> None:
+        self.report(stream).events.append((self.time_ns, stream.status_number, stream.all_data))
+
+    def on_gap(self, stream: Stream, *_) -> None:
+        self.report(stream).gaps += 1
+
+    def on_revision(self, stream: Stream, _) -> None:
+        self.report(stream).revisions += 1
+
+
+def _state(stream: Stream) -> State:
+    return stream.status_number, stream.sequence_number, stream.configuration_revision, stream.raw_all_data
+
+
+def _merge(analyses: Iterable[Analysis]) -> Analysis:
+    # merge the analyses of consecutive chunks, in order
+    streams: Dict[Key, StreamReport] = {}
+    frames, malformed = 0, 0
+    for analysis in analyses:
+        for key, stream_report in analysis.streams.items():
+            if key in streams:
+                streams[key].merge(stream_report)
+            else:
+                streams[key] = stream_report
+        frames += analysis.frames
+        malformed += analysis.malformed
+    return Analysis(streams, frames, malformed)
+
+
+if __name__ == '__main__':
+    result = analyze(argv[1], int(argv[2]) if len(argv) > 2 else None)
+    for (app_id, reference), stream_report in sorted(result.streams.items()):
+        print(f'{app_id:#06x} {reference}: {stream_report.frames} frames, {len(stream_report.events)} events, '
+              f'{stream_report.gaps} gaps, {stream_report.revisions} revisions')
+    print(f'{result.frames} frames, {result.malformed} malformed')
@@ -0,0 +1,250 @@
+"""Read GOOSE frames from pcap and pcapng captures, through a read only memory map."""
+import mmap
+from struct import Struct
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+from py61850.goose.frame import is_goose
+from py61850.utils.codec import UINT16
+from py61850.utils.tags import GOOSE_ETHER_TYPE, VIRTUAL_LAN_ETHER_TYPE
+
+LINKTYPE_ETHERNET = 1
+
+PCAP_MICROSECONDS = 0xA1B2C3D4
+PCAP_NANOSECONDS = 0xA1B23C4D
+PCAPNG_SECTION_HEADER = 0x0A0D0D0A
+PCAPNG_BYTE_ORDER = 0x1A2B3C4D
+PCAPNG_INTERFACE_DESCRIPTION = 0x00000001
+PCAPNG_SIMPLE_PACKET = 0x00000003
+PCAPNG_ENHANCED_PACKET = 0x00000006
+IF_TSRESOL = 9
+OPT_ENDOFOPT = 0
+# to find a record boundary: how many consecutive record headers must be plausible, their largest original length,
+# and how many seconds apart they may be
+RESYNC_RECORDS = 4
+RESYNC_LENGTH = 0x40000
+RESYNC_SECONDS = 86400
+
+# by byte order: the pcap record header (ts_sec, ts_frac, incl_len, orig_len), the pcapng block header
+# (block_type, block_total_length), the enhanced packet block (interface_id, ts_high, ts_low, captured_len),
+# the interface description block (linktype), its options (code, length) and the simple packet block (original_len)
+STRUCTS = {order: (Struct(order + 'IIII'), Struct(order + 'II'), Struct(order + 'IIII'), Struct(order + 'H'),
+                   Struct(order + 'HH'), Struct(order + 'I'))
+           for order in '<>'}
+U32_LITTLE, U32_BIG = Struct('<I'), Struct('>I')
+GOOSE, VIRTUAL_LAN = UINT16.unpack(GOOSE_ETHER_TYPE)[0], UINT16.unpack(VIRTUAL_LAN_ETHER_TYPE)[0]
+
+
+class CapturedFrame(NamedTuple):
+    """A frame within the memory map, valid until the capture is closed."""
+    time_ns: int  # when it was captured, in nanoseconds since the epoch (0 if not recorded)
+    data: memoryview  # the frame, starting at the destination address, including any 802.1Q tag
+
+
+class Capture:
+    """A pcap or pcapng capture, memory mapped read only, so even multi-gigabyte files are read in constant memory.
+
+    Frames are handed over lazily as `memoryview` over the map, nothing is copied.
+    Only Ethernet interfaces are read, the frames of any other link type are skipped.
+
+    Args:
+        path: The capture file.
+
+    Raises:
+        ValueError: If the file is neither a pcap nor a pcapng capture (or an Ethernet one, for pcap).
+        OSError: If the file cannot be read.
+    """
+
+    def __init__(self, path: str) -> None:
+        with open(path, 'rb') as file:
+            try:
+                self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise ValueError('capture out of supported length')
+        if hasattr(self._map, 'madvise'):
+            self._map.madvise(mmap.MADV_SEQUENTIAL)
+        self._view = memoryview(self._map)
+        try:
+            self._order, self._scale = self._detect()
+        except ValueError:
+            self.close()
+            raise
+
+    def __enter__(self) -> 'Capture':
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[CapturedFrame]:
+        return self.frames()
+
+    def frames(self, goose_only: bool = True, start: Optional[int] = None,
+               end: Optional[int] = None) -> Iterator[CapturedFrame]:
+        """Yield every frame, in order, or only GOOSE frames (tagged or not).
+
+        A truncated last record (e.g. a capture still being written) ends the iteration.
+
+        Args:
+            goose_only: Whether to skip the frames whose ether type is not GOOSE.
+            start: From where to look for the first record, defaults to the first one of the capture.
+            end: Where the first record not to be read may start, defaults to the end of the capture.
+                Both are byte offsets, not necessarily record aligned (see `split`), thus the ranges
+                `[a, b)` and `[b, c)` read every record once between them.
+        """
+        size = len(self._view)
+        if self._order is None:
+            if (start or 0) != 0 or (end or size) != size:
+                raise ValueError('pcapng only supports the whole capture')
+            return self._pcapng_frames(goose_only)
+        start = 24 if start is None or start <= 24 else self._resync(start)
+        return self._pcap_frames(goose_only, start, size if end is None else min(end, size))
+
+    def split(self, number: int) -> Tuple[Tuple[int, int], ...]:
+        """Split the records into `number` ranges of the same size, e.g. to be read in parallel.
+
+        Nothing is read, the ranges are byte offsets: whoever reads a range finds its first record,
+        see `frames`. A pcapng capture is never split, as each block depends on its section.
+
+        Returns:
+            The start and end offsets of each range, see `frames`.
+
+        Raises:
+            ValueError: If `number` is out of the supported range.
+        """
+        if number < 1:
+            raise ValueError('number out of supported range')
+        size = len(self._view)
+        if self._order is None:
+            return ((0, size),)
+        offsets = [24 + (size - 24) * index // number for index in range(number + 1)]
+        return tuple(zip(offsets, offsets[1:]))
+
+    def close(self) -> None:
+        """Unmap the capture, or leave it to the garbage collector while any `CapturedFrame` is still referenced."""
+        try:
+            self._view.release()
+            self._map.close()
+        except BufferError:
+            pass
+
+    def _detect(self) -> Tuple[Optional[str], int]:
+        # the byte order of a pcap capture and the nanoseconds of its time stamps unit, `None` for pcapng
+        if len(self._view) < 24:
+            raise ValueError('capture out of supported length')
+        magic = U32_LITTLE.unpack_from(self._view)[0]
+        if magic == PCAPNG_SECTION_HEADER:
+            return None, 0
+        for order, unpack in (('<', U32_LITTLE), ('>', U32_BIG)):
+            magic = unpack.unpack_from(self._view)[0]
+            if magic in (PCAP_MICROSECONDS, PCAP_NANOSECONDS):
+                if unpack.unpack_from(self._view, 20)[0] & 0x0FFFFFFF != LINKTYPE_ETHERNET:
+                    raise ValueError('link type out of supported range')
+                return order, 1 if magic == PCAP_NANOSECONDS else 1000
+        raise ValueError('capture format not supported')
+
+    def _resync(self, offset: int) -> int:
+        # the first record boundary from `offset`, where a few consecutive record headers are plausible,
+        # or which are followed by the end of the capture
+        # NOTE within the last few records of a truncated capture, no boundary is found
+        view, record, size = self._view, STRUCTS[self._order][0], len(self._view)
+        snap_length = STRUCTS[self._order][5].unpack_from(view, 16)[0] or RESYNC_LENGTH
+        second = 1_000_000_000 // self._scale
+        while offset + 16 <= size:
+            position, previous = offset, None
+            for _ in range(RESYNC_RECORDS):
+                if position == size:
+                    return offset
+                if position + 16 > size:
+                    break
+                seconds, fraction, length, original_length = record.unpack_from(view, position)
+                position += 16 + length
+                if fraction >= second or not 14 <= length <= min(snap_length, original_length) or \
+                        original_length > RESYNC_LENGTH or position > size or \
+                        (previous is not None and abs(seconds - previous) > RESYNC_SECONDS):
+                    break
+                previous = seconds
+            else:
+                return offset
+            offset += 1
+        return size
+
+    def _pcap_frames(self, goose_only: bool, offset: int, end: int) -> Iterator[CapturedFrame]:
+        # the records starting before `end`
+        view, record, scale, size = self._view, STRUCTS[self._order][0], self._scale, len(self._view)
+        while offset < end and offset + 16 <= size:
+            seconds, fraction, length, _ = record.unpack_from(view, offset)
+            start = offset + 16
+            offset = start + length
+            if offset > size:
+                return
+            # NOTE the ether type is checked straight within the map, before any frame is built
+            if not goose_only or _is_goose(view, start, length):
+                yield CapturedFrame(seconds * 1_000_000_000 + fraction * scale, view[start:offset])
+
+    def _pcapng_frames(self, goose_only: bool) -> Iterator[CapturedFrame]:
+        view = self._view
+        offset, size = 0, len(view)
+        order, interfaces = '<', []
+        while offset + 12 <= size:
+            block = STRUCTS[order][1]
+            block_type = block.unpack_from(view, offset)[0]
+            if block_type == PCAPNG_SECTION_HEADER:
+                # both the byte order and the interfaces are per section
+                order = '<' if U32_LITTLE.unpack_from(view, offset + 8)[0] == PCAPNG_BYTE_ORDER else '>'
+                block, interfaces = STRUCTS[order][1], []
+            length = block.unpack_from(view, offset)[1]
+            if length < 12 or offset + length > size:
+                return
+            body = view[offset + 8:offset + length - 4]
+            offset += length
+            if block_type == PCAPNG_INTERFACE_DESCRIPTION:
+                interfaces.append(_interface(body, order))
+            elif block_type in (PCAPNG_ENHANCED_PACKET, PCAPNG_SIMPLE_PACKET):
+                frame = _packet(block_type, body, order, interfaces)
+                if frame is not None and (not goose_only or is_goose(frame.data)):
+                    yield frame
+
+
+def _is_goose(view: memoryview, start: int, length: int) -> bool:
+    # see `frame.is_goose`, without slicing the frame out of `view`
+    if length < 18:
+        return False
+    ether_type = UINT16.unpack_from(view, start + 12)[0]
+    if ether_type == VIRTUAL_LAN:
+        ether_type = UINT16.unpack_from(view, start + 16)[0]
+    return ether_type == GOOSE
+
+
+def _interface(body: memoryview, order: str) -> Optional[Tuple[int, int]]:
+    # how to turn the time stamps of an Ethernet interface into nanoseconds (multiplier, divisor), else `None`
+    if STRUCTS[order][3].unpack_from(body)[0] != LINKTYPE_ETHERNET:
+        return None
+    resolution, offset = 6, 8  # microseconds by default
+    while offset + 4 <= len(body):
+        code, length = STRUCTS[order][4].unpack_from(body, offset)
+        if code == OPT_ENDOFOPT:
+            break
+        if code == IF_TSRESOL and length:
+            resolution = body[offset + 4]
+        offset += 4 + (length + 3) // 4 * 4
+    if resolution & 0x80:  # a negative power of 2
+        return 1_000_000_000, 1 << (resolution & 0x7F)
+    if resolution <= 9:
+        return 10 ** (9 - resolution), 1
+    return 1, 10 ** (resolution - 9)
+
+
+def _packet(block_type: int, body: memoryview, order: str,
+            interfaces: List[Optional[Tuple[int, int]]]) -> Optional[CapturedFrame]:
+    # the frame of an enhanced (or simple) packet block, `None` if not captured from an Ethernet interface
+    if block_type == PCAPNG_SIMPLE_PACKET:
+        if not interfaces or interfaces[0] is None:
+            return None
+        # no time stamp, nor captured length, only the original length before the (padded) data
+        length = min(STRUCTS[order][5].unpack_from(body)[0], len(body) - 4)
+        return CapturedFrame(0, body[4:4 + length])
+    interface, high, low, length = STRUCTS[order][2].unpack_from(body)
+    if interface >= len(interfaces) or interfaces[interface] is None:
+        return None
+    multiplier, divisor = interfaces[interface]
+    return CapturedFrame(((high << 32) + low) * multiplier // divisor, body[20:20 + length])
@@ -0,0 +1,284 @@
+"""Decode many GOOSE frames into NumPy columns, and encode `AllData` from them, without building any `Base`.
+
+NumPy is only needed by this module, which is not imported by the rest of the package.
+"""
+from typing import Any, Callable, Dict, Iterable, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy
+
+from py61850.goose.capture import CapturedFrame
+from py61850.goose.frame import Frame
+from py61850.goose.pdu import AllData
+from py61850.goose.subscriber import ALL_DATA, REFERENCE, REVISION, SEQUENCE, STATUS, TIME_ALLOWED_TO_LIVE
+from py61850.types import Boolean
+from py61850.types.base import Base
+from py61850.types.floating_point import DoublePrecision, FloatingPoint, SinglePrecision
+from py61850.types.integer import Signed, Unsigned
+from py61850.utils.codec import UINT64
+from py61850.utils.errors import raise_type
+
+TIMESTAMP = 0x84  # Table 56, 61850-8-1
+BATCH_SIZE = 4096  # rows turned into an array at once
+MAX_REFERENCES = 0x10000  # distinct gocbRef, indexed by the '<u2' column
+
+# the columns of every row, little-endian
+HEADER = (('time_ns', '<i8'), ('app_id', '<u2'), ('reference', '<u2'), ('status_number', '<u4'),
+          ('sequence_number', '<u4'), ('time_allowed_to_live', '<u4'), ('seconds', '<u4'), ('fraction', '<u4'),
+          ('quality', 'u1'), ('configuration_revision', '<u4'))
+
+# the column type of each supported `AllData` member
+DATA_TYPES = {Boolean: '?', Signed: '<i8', Unsigned: '<u4', SinglePrecision: '<f4', DoublePrecision: '<f8'}
+
+Layout = Sequence[Tuple[str, type]]  # the name and type of each `AllData` member, e.g. (('stVal', Boolean),)
+Frames = Iterable[Union[bytes, bytearray, memoryview, CapturedFrame]]
+
+
+class Columns(NamedTuple):
+    """The decoded fields of many GOOSE frames, a row per frame, in order.
+
+    The `seconds`, `fraction` (in 1/2**24 of a second) and `quality` (the encoded byte, see `Quality`)
+    columns hold the `GooseTimestamp`, while `reference` indexes the gocbRef within `references`.
+    """
+    rows: numpy.ndarray  # structured, see `dtype`
+    references: Tuple[str, ...]  # gocbRef
+    malformed: int  # GOOSE frames which could not be decoded, or did not match the layout
+
+    @property
+    def columns(self) -> Dict[str, numpy.ndarray]:
+        """A view of each column, by name."""
+        return {name: self.rows[name] for name in self.rows.dtype.names}
+
+
+def dtype(layout: Layout = ()) -> numpy.dtype:
+    """The structured type of the rows, the header columns followed by a column per `AllData` member.
+
+    Raises:
+        TypeError: If a member type is not supported, see `DATA_TYPES`.
+        ValueError: If a name is taken twice.
+    """
+    fields = list(HEADER)
+    for name, data_type in layout:
+        if data_type not in DATA_TYPES:
+            raise_type('data_type', tuple(DATA_TYPES), data_type)
+        fields.append((name, DATA_TYPES[data_type]))
+    return numpy.dtype(fields)
+
+
+def decode_columns(frames: Frames, layout: Layout = (), batch_size: int = BATCH_SIZE) -> Columns:
+    """Decode the header fields of each frame, and the members of its `AllData`, into a row.
+
+    The rows are gathered as plain tuples, and turned into arrays `batch_size` rows at a time.
+    As most frames are retransmissions, `AllData` is only decoded when its encoding differs from the last one
+    of the same stream, see `Subscriber`. Frames which cannot be decoded, or whose fields overflow their column
+    (including any gocbRef past the first `MAX_REFERENCES`), are skipped, and counted as malformed.
+
+    Args:
+        frames: The whole frames, or the ones of a `Capture` (which also fills `time_ns`, 0 otherwise).
+        layout: The name and type of each `AllData` member, frames with other members are skipped.
+            Without a layout, `AllData` is not decoded at all.
+        batch_size: How many rows are turned into an array at once.
+
+    Raises:
+        Same as `dtype`.
+    """
+    row_type = dtype(layout)
+    decoder = _Decoder(tuple(data_type for _, data_type in layout))
+    batches, rows, malformed = [], [], 0
+    for frame in frames:
+        time_ns = 0
+        if isinstance(frame, CapturedFrame):
+            time_ns, frame = frame
+        try:
+            rows.append((time_ns,) + decoder.row(memoryview(frame)))
+        except ValueError:
+            malformed += 1
+            continue
+        if len(rows) == batch_size:
+            batches.append(numpy.array(rows, row_type))
+            rows = []
+    batches.append(numpy.array(rows, row_type))
+    return Columns(numpy.concatenate(batches), decoder.references(), malformed)
+
+
+class _Decoder:
+    # the row of a frame, but the capture time, caching the last `AllData` of each stream
+
+    def __init__(self, data_types: Tuple[type, ...]) -> None:
+        self._data_types = data_types
+        self._references: Dict[bytes, int] = {}
+        self._all_data: Dict[Tuple[int, int], Tuple[bytes, Tuple[Any, ...]]] = {}
+
+    def row(self, view: memoryview) -> Tuple[Any, ...]:
+        _, app_id, offset = Frame.unpack_header(view)
+        tag, offset, end = Base.unpack_tlv(view, offset)
+        if tag != 0x61:
+            raise ValueError('frame does not carry a GOOSE PDU')
+        spans = {}
+        while offset < end:
+            tag, start, offset = Base.unpack_tlv(view, offset)
+            spans[tag] = (start, offset)
+        try:
+            raw_reference = bytes(view[spans[REFERENCE][0]:spans[REFERENCE][1]])
+            start, stop = spans[TIMESTAMP]
+            if stop - start != 8:
+                raise ValueError('timestamp out of supported length')
+            timestamp = UINT64.unpack_from(view, start)[0]
+            row = (app_id, self._reference(raw_reference), _unsigned(view, spans[STATUS]),
+                   _unsigned(view, spans[SEQUENCE]), _unsigned(view, spans[TIME_ALLOWED_TO_LIVE]),
+                   timestamp >> 32, (timestamp >> 8) & 0xFFFFFF, timestamp & 0xFF, _unsigned(view, spans[REVISION]))
+            if not self._data_types:
+                return row
+            return row + self._decode_all_data((app_id, row[1]), view[spans[ALL_DATA][0]:spans[ALL_DATA][1]])
+        except KeyError:
+            raise ValueError('frame is missing a mandatory field')
+
+    def _reference(self, raw_reference: bytes) -> int:
+        if raw_reference not in self._references:
+            if len(self._references) == MAX_REFERENCES:
+                raise ValueError('reference out of supported range')
+            self._references[raw_reference] = len(self._references)
+        return self._references[raw_reference]
+
+    def _decode_all_data(self, stream: Tuple[int, int], raw_all_data: memoryview) -> Tuple[Any, ...]:
+        last = self._all_data.get(stream)
+        if last is not None and last[0] == raw_all_data:
+            return last[1]
+        raw_all_data = bytes(raw_all_data)
+        spans = Base.index_tlv(raw_all_data)
+        if len(spans) != len(self._data_types):
+            raise ValueError('all_data does not match the layout')
+        values = []
+        for (tag, start, end), data_type in zip(spans, self._data_types):
+            if AllData._data_type(tag, end - start) is not data_type:
+                raise ValueError('all_data does not match the layout')
+            values.append(data_type._decode_value(raw_all_data[start:end]))
+        self._all_data[stream] = raw_all_data, tuple(values)
+        return self._all_data[stream][1]
+
+    def references(self) -> Tuple[str, ...]:
+        return tuple(raw_reference.decode('utf8') for raw_reference in self._references)
+
+
+def _unsigned(view: memoryview, span: Tuple[int, int]) -> int:
+    # checked here, as the whole batch would overflow its '<u4' column
+    value = int.from_bytes(view[span[0]:span[1]], 'big')
+    if value > 0xFFFFFFFF:
+        raise ValueError('Unsigned integer out of supported range')
+    return value
+
+
+def encode_all_data(columns: Mapping[str, numpy.ndarray], layout: Layout) -> Tuple[bytes, ...]:
+    """Encode an `AllData` per row of `columns`, byte-identical to `bytes(AllData(...))` of the same members.
+
+    Each member is encoded for every row at once, as its tag and length fields followed by
+    the big-endian view of its column, then the valid bytes of each row are gathered in order.
+    Integers keep the shortest length of their type, thus rows may differ in length.
+
+    Args:
+        columns: A column per member, by name, e.g. a dict of arrays or a structured array (see `dtype`).
+        layout: The name and type of each `AllData` member.
+
+    Raises:
+        TypeError: If a member type is not supported (see `DATA_TYPES`), or a column is not of its kind.
+        ValueError: If a value, or an encoded `AllData`, is out of the supported range.
+    """
+    number = None
+    blocks, masks = [], []
+    for name, data_type in layout:
+        if data_type not in DATA_TYPES:
+            raise_type('data_type', tuple(DATA_TYPES), data_type)
+        column = numpy.asarray(columns[name])
+        if number is not None and len(column) != number:
+            raise ValueError(f'column {name} out of supported length')
+        number = len(column)
+        block, mask = _ENCODERS[data_type](column)
+        blocks.append(block)
+        masks.append(numpy.ones(block.shape, bool) if mask is None else mask)
+    if number is None:
+        return ()
+    lengths = sum(mask.sum(axis=1) for mask in masks)
+    prefix, prefix_mask = _all_data_prefix(lengths)
+    mask = numpy.hstack([prefix_mask] + masks)
+    data = numpy.hstack([prefix] + blocks)[mask].tobytes()
+    ends = numpy.cumsum(mask.sum(axis=1)).tolist()
+    return tuple(data[start:end] for start, end in zip([0] + ends[:-1], ends))
+
+
+def _all_data_prefix(lengths: numpy.ndarray) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    # the tag and the BER length fields of each `AllData`, see `Base.pack_length`
+    if lengths.size and lengths.max() > 0xFFFF:
+        raise ValueError(f'data length greater than {0xFFFF}')
+    prefix = numpy.zeros((len(lengths), 4), numpy.uint8)
+    prefix[:, 0] = AllData._RAW_TAG[0]
+    short, one = lengths <= 0xFF, (0x80 <= lengths) & (lengths <= 0xFF)
+    prefix[:, 1] = numpy.where(short & ~one, lengths, numpy.where(one, 0x81, 0x82))
+    prefix[:, 2] = numpy.where(one, lengths, lengths >> 8)
+    prefix[:, 3] = lengths & 0xFF
+    mask = numpy.ones(prefix.shape, bool)
+    mask[:, 2] = ~short | one
+    mask[:, 3] = ~short
+    return prefix, mask
+
+
+def _check_kind(column: numpy.ndarray, kinds: str, expected_type: type) -> None:
+    if column.ndim != 1 or column.dtype.kind not in kinds:
+        raise_type('column', expected_type, column.dtype.type)
+
+
+def _fixed(raw_tag: bytes, raw_length: int, column: numpy.ndarray, prefix: bytes = b'') -> numpy.ndarray:
+    # the tag and length fields, then a few more bytes, shared by every row
+    block = numpy.empty((len(column), 2 + raw_length), numpy.uint8)
+    block[:, :2 + len(prefix)] = numpy.frombuffer(raw_tag + bytes((raw_length,)) + prefix, numpy.uint8)
+    return block
+
+
+def _encode_boolean(column: numpy.ndarray) -> Tuple[numpy.ndarray, None]:
+    _check_kind(column, 'b', bool)
+    block = _fixed(Boolean._RAW_TAG, 1, column)
+    block[:, 2] = numpy.where(column, 0x0F, 0x00)
+    return block, None
+
+
+def _float_encoder(precision: Tuple[bytes, Any, int, str], big_endian: str) -> Callable:
+    exponent, _, length, _ = precision
+
+    def encode(column: numpy.ndarray) -> Tuple[numpy.ndarray, None]:
+        _check_kind(column, 'f', float)
+        block = _fixed(FloatingPoint._RAW_TAG, length, column, exponent)
+        block[:, 3:] = column.astype(big_endian).view(numpy.uint8).reshape(len(column), length - 1)
+        return block, None
+
+    return encode
+
+
+def _integer_encoder(raw_tag: bytes, lengths: Tuple[Tuple[int, int, int], ...], minimum: int, maximum: int,
+                     big_endian: str) -> Callable:
+    # lengths holds the (length, minimum, maximum) of each encoding, from the longest to the shortest one
+
+    def encode(column: numpy.ndarray) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        _check_kind(column, 'iu', int)
+        if column.size and (column.min() < minimum or column.max() > maximum):
+            raise ValueError('integer out of supported range')
+        width = numpy.full(len(column), 8, numpy.uint8)
+        for length, low, high in lengths:
+            width[(low <= column) & (column <= high)] = length
+        block = _fixed(raw_tag, 8, column)
+        block[:, 1] = width
+        block[:, 2:] = column.astype(big_endian).view(numpy.uint8).reshape(len(column), 8)
+        mask = numpy.ones(block.shape, bool)
+        mask[:, 2:] = numpy.arange(8) >= (8 - width)[:, None]
+        return block, mask
+
+    return encode
+
+
+# the tag, length and value fields of a member, for every row, and the valid bytes of each row (`None` if all)
+_ENCODERS: Dict[type, Callable[[numpy.ndarray], Tuple[numpy.ndarray, Optional[numpy.ndarray]]]] = {
+    Boolean: _encode_boolean,
+    SinglePrecision: _float_encoder(FloatingPoint._SINGLE, '>f4'),
+    DoublePrecision: _float_encoder(FloatingPoint._DOUBLE, '>f8'),
+    Signed: _integer_encoder(Signed._RAW_TAG, ((4, -0x80000000, 0x7FFFFFFF), (2, -0x8000, 0x7FFF), (1, -0x80, 0x7F)),
+                             -0x8000000000000000, 0x7FFFFFFFFFFFFFFF, '>i8'),
+    Unsigned: _integer_encoder(Unsigned._RAW_TAG, ((4, 0, 0xFFFFFFFF), (2, 0, 0xFFFF), (1, 0, 0xFF)),
+                               0, 0xFFFFFFFF, '>u8'),
+}
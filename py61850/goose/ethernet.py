@@ -1,4 +1,4 @@
-from struct import pack as s_pack, Struct
+from py61850.utils.codec import UINT8, UINT16, UINT64
 from py61850.utils.numbers import U48
 from py61850.utils.errors import raise_type
 
@@ -10,7 +10,7 @@ class Ethernet:
         # integer to ether type
         if isinstance(integer, int):
             if 0 <= integer <= max_range:
-                return s_pack('!H', integer)
+                return UINT16.pack(integer)
             raise ValueError('integer out of supported range')
         raise_type('integer', int, type(integer))
 
@@ -19,7 +19,7 @@ class Ethernet:
         # string to ether type
         if isinstance(string, str):
             if len(string) == 4:
-                return s_pack('!H', int(string, 16))
+                return UINT16.pack(int(string, 16))
             raise ValueError('string out of supported length')
         raise_type('string', str, type(string))
 
@@ -88,7 +88,7 @@ class Ethernet:
         # integer to mac
         if isinstance(integer, int):
             if 0 <= integer < U48:
-                return s_pack('!Q', integer)[2:]
+                return UINT64.pack(integer)[2:]
             raise ValueError('integer out of supported range')
         raise_type('integer', int, type(integer))
 
@@ -101,11 +101,7 @@ class Ethernet:
                 # TODO Improve this function, it should accept any type of 'splitter'
                 for splitter in [':', '-', ' ']:
                     if splitter in string:
-                        unsigned_char = Struct('!B')
-                        mac_address = b''
-                        for byte in string.split(splitter):
-                            mac_address += unsigned_char.pack(int(byte, 16))
-                        return mac_address
+                        return b''.join([UINT8.pack(int(byte, 16)) for byte in string.split(splitter)])
                 else:
                     # TODO Improve 'malformed' checking
                     raise ValueError('string seems to be malformed')
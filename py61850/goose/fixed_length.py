@@ -0,0 +1,137 @@
+from struct import Struct
+from typing import Any, List, NamedTuple, Optional, Tuple, Union
+
+from py61850.goose.frame import Frame
+from py61850.goose.pdu import AllData
+from py61850.goose.subscriber import ALL_DATA
+from py61850.types import Boolean, VisibleString
+from py61850.types.base import Base
+from py61850.types.bit_string import BitString
+from py61850.types.floating_point import DoublePrecision, SinglePrecision
+from py61850.types.integer import Signed, Unsigned
+from py61850.types.octet_string import OctetString
+from py61850.types.times import Timestamp
+
+# the name, struct format and length of the value field of each PDU field which changes between frames, by tag
+FIELDS = {0x81: ('time_allowed_to_live', 'I', 4), 0x84: ('goose_timestamp', '8s', 8), 0x85: ('status_number', 'I', 4),
+          0x86: ('sequence_number', 'I', 4), 0x87: ('test', '?', 1), 0x88: ('configuration_revision', 'I', 4),
+          0x89: ('needs_commissioning', '?', 1)}
+
+# the struct format of each `AllData` member type, by the length of its value field, and how many bytes
+# of the value field come before the value (e.g. the exponent of a floating point)
+MEMBERS = {Boolean: ({1: '?'}, 0), SinglePrecision: ({5: 'f'}, 1), DoublePrecision: ({9: 'd'}, 1),
+           Signed: ({4: 'i', 8: 'q'}, 0), Unsigned: ({4: 'I'}, 0)}
+
+# the `AllData` member types decoded as their encoded value field, by its length (`None` for any length),
+# the length of strings must not change from frame to frame
+RAW_MEMBERS = {BitString: None, OctetString: None, Timestamp: 8, VisibleString: None}
+
+
+class FixedLengthFields(NamedTuple):
+    """The fields of a fixed-length encoded GOOSE frame which may change between frames."""
+    time_allowed_to_live: int
+    goose_timestamp: bytes  # the encoded value field, see `GooseTimestamp`
+    status_number: int
+    sequence_number: int
+    test: bool
+    configuration_revision: int
+    needs_commissioning: bool
+    all_data: Tuple[Any, ...]  # the encoded value field of the members of `RAW_MEMBERS`
+
+
+class FixedLengthDecoder:
+    """Decode the frames of a GOOSE control block encoded with a fixed length (61850-8-1 Ed2).
+
+    As every byte offset is the same from frame to frame, the layout is learned from a first frame,
+    then the whole frame is decoded by a single `struct.unpack_from`, checking everything else
+    (e.g. the Ethernet header, gocbRef, the tag and length fields) did not change.
+
+    Args:
+        frame: A whole fixed-length encoded frame, see `Publisher(fixed_length=True)`.
+
+    Raises:
+        ValueError: If `frame` is not a fixed-length encoded GOOSE frame, or holds a member not supported
+            by the decoder (see `MEMBERS` and `RAW_MEMBERS`).
+    """
+
+    __slots__ = ('_struct', '_constants')
+
+    def __init__(self, frame: Union[bytes, bytearray, memoryview]) -> None:
+        view = memoryview(frame)
+        _, _, offset = Frame.unpack_header(view)
+        tag, start, end = Base.unpack_tlv(view, offset)
+        if tag != 0x61:
+            raise ValueError('frame does not carry a GOOSE PDU')
+        pieces: List[Tuple[bytes, Optional[str]]] = [(bytes(view[:start]), None)]  # constant bytes, then a value
+        names, offset = [], start
+        while offset < end:
+            tag, start, stop = Base.unpack_tlv(view, offset)
+            if tag == ALL_DATA:
+                pieces.append((bytes(view[offset:start]), None))
+                pieces.extend(self._members(view, start, stop))
+                names.append('all_data')
+            elif tag in FIELDS:
+                name, code, length = FIELDS[tag]
+                if stop - start != length:
+                    raise ValueError(f'{name} is not encoded with a fixed length')
+                pieces.append((bytes(view[offset:start]), code))
+                names.append(name)
+            else:
+                pieces.append((bytes(view[offset:stop]), None))
+            offset = stop
+        if tuple(names) != FixedLengthFields._fields:
+            raise ValueError('frame is missing a field')
+        self._compile(pieces)
+
+    @staticmethod
+    def _members(view: memoryview, start: int, end: int) -> List[Tuple[bytes, Optional[str]]]:
+        pieces = []
+        offset = start
+        while offset < end:
+            tag, value_start, stop = Base.unpack_tlv(view, offset)
+            length = stop - value_start
+            data_type = AllData._data_type(tag, length)
+            if data_type in RAW_MEMBERS and RAW_MEMBERS[data_type] in (None, length):
+                formats, prefix = {length: f'{length}s'}, 0
+            else:
+                formats, prefix = MEMBERS.get(data_type, ({}, 0))
+            if length not in formats:
+                raise ValueError(f'{data_type.__name__} is not supported with a fixed length')
+            data_type._decode_value(bytes(view[value_start:stop]))  # e.g. check the exponent
+            pieces.append((bytes(view[offset:value_start + prefix]), formats[length]))
+            offset = stop
+        return pieces
+
+    def _compile(self, pieces: List[Tuple[bytes, Optional[str]]]) -> None:
+        # merge the consecutive constant bytes, each run followed by a value, if any
+        codes, constants, constant = [], [], b''
+        for raw_bytes, code in pieces:
+            constant += raw_bytes
+            if code is not None:
+                codes.append(f'{len(constant)}s{code}')
+                constants.append(constant)
+                constant = b''
+        if constant:
+            codes.append(f'{len(constant)}s')
+            constants.append(constant)
+        self._struct = Struct('!' + ''.join(codes))
+        self._constants = tuple(constants)
+
+    def decode(self, frame: Union[bytes, bytearray, memoryview]) -> FixedLengthFields:
+        """Decode the fields of `frame` which may change, at their fixed offsets.
+
+        Raises:
+            ValueError: If `frame` does not match the layout learned, e.g. of another control block.
+        """
+        if len(frame) < self._struct.size:
+            raise ValueError('frame does not match the fixed-length layout')
+        fields = self._struct.unpack_from(frame)
+        if fields[0::2] != self._constants:
+            raise ValueError('frame does not match the fixed-length layout')
+        values = fields[1::2]
+        return FixedLengthFields(*values[:7], values[7:])
+
+    @property
+    def size(self) -> int:
+        """The length of the frames, up to the end of the PDU (e.g. without any Ethernet padding)."""
+        return self._struct.size
@@ -0,0 +1,106 @@
+from struct import error as StructError
+from typing import Optional, Tuple, Union
+
+from py61850.goose.ethernet import Ethernet
+from py61850.goose.pdu import ProtocolDataUnit
+from py61850.goose.virtual_lan import VirtualLAN
+from py61850.types.base import Base
+from py61850.utils.codec import UINT16_PAIR
+from py61850.utils.parser import u16_str
+from py61850.utils.tags import GOOSE_ETHER_TYPE, VIRTUAL_LAN_ETHER_TYPE
+
+
+class Frame:
+    """A GOOSE frame decoded from the wire.
+
+    Decoding walks the frame through a single `memoryview`, only the value
+    fields of the PDU are copied, while they are turned into their types.
+
+    Args:
+        byte_stream: The whole frame, starting at the destination address.
+        lazy: Decode each PDU field only when first accessed, `byte_stream` must then be left
+            unchanged until every field was decoded (or the PDU encoded).
+
+    Raises:
+        ValueError: If `byte_stream` is not a (supported) GOOSE frame.
+    """
+
+    def __init__(self, byte_stream: Union[bytes, bytearray, memoryview], lazy: bool = False) -> None:
+        view = memoryview(byte_stream)
+        tci, _, pdu_offset = self.unpack_header(view)
+        tag, start, end = Base.unpack_tlv(view, pdu_offset)
+        if tag != 0x61:
+            raise ValueError('frame does not carry a GOOSE PDU')
+        self._raw_destination = bytes(view[0:6])
+        self._raw_source = bytes(view[6:12])
+        self._virtual_lan = None if tci is None else VirtualLAN(GOOSE_ETHER_TYPE, tci >> 13, tci & 0xFFF)
+        self._raw_app_id = bytes(view[pdu_offset - 8:pdu_offset - 6])
+        self._pdu = ProtocolDataUnit(raw_value=view[start:end], lazy=lazy)
+
+    @staticmethod
+    def unpack_header(byte_stream: Union[bytes, memoryview]) -> Tuple[Optional[int], int, int]:
+        """Decode the Ethernet header, the optional 802.1Q tag and the GOOSE header.
+
+        Returns:
+            The VLAN tag control information (`None` if untagged),
+            the APPID and the offset of the PDU.
+
+        Raises:
+            ValueError: If `byte_stream` is not a GOOSE frame.
+        """
+        if len(byte_stream) < 22:
+            raise ValueError('frame out of supported length')
+        offset, tci = 12, None
+        if byte_stream[offset:offset + 2] == VIRTUAL_LAN_ETHER_TYPE:
+            tci = (byte_stream[14] << 8) + byte_stream[15]
+            offset = 16
+        if byte_stream[offset:offset + 2] != GOOSE_ETHER_TYPE:
+            raise ValueError('frame does not carry GOOSE')
+        offset += 2
+        try:
+            app_id, length = UINT16_PAIR.unpack_from(byte_stream, offset)
+        except StructError:
+            raise ValueError('frame out of supported length')
+        if offset + length > len(byte_stream) or length < 8:
+            raise ValueError('frame out of supported length')
+        return tci, app_id, offset + 8
+
+    @property
+    def raw_destination(self) -> bytes:
+        return self._raw_destination
+
+    @property
+    def destination(self) -> str:
+        return Ethernet.unpack_mac_address(self._raw_destination)
+
+    @property
+    def raw_source(self) -> bytes:
+        return self._raw_source
+
+    @property
+    def source(self) -> str:
+        return Ethernet.unpack_mac_address(self._raw_source)
+
+    @property
+    def virtual_lan(self) -> Optional[VirtualLAN]:
+        return self._virtual_lan
+
+    @property
+    def raw_app_id(self) -> bytes:
+        return self._raw_app_id
+
+    @property
+    def app_id(self) -> str:
+        return u16_str(self._raw_app_id)
+
+    @property
+    def protocol_data_unit(self) -> ProtocolDataUnit:
+        return self._pdu
+
+
+def is_goose(frame: Union[bytes, memoryview]) -> bool:
+    """Whether the ether type of `frame` is GOOSE, either right after the addresses or after an 802.1Q tag."""
+    ether_type = frame[12:14]
+    if ether_type == VIRTUAL_LAN_ETHER_TYPE:
+        ether_type = frame[16:18]
+    return ether_type == GOOSE_ETHER_TYPE
@@ -1,22 +1,36 @@
-from typing import NoReturn, Optional, Tuple
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple, Union
 
 from py61850.types import Boolean, VisibleString
 from py61850.types.base import Base
-from py61850.types.integer import Unsigned
+from py61850.types.bit_string import BitString
+from py61850.types.floating_point import DoublePrecision, SinglePrecision
+from py61850.types.integer import Signed, Unsigned
+from py61850.types.octet_string import OctetString
 from py61850.types.times import Quality, Timestamp
+from py61850.utils.codec import UINT8_BYTES
 from py61850.utils.errors import raise_type
 
 
 class GooseControlBlockReference(VisibleString):
+    __slots__ = ()
+
+    _RAW_TAG = b'\x80'
+    _MAX_LENGTH = 65
+
     def __init__(self, string: str = None):
-        super().__init__(string, max_length=65, raw_tag=b'\x80')
+        super().__init__(string, max_length=self._MAX_LENGTH, raw_tag=self._RAW_TAG)
 
 
 class TimeAllowedToLive(Unsigned):
+    __slots__ = ()
+
+    _RAW_TAG = b'\x81'
+    _MIN_RANGE = 1
+
     def __init__(self, integer: int):
-        # TODO Follow goose sending rate (should decrease with a new event/status number)
-        # Should it though?
-        super().__init__(integer, min_range=1, max_range=0xFFFFFFFF, raw_tag=b'\x81')
+        # NOTE the publisher follows its retransmission curve, see `RetransmissionCurve.time_allowed_to_live`
+        super().__init__(integer, min_range=self._MIN_RANGE, max_range=self._MAX_RANGE, raw_tag=self._RAW_TAG)
 
     @property
     def tag(self) -> str:
@@ -25,23 +39,44 @@ class TimeAllowedToLive(Unsigned):
 
 
 class DataSet(VisibleString):
+    __slots__ = ()
+
+    _RAW_TAG = b'\x82'
+    _MAX_LENGTH = 65
+
     def __init__(self, string: str = None):
-        super().__init__(string, max_length=65, raw_tag=b'\x82')
+        super().__init__(string, max_length=self._MAX_LENGTH, raw_tag=self._RAW_TAG)
 
 
 class GooseIdentifier(VisibleString):
+    __slots__ = ()
+
+    _RAW_TAG = b'\x83'
+    _MAX_LENGTH = 65
+
     def __init__(self, string: str = None):
-        super().__init__(string, max_length=65, raw_tag=b'\x83')
+        super().__init__(string, max_length=self._MAX_LENGTH, raw_tag=self._RAW_TAG)
 
 
 class GooseTimestamp(Timestamp):
-    def __init__(self, epoch: float, quality: Quality = Quality()):
-        super().__init__(epoch, quality, raw_tag=b'\x84')
+    __slots__ = ()
+
+    _RAW_TAG = b'\x84'
+
+    def __init__(self, epoch: Union[float, bytes], quality: Optional[Quality] = None):
+        if quality is None and not isinstance(epoch, bytes):
+            quality = Quality()
+        super().__init__(epoch, quality, raw_tag=self._RAW_TAG)
 
 
 class StatusNumber(Unsigned):
+    __slots__ = ('_iter',)
+
+    _RAW_TAG = b'\x85'
+    _MIN_RANGE = 1
+
     def __init__(self, integer: int):
-        super().__init__(integer, min_range=1, max_range=0xFFFFFFFF, raw_tag=b'\x85')
+        super().__init__(integer, min_range=self._MIN_RANGE, max_range=self._MAX_RANGE, raw_tag=self._RAW_TAG)
         self._iter = False
 
     def __iter__(self):
@@ -68,8 +103,13 @@ class StatusNumber(Unsigned):
 
 
 class SequenceNumber(Unsigned):
+    __slots__ = ('_first',)
+
+    _RAW_TAG = b'\x86'
+    _MIN_RANGE = 0
+
     def __init__(self, integer: int):
-        super().__init__(integer, min_range=0, max_range=0xFFFFFFFF, raw_tag=b'\x86')
+        super().__init__(integer, min_range=self._MIN_RANGE, max_range=self._MAX_RANGE, raw_tag=self._RAW_TAG)
 
     def __iter__(self):
         self._first = True
@@ -93,13 +133,22 @@ class SequenceNumber(Unsigned):
 
 
 class GooseTest(Boolean):
+    __slots__ = ()
+
+    _RAW_TAG = b'\x87'
+
     def __init__(self, boolean: bool):
-        super().__init__(boolean, raw_tag=b'\x87')
+        super().__init__(boolean, raw_tag=self._RAW_TAG)
 
 
 class ConfigurationRevision(Unsigned):
+    __slots__ = ()
+
+    _RAW_TAG = b'\x88'
+    _MIN_RANGE = 0
+
     def __init__(self, integer: int):
-        super().__init__(integer, min_range=0, max_range=0xFFFFFFFF, raw_tag=b'\x88')
+        super().__init__(integer, min_range=self._MIN_RANGE, max_range=self._MAX_RANGE, raw_tag=self._RAW_TAG)
 
     @property
     def tag(self) -> str:
@@ -108,14 +157,23 @@ class ConfigurationRevision(Unsigned):
 
 
 class NeedsCommissioning(Boolean):
+    __slots__ = ()
+
+    _RAW_TAG = b'\x89'
+
     def __init__(self, boolean: bool):
-        super().__init__(boolean, raw_tag=b'\x89')
+        super().__init__(boolean, raw_tag=self._RAW_TAG)
 
 
 class NumberOfDataSetEntries(Unsigned):
+    __slots__ = ()
+
+    _RAW_TAG = b'\x8A'
+    _MIN_RANGE = 0
+
     def __init__(self, integer: int):
         # TODO whats the limit?
-        super().__init__(integer, min_range=0, max_range=0xFFFFFFFF, raw_tag=b'\x8A')
+        super().__init__(integer, min_range=self._MIN_RANGE, max_range=self._MAX_RANGE, raw_tag=self._RAW_TAG)
 
     @property
     def tag(self) -> str:
@@ -123,80 +181,278 @@ class NumberOfDataSetEntries(Unsigned):
         return self.__class__.__name__
 
 
+class LazyTuple:
+    """An immutable sequence of `Base`, each one decoded only when first accessed, then cached.
+
+    Args:
+        parent: The parent of every decoded item.
+        byte_stream: The encoded items.
+        spans: The tag, start and end offsets of each item, as returned by `Base.index_tlv`.
+        items: The items decoded in advance, `None` for the ones still to be decoded.
+        decode: Decode an item, given its position, its tag and its value field.
+    """
+
+    __slots__ = ('_parent', '_byte_stream', '_spans', '_items', '_decode')
+
+    def __init__(self, parent: Base, byte_stream: memoryview, spans: List[Optional[Tuple[int, int, int]]],
+                 items: List[Optional[Base]], decode: Callable[[int, int, memoryview], Base]) -> None:
+        self._parent = parent
+        self._byte_stream = byte_stream
+        self._spans = spans
+        self._items = items
+        self._decode = decode
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, item: Union[int, slice]) -> Any:
+        if isinstance(item, slice):
+            return tuple(self[index] for index in range(*item.indices(len(self))))
+        value = self._items[item]
+        if value is None:
+            tag, start, end = self._spans[item]
+            value = self._decode(item, tag, self._byte_stream[start:end])
+            value.set_parent(self._parent)
+            self._items[item] = value
+        return value
+
+    @property
+    def decoded(self) -> int:
+        """The number of items decoded so far."""
+        return len(self._items) - self._items.count(None)
+
+    def encode(self) -> bytes:
+        """Encode every item, copying the ones still to be decoded as they are."""
+        return b''.join([Base.pack_tlv(UINT8_BYTES[span[0]], bytes(self._byte_stream[span[1]:span[2]]))
+                         if item is None else bytes(item) for item, span in zip(self._items, self._spans)])
+
+
 class AllData(Base):
-    def __init__(self, *data: Base):
-        (raw_value, number_of_entries), value = self._parse(data)
-        if raw_value == b'':
+    __slots__ = ('_number_of_entries', '_batch_depth', '_batch_raw_value')
+
+    _RAW_TAG = b'\xAB'
+
+    def __init__(self, *data: Union[Base, bytes, memoryview], lazy: bool = False):
+        decoded = len(data) == 1 and isinstance(data[0], (bytes, memoryview))
+        if decoded:
+            # only the value field of each member is copied, the value field of the whole is encoded when read
+            view = memoryview(data[0])
+            if lazy:
+                spans = Base.index_tlv(view)
+                value = LazyTuple(self, view, spans, [None] * len(spans), self._decode_item)
+            else:
+                value = self._decode(view)
+            raw_value, number_of_entries = None, len(value)
+        else:
+            (raw_value, number_of_entries), value = self._parse(data)
+        if raw_value == b'' or (decoded and number_of_entries == 0):
             raw_value, value = None, None
         self._value = value
-        super().__init__(raw_tag=b'\xAB', raw_value=raw_value)
+        self._batch_depth = 0
+        self._batch_raw_value = None
+        super().__init__(raw_tag=self._RAW_TAG, raw_value=raw_value)
+        self._dirty = decoded and value is not None
         self._number_of_entries = number_of_entries
-        try:
+        if isinstance(value, tuple):
             for value in self._value:
                 value.set_parent(self)
-        except TypeError:
-            pass
 
     @staticmethod
     def _encode(value: Tuple[Base, ...]) -> Tuple[bytes, int]:
         # TODO Improve
         # if value is None: return None, 0
 
-        all_data = b''
+        all_data = []
         for base in value:
             # TODO validate against standard types instead of Base?
             # like, test if v_str, u_int, s_int, f_32, f_64, etc
             # like, raise error for g_t_smp, sq_num, etc
             if not isinstance(base, Base):
                 raise_type('base', Base, type(base))
-            all_data += bytes(base)
-        return all_data, len(value)
+            all_data.append(bytes(base))
+        return b''.join(all_data), len(value)
+
+    @staticmethod
+    def _decode(raw_value: Union[bytes, memoryview]) -> Tuple[Base, ...]:
+        view = memoryview(raw_value)
+        return tuple(AllData._decode_data(tag, view[start:end]) for tag, start, end in Base.index_tlv(view))
 
     @staticmethod
-    def _decode(raw_value: bytes) -> NoReturn:
-        # TODO Implement
-        raise NotImplementedError
+    def _decode_item(_: int, tag: int, raw_value: memoryview) -> Base:
+        return AllData._decode_data(tag, raw_value)
+
+    @classmethod
+    def _encode_value(cls, value: Tuple[Tuple[type, Any], ...]) -> bytes:
+        # e.g. ((Boolean, True), (VisibleString, 'Content'))
+        return b''.join([data_type.encode(data) for data_type, data in value])
+
+    @classmethod
+    def _decode_value(cls, raw_value: bytes) -> Tuple[Any, ...]:
+        return tuple(AllData._data_type(tag, end - start)._decode_value(raw_value[start:end])
+                     for tag, start, end in Base.index_tlv(raw_value))
+
+    @staticmethod
+    def _decode_data(tag: int, raw_value: memoryview) -> Base:
+        data_type = AllData._data_type(tag, len(raw_value))
+        if issubclass(data_type, AllData):  # e.g. a `Structure`, its members are copied instead
+            return data_type(raw_value)
+        return data_type(bytes(raw_value))
+
+    def _refresh(self) -> None:
+        if isinstance(self._value, LazyTuple):
+            self._dirty = False
+            self._store_raw_value(self._value.encode())
+        else:
+            super()._refresh()
+
+    @staticmethod
+    def _data_type(tag: int, length: int) -> type:
+        if tag == 0x87:
+            return DoublePrecision if length == 9 else SinglePrecision
+        try:
+            return _DATA_TYPES[tag]
+        except KeyError:
+            raise ValueError(f'tag {tag:#04x} not supported by {AllData.__name__}')
+
+    def _update(self, caller: Base):
+        if self._batch_depth:
+            self._dirty = True
+        else:
+            super()._update(caller)
+
+    @contextmanager
+    def batch(self) -> Iterator['AllData']:
+        """Group the changes of several members into a single update.
+
+        The parent (i.e. the `ProtocolDataUnit`, which issues a new status number)
+        is notified only once, when leaving the outermost block, and only if the
+        encoded data changed. Changes made before an exception are kept, and notified.
+
+        Example:
+            with pdu.all_data.batch() as all_data:
+                all_data[0] = False
+                all_data[1] = 'New Content'
+        """
+        if self._batch_depth == 0:
+            self._batch_raw_value = self.raw_value
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty and self.raw_value != self._batch_raw_value:
+                if self._parent is not None:
+                    self._parent._update(self)
 
     @property
     def number_of_data_set_entries(self):
         return self._number_of_entries
 
+    @property
+    def fixed_length(self) -> bool:
+        """Whether every integer member is encoded with a fixed length, see `Unsigned.fixed_length`.
+
+        Setting it does not issue a new status number, as the values did not change.
+
+        Raises:
+            AttributeError: If set while holding an `Interned` integer, which may be shared.
+        """
+        return _fixed_length(self._value or ())
+
+    @fixed_length.setter
+    def fixed_length(self, fixed_length: bool) -> None:
+        for member in self._value or ():
+            if isinstance(member, (Signed, Unsigned, AllData)):
+                member.fixed_length = fixed_length
+
     def __getitem__(self, item):
         return self._value[item]
 
+    def __setitem__(self, item, value):
+        self._value[item].value = value
+
+
+class Structure(AllData):
+    """A structure member of an `AllData`, e.g. the value, quality and timestamp of a data object.
+
+    Its members are handled the same way as the ones of an `AllData`, nested structures included.
+    """
+
+    __slots__ = ()
+
+    _RAW_TAG = b'\xA2'
+
+
+class Array(AllData):
+    """An array member of an `AllData`, see `Structure`."""
+
+    __slots__ = ()
+
+    _RAW_TAG = b'\xA1'
+
+
+# the type of each `AllData` member, by tag (floating points are told apart by their length)
+_DATA_TYPES = {0x83: Boolean, 0x84: BitString, 0x85: Signed, 0x86: Unsigned, 0x89: OctetString, 0x8A: VisibleString,
+               0x91: Timestamp, 0xA1: Array, 0xA2: Structure}
+
 
 class ProtocolDataUnit(Base):
+    __slots__ = ('_iter', '_iter_status', '_iter_sequence')
+
+    _RAW_TAG = b'\x61'
+
     _DATA_TYPES = [('control_block_reference', GooseControlBlockReference), ('time_allowed_to_live', TimeAllowedToLive),
                    ('data_set', DataSet), ('goose_identifier', GooseIdentifier), ('goose_timestamp', GooseTimestamp),
                    ('status_number', StatusNumber), ('sequence_number', SequenceNumber), ('test', GooseTest),
                    ('configuration_revision', ConfigurationRevision), ('needs_commissioning', NeedsCommissioning),
                    ('skip', None), ('all_data', AllData)]
 
+    # the type of each field, for the class methods `encode` and `decode`
+    _FIELD_TYPES = tuple(NumberOfDataSetEntries if data_type is None else data_type for _, data_type in _DATA_TYPES)
+
+    _TAGS = (0x80, 0x81, 0x82, 0x83, 0x84, 0x85, 0x86, 0x87, 0x88, 0x89, 0x8A, 0xAB)
+
     # Table 56 (61850-8-1)
     def __init__(self,
-                 control_block_reference: GooseControlBlockReference, time_allowed_to_live: TimeAllowedToLive,
-                 data_set: DataSet, goose_identifier: GooseIdentifier, goose_timestamp: GooseTimestamp,
-                 status_number: StatusNumber, sequence_number: SequenceNumber, test: GooseTest,
-                 configuration_revision: ConfigurationRevision, needs_commissioning: NeedsCommissioning,
+                 control_block_reference: GooseControlBlockReference = None,
+                 time_allowed_to_live: TimeAllowedToLive = None,
+                 data_set: DataSet = None, goose_identifier: GooseIdentifier = None,
+                 goose_timestamp: GooseTimestamp = None, status_number: StatusNumber = None,
+                 sequence_number: SequenceNumber = None, test: GooseTest = None,
+                 configuration_revision: ConfigurationRevision = None, needs_commissioning: NeedsCommissioning = None,
                  # TODO remove numOfDatSet from here, remove default value for AllData
                  number_of_data_set_entries: Optional[NumberOfDataSetEntries] = None, all_data: AllData = AllData(),
-                 raw_value: bytes = None):
+                 raw_value: Optional[Union[bytes, memoryview]] = None, lazy: bool = False):
         # TODO What if the user want's to exclude some unnecessary fields
         # e.g. remove nds_com and test fields
-        if raw_value:
-            raise NotImplementedError
+        decoded = raw_value is not None
+        if decoded:
+            # only the value field of each field is copied, the value field of the whole is encoded when read
+            view = memoryview(raw_value)
+            raw_value = None
+            if lazy:
+                # number_of_data_set_entries is checked against all_data when the latter is first decoded
+                spans, fields = self._index(view)
+                for field in fields:
+                    if field is not None:
+                        field.set_parent(self)
+                value = LazyTuple(self, view, spans, fields, self._decode_lazy_field)
+                if spans[11] is None:
+                    self._check_entries(value[10], fields[11])
+            else:
+                value = self._decode(view)
         else:
-            raw_value, number_of_data_set_entries = self._encode((control_block_reference, time_allowed_to_live,
-                                                                  data_set, goose_identifier, goose_timestamp,
-                                                                  status_number, sequence_number, test,
-                                                                  configuration_revision, needs_commissioning,
-                                                                  number_of_data_set_entries, all_data))
-        super().__init__(raw_tag=b'\x61', raw_value=raw_value)
-        self._value = (control_block_reference, time_allowed_to_live, data_set, goose_identifier, goose_timestamp,
-                       status_number, sequence_number, test, configuration_revision, needs_commissioning,
-                       number_of_data_set_entries, all_data)
-        for value in self._value:
-            value.set_parent(self)
+            value = (control_block_reference, time_allowed_to_live, data_set, goose_identifier, goose_timestamp,
+                     status_number, sequence_number, test, configuration_revision, needs_commissioning,
+                     number_of_data_set_entries, all_data)
+            raw_value, number_of_data_set_entries = self._encode(value)
+            value = value[:10] + (number_of_data_set_entries, all_data)
+        super().__init__(raw_tag=self._RAW_TAG, raw_value=raw_value)
+        self._dirty = decoded
+        self._value = value
+        if not lazy:
+            for value in self._value:
+                value.set_parent(self)
 
     def __iter__(self):
         self._iter = True
@@ -205,6 +461,7 @@ class ProtocolDataUnit(Base):
         return self
 
     def __next__(self):
+        # NOTE the PDU is only encoded again when read, e.g. by `bytes()`
         try:
             # update time allowed to live + time stamp
             self._iter
@@ -215,29 +472,21 @@ class ProtocolDataUnit(Base):
             next(self._iter_sequence)
         except AttributeError:
             raise TypeError(f"'{self.__class__.__name__}' object is not iterable")
-        self._generic_update()
         return self
 
-    def _generic_update(self):
-        byte_stream = b''
-        for value in self._value:
-            byte_stream += bytes(value)
-        self._set_raw_value(byte_stream)
-
     def _update(self, caller: Base):
         if isinstance(caller, AllData):
-            # TODO what if i change a value for the same value? Should update trigger?
+            # NOTE use `all_data.batch()` to generate only ONE new status change for many changes,
+            # e.g. pdu.all_data[0] = 1; pdu.all_data[1] = 'Okay', or none if the values did not change
             try:
                 # TODO only change if next was already called
-                # e.g. pdu.all_data[0] = 1; pdu.all_data[1] = 'Okay' \
-                # should generate only ONE new status change, not 2
                 self._iter
                 next(self._iter_status)
                 self.sequence_number.value = 0
                 self._iter_sequence = iter(self.sequence_number)
             except AttributeError:
                 pass
-            self._generic_update()
+        super()._update(caller)
 
     @staticmethod
     def _assert_type(data):
@@ -273,16 +522,119 @@ class ProtocolDataUnit(Base):
                 len(number_of_data_set_entries) + len(all_data) > 1492:  # PDU limit
             raise ValueError(f'{self.__class__.__name__} out of supported length')
 
-        return \
-            bytes(control_block_reference) + bytes(time_allowed_to_live) + bytes(data_set) + \
-            bytes(goose_identifier) + bytes(goose_timestamp) + bytes(status_number) + bytes(sequence_number) + \
-            bytes(test) + bytes(configuration_revision) + bytes(needs_commissioning) + \
-            bytes(number_of_data_set_entries) + bytes(all_data), number_of_data_set_entries
+        return b''.join([
+            bytes(control_block_reference), bytes(time_allowed_to_live), bytes(data_set),
+            bytes(goose_identifier), bytes(goose_timestamp), bytes(status_number), bytes(sequence_number),
+            bytes(test), bytes(configuration_revision), bytes(needs_commissioning),
+            bytes(number_of_data_set_entries), bytes(all_data)]), number_of_data_set_entries
+
+    @classmethod
+    def _encode_value(cls, value: Sequence[Any]) -> bytes:
+        # e.g. (gocbRef, timeAllowedToLive, ..., (timestamp, quality), ..., None, ((Boolean, True),)),
+        # numDatSetEntries (the 11th value) is counted from allData if `None`
+        if len(value) != len(cls._TAGS):
+            raise ValueError(f'{cls.__name__} out of supported length')
+        number_of_data_set_entries = len(value[11]) if value[10] is None else value[10]
+        if number_of_data_set_entries != len(value[11]):
+            raise ValueError('number_of_data_set_entries doest not match all_data number of entries')
+        value = tuple(value[:10]) + (number_of_data_set_entries, value[11])
+        raw_value = b''.join([data_type.encode(field) for data_type, field in zip(cls._FIELD_TYPES, value)])
+        if len(raw_value) > 1492:  # PDU limit
+            raise ValueError(f'{cls.__name__} out of supported length')
+        return raw_value
+
+    @classmethod
+    def _decode_value(cls, raw_value: bytes) -> Tuple[Any, ...]:
+        # the value of each field, test and ndsCom are DEFAULT FALSE, and allData defaults to empty
+        values = [None] * 7 + [False, None, False, None, ()]
+        for index, (data_type, span) in enumerate(zip(cls._FIELD_TYPES, cls._spans(raw_value))):
+            if span is not None:
+                values[index] = data_type._decode_value(raw_value[span[1]:span[2]])
+        if values[10] != len(values[11]):
+            raise ValueError('number_of_data_set_entries doest not match all_data number of entries')
+        return tuple(values)
+
+    @staticmethod
+    def _spans(raw_value: Union[bytes, memoryview]) -> List[Optional[Tuple[int, int, int]]]:
+        # find where each field is, without decoding any of them
+        spans = [None] * len(ProtocolDataUnit._TAGS)
+        for span in Base.index_tlv(raw_value):
+            try:
+                spans[ProtocolDataUnit._TAGS.index(span[0])] = span
+            except ValueError:
+                raise ValueError(f'tag {span[0]:#04x} not supported by {ProtocolDataUnit.__name__}')
+        # test and ndsCom are DEFAULT FALSE (Table 56, 61850-8-1), allData may be empty
+        for index, span in enumerate(spans):
+            if span is None and index not in (7, 9, 11):
+                raise ValueError(f'{ProtocolDataUnit.__name__} is missing a mandatory field')
+        return spans
+
+    @staticmethod
+    def _index(raw_value: Union[bytes, memoryview]) -> Tuple[List[Optional[Tuple[int, int, int]]], List[Optional[Base]]]:
+        # find where each field is, building only the missing ones
+        spans = ProtocolDataUnit._spans(raw_value)
+        fields = [None] * len(ProtocolDataUnit._TAGS)
+        if spans[7] is None:
+            fields[7] = GooseTest(False)
+        if spans[9] is None:
+            fields[9] = NeedsCommissioning(False)
+        if spans[11] is None:
+            fields[11] = AllData()
+        return spans, fields
+
+    @staticmethod
+    def _decode(raw_value: Union[bytes, memoryview]) -> Tuple[Base, ...]:
+        view = memoryview(raw_value)
+        spans, fields = ProtocolDataUnit._index(view)
+        for index, span in enumerate(spans):
+            if span is not None:
+                fields[index] = ProtocolDataUnit._decode_field(index, view[span[1]:span[2]])
+        ProtocolDataUnit._check_entries(fields[10], fields[11])
+        return tuple(fields)
 
     @staticmethod
-    def _decode(raw_value: bytes) -> NoReturn:
-        # TODO Implement
-        raise NotImplementedError
+    def _check_entries(number_of_data_set_entries: NumberOfDataSetEntries, all_data: AllData) -> None:
+        if number_of_data_set_entries.value != all_data.number_of_data_set_entries:
+            raise ValueError('number_of_data_set_entries doest not match all_data number of entries')
+
+    def _refresh(self) -> None:
+        if isinstance(self._value, LazyTuple):
+            self._dirty = False
+            self._store_raw_value(self._value.encode())
+        else:
+            super()._refresh()
+
+    def _decode_lazy_field(self, index: int, _: int, raw_value: memoryview) -> Base:
+        if index == 11:
+            all_data = AllData(raw_value, lazy=True)
+            self._check_entries(self._value[10], all_data)
+            return all_data
+        return ProtocolDataUnit._decode_field(index, raw_value)
+
+    @staticmethod
+    def _decode_field(index: int, raw_value: memoryview) -> Base:
+        if index == 11:
+            return AllData(raw_value)
+        elif index == 10:
+            return NumberOfDataSetEntries(bytes(raw_value))
+        elif index == 4:
+            return GooseTimestamp(bytes(raw_value), None)
+        return ProtocolDataUnit._DATA_TYPES[index][1](bytes(raw_value))
+
+    @property
+    def fixed_length(self) -> bool:
+        """Whether every integer is encoded with a fixed length, e.g. stNum and sqNum, all data included.
+
+        With the fixed-length encoding (61850-8-1 Ed2) every byte offset of the PDU stays the same
+        between frames, as long as its strings do not change, see `fixed_length.FixedLengthDecoder`.
+        """
+        return _fixed_length(self._value)
+
+    @fixed_length.setter
+    def fixed_length(self, fixed_length: bool) -> None:
+        for field in self._value:
+            if isinstance(field, (Unsigned, AllData)):
+                field.fixed_length = fixed_length
 
     @property
     def goose_control_block_reference(self):
@@ -331,3 +683,8 @@ class ProtocolDataUnit(Base):
     @property
     def all_data(self):
         return self._value[11]
+
+
+def _fixed_length(items: Sequence[Base]) -> bool:
+    # whether every integer (or `AllData`) is encoded with a fixed length
+    return all(item.fixed_length for item in items if isinstance(item, (Signed, Unsigned, AllData)))
@@ -1,17 +1,21 @@
-from struct import pack as s_pack
 from typing import Optional, Tuple, Union
 
 from py61850.goose.ethernet import Ethernet
 from py61850.goose.pdu import AllData, ConfigurationRevision, DataSet, GooseControlBlockReference, GooseIdentifier
 from py61850.goose.pdu import GooseTimestamp, NeedsCommissioning, NumberOfDataSetEntries, ProtocolDataUnit
 from py61850.goose.pdu import SequenceNumber, StatusNumber, GooseTest, TimeAllowedToLive
+from py61850.goose.retransmission import RetransmissionCurve
 from py61850.goose.virtual_lan import VirtualLAN
 from py61850.types.base import Base
+from py61850.utils.codec import UINT16
 from py61850.utils.parser import int_u16, u16_str
 
 VLAN_ETHER_TYPE = b'\x81\x00'
 GOOSE_ETHER_TYPE = b'\x88\xb8'
 
+# PDU fields which change between retransmissions: TimeAllowedToLive, GooseTimestamp, StatusNumber, SequenceNumber
+PATCHED_FIELDS = (1, 4, 5, 6)
+
 
 class Publisher:
     def __init__(self, destination: bytes = b'\x01\x0c\xcd\x01\x00\x00', source: bytes = b'\x00\x00\x00\x00\x00\x00',
@@ -21,7 +25,15 @@ class Publisher:
                  goose_identifier: str = 'IED', goose_timestamp: float = 0.0, status_number: int = 1,
                  sequence_number: int = 0, test: bool = False, configuration_revision: int = 1,
                  needs_commissioning: bool = False, number_of_data_set_entries: Optional[int] = None,
-                 all_data: Optional[Union[AllData, Tuple[Base, ...]]] = None):
+                 all_data: Optional[Union[AllData, Tuple[Base, ...]]] = None, compiled: bool = False,
+                 curve: Optional[RetransmissionCurve] = None, fixed_length: bool = False):
+        self._compiled = compiled
+        # only a given curve drives the time allowed to live, otherwise the given one is kept
+        self._curve = RetransmissionCurve() if curve is None else curve
+        self._follows_curve = curve is not None
+        self._frame = None
+        self._patches = ()
+        self._snapshot = ()
         self.destination = destination
         self.source = source
         if virtual_lan:
@@ -56,15 +68,14 @@ class Publisher:
         self._pdu = ProtocolDataUnit(goose_control_block_reference, time_allowed_to_live, data_set, goose_identifier,
                                      goose_timestamp, status_number, sequence_number, test, configuration_revision,
                                      needs_commissioning, number_of_data_set_entries, all_data)
+        if fixed_length:
+            # every byte offset stays the same between frames, see `ProtocolDataUnit.fixed_length`
+            self._pdu.fixed_length = True
 
     def __bytes__(self):
-        header = self._raw_destination + self._raw_source + self._ether_type
-        if self._virtual_lan:
-            header += bytes(self._virtual_lan)
-        start = self._raw_app_id
-        # TODO Implement LENGTH
-        end = self._reserved + bytes(self._pdu)
-        return header + start + s_pack('!H', len(start + end) + 2) + end
+        if self._compiled:
+            return bytes(self._compile())
+        return self._render()
 
     def __iter__(self):
         self._iter = iter(self._pdu)
@@ -75,8 +86,109 @@ class Publisher:
             next(self._iter)
         except AttributeError:
             raise TypeError(f"'{self.__class__.__name__}' object is not iterable")
+        if self._follows_curve:
+            # follow the retransmission curve, e.g. a shorter time allowed to live right after an event
+            time_allowed_to_live = self._curve.time_allowed_to_live(self._pdu.sequence_number.value)
+            if self._pdu.time_allowed_to_live.value != time_allowed_to_live:
+                self._pdu.time_allowed_to_live.value = time_allowed_to_live
         return self
 
+    def render_batch(self, number: int, buffer: Union[bytearray, memoryview],
+                     offset: int = 0) -> Tuple[Tuple[int, int], ...]:
+        """Render the next `number` retransmissions back to back into `buffer`.
+
+        Each frame is patched in the frame template (see `compiled`), then copied
+        into `buffer`, so nothing is allocated per frame. Iterating starts if not yet started.
+
+        Args:
+            number: How many frames to render, each one as if returned by `next()`.
+            buffer: Where the frames are written.
+            offset: Where the first frame is written.
+
+        Returns:
+            The offset and the length of each frame within `buffer`.
+
+        Raises:
+            ValueError: If `buffer` is too short, the frames rendered so far are kept,
+                and the publisher does not move past the last of them.
+        """
+        try:
+            self._iter
+        except AttributeError:
+            iter(self)
+        view = memoryview(buffer)
+        frames = []
+        for _ in range(number):
+            state = self._iter_state()
+            next(self)
+            frame = self._compile()
+            end = offset + len(frame)
+            if end > len(view):
+                self._restore_iter_state(state)
+                raise ValueError('buffer out of supported length')
+            view[offset:end] = frame
+            frames.append((offset, end - offset))
+            offset = end
+        return tuple(frames)
+
+    def _iter_state(self) -> Tuple[int, bool, int]:
+        # what `next()` changes: the sqNum, whether it is the first of its status, and the time allowed to live
+        sequence_number = self._pdu.sequence_number
+        return sequence_number.value, sequence_number._first, self._pdu.time_allowed_to_live.value
+
+    def _restore_iter_state(self, state: Tuple[int, bool, int]) -> None:
+        value, first, time_allowed_to_live = state
+        sequence_number = self._pdu.sequence_number
+        sequence_number.value = value
+        sequence_number._first = first
+        if self._pdu.time_allowed_to_live.value != time_allowed_to_live:
+            self._pdu.time_allowed_to_live.value = time_allowed_to_live
+
+    def _render(self) -> bytes:
+        header = self._raw_destination + self._raw_source + self._ether_type
+        if self._virtual_lan:
+            header += bytes(self._virtual_lan)
+        start = self._raw_app_id
+        # TODO Implement LENGTH
+        end = self._reserved + bytes(self._pdu)
+        return header + start + UINT16.pack(len(start + end) + 2) + end
+
+    def _compile(self) -> bytearray:
+        """Return the frame template, patching only the fields which change between retransmissions.
+
+        The whole frame is rendered again whenever any other field changed, or when a patched
+        field changed its encoded length (e.g. sqNum going from 255 to 256).
+        """
+        if self._frame is None:
+            return self._recompile()
+        fields = self._pdu.value
+        for index, raw_value in self._snapshot:
+            if fields[index].raw_value is not raw_value:
+                return self._recompile()
+        frame = self._frame
+        for field, start, end in self._patches:
+            byte_stream = bytes(field)
+            if len(byte_stream) != end - start:
+                return self._recompile()
+            frame[start:end] = byte_stream
+        return frame
+
+    def _recompile(self) -> bytearray:
+        self._frame = bytearray(self._render())
+        pdu = self._pdu
+        offset = len(self._frame) - len(pdu) + len(pdu.raw_tag) + len(pdu.raw_length)
+        patches, snapshot = [], []
+        for index, field in enumerate(pdu.value):
+            length = len(field)
+            if index in PATCHED_FIELDS:
+                patches.append((field, offset, offset + length))
+            else:
+                snapshot.append((index, field.raw_value))
+            offset += length
+        self._patches = tuple(patches)
+        self._snapshot = tuple(snapshot)
+        return self._frame
+
     @property
     def raw_destination(self):
         return self._raw_destination
@@ -89,6 +201,7 @@ class Publisher:
     def destination(self, mac_address):
         self._raw_destination = Ethernet.pack_mac_address(mac_address)
         Ethernet.assert_destination(self._raw_destination)
+        self._frame = None  # render the frame template again, see `_compile`
         if isinstance(mac_address, str):
             self._destination = mac_address.upper()
         else:
@@ -105,6 +218,7 @@ class Publisher:
     @source.setter
     def source(self, mac_address):
         self._raw_source = Ethernet.pack_mac_address(mac_address)
+        self._frame = None
         if isinstance(mac_address, str):
             self._source = mac_address.upper()
         else:
@@ -121,6 +235,24 @@ class Publisher:
     def _set_app_id(self, app_id: int):
         self._raw_app_id = int_u16(app_id)
         self._app_id = u16_str(self._raw_app_id)
+        self._frame = None
+
+    @property
+    def next_goose_timer(self) -> float:
+        """The seconds until the next retransmission is due, see `RetransmissionCurve`."""
+        return self._curve.interval(self._pdu.sequence_number.value)
+
+    @property
+    def curve(self) -> RetransmissionCurve:
+        return self._curve
+
+    @property
+    def compiled(self) -> bool:
+        return self._compiled
+
+    @property
+    def fixed_length(self) -> bool:
+        return self._pdu.fixed_length
 
     @property
     def protocol_data_unit(self):
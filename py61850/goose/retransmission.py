@@ -0,0 +1,65 @@
+from math import ceil
+
+
+class RetransmissionCurve:
+    """When to retransmit a GOOSE, according to IEC 61850-8-1.
+
+    Right after an event (i.e. a new status number) the GOOSE is retransmitted after `t1`,
+    then each interval is `multiplier` times longer, up to the heartbeat interval `t0`.
+    As the sequence number restarts from zero on each event, it tells where along the curve
+    a publisher is.
+
+    Args:
+        t0: The heartbeat interval, in seconds.
+        t1: The shortest interval, right after an event, in seconds.
+        multiplier: How many times longer each interval is than the previous one.
+        tal_factor: How many times longer the time allowed to live is than the next interval.
+
+    Raises:
+        ValueError: If any argument is out of the supported range.
+    """
+
+    def __init__(self, t0: float = 1.0, t1: float = 0.002, multiplier: float = 2.0, tal_factor: float = 2.0) -> None:
+        if not 0 < t1 <= t0:
+            raise ValueError('t1 out of supported range')
+        if multiplier <= 1:
+            raise ValueError('multiplier out of supported range')
+        if tal_factor < 1:
+            raise ValueError('tal_factor out of supported range')
+        self._t0 = t0
+        self._t1 = t1
+        self._multiplier = multiplier
+        self._tal_factor = tal_factor
+        # intervals shorter than `t0`, indexed by sequence number
+        intervals = []
+        interval = t1
+        while interval < t0:
+            intervals.append(interval)
+            interval *= multiplier
+        self._intervals = tuple(intervals)
+
+    def interval(self, sequence_number: int) -> float:
+        """Return the seconds between the GOOSE of `sequence_number` and the next one."""
+        if sequence_number < len(self._intervals):
+            return self._intervals[sequence_number]
+        return self._t0
+
+    def time_allowed_to_live(self, sequence_number: int) -> int:
+        """Return the time allowed to live of the GOOSE of `sequence_number`, in milliseconds."""
+        return max(1, ceil(self.interval(sequence_number) * self._tal_factor * 1000))
+
+    @property
+    def t0(self) -> float:
+        return self._t0
+
+    @property
+    def t1(self) -> float:
+        return self._t1
+
+    @property
+    def multiplier(self) -> float:
+        return self._multiplier
+
+    @property
+    def tal_factor(self) -> float:
+        return self._tal_factor
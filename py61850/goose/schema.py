@@ -0,0 +1,198 @@
+from functools import lru_cache
+from operator import mul
+from struct import error as StructError, Struct
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+
+from py61850.goose.pdu import AllData
+from py61850.types import Boolean
+from py61850.types.base import Base
+from py61850.types.floating_point import DoublePrecision, SinglePrecision
+from py61850.types.integer import Signed, Unsigned
+
+# the struct format of the value of each member type, by the length of its value field,
+# as integers are encoded with the shortest length
+FORMATS = {Boolean: {1: '?'}, SinglePrecision: {5: 'f'}, DoublePrecision: {9: 'd'},
+           Signed: {1: 'b', 2: 'h', 4: 'i', 8: 'q'}, Unsigned: {1: 'B', 2: 'H', 4: 'I'}}
+
+# the length of the value field, the exponent, the struct format to encode and the scale of the value
+# of each member type of a fixed size, e.g. a `Boolean` is encoded as `True * 0x0F`
+FIXED = {Boolean: (1, b'', 'B', 0x0F), SinglePrecision: (5, b'\x08', 'f', 1), DoublePrecision: (9, b'\x11', 'd', 1)}
+
+
+class DataSetCodec:
+    """An `AllData` encoder and decoder, specialized to the ordered member types of a data set.
+
+    If every member is of a fixed size (see `FIXED`), the whole value field is encoded by a single `Struct`,
+    tag and length fields included. It is decoded the same way if the length of every member is known,
+    integers included (see `FORMATS`). Otherwise each member is handled by its own type, skipping `_parse`.
+    Values are neither checked against their type, nor converted to it, use `compile_codec` to share instances.
+
+    Args:
+        data_types: The type of each member, e.g. `(Boolean, DoublePrecision)`.
+        lengths: The length of the value field of each member, e.g. from a received `AllData`,
+            defaults to the length of the fixed size members.
+    """
+
+    __slots__ = ('_data_types', '_raw_tags', '_prefix', '_headers', '_arguments', '_scales', '_decoder', '_encoder')
+
+    def __init__(self, data_types: Sequence[type], lengths: Optional[Sequence[int]] = None) -> None:
+        self._data_types = tuple(data_types)
+        self._raw_tags = tuple(data_type._RAW_TAG[0] for data_type in self._data_types)
+        self._decoder = self._encoder = None
+        if lengths is None and all(data_type in FIXED for data_type in self._data_types):
+            lengths = [FIXED[data_type][0] for data_type in self._data_types]
+        if lengths is not None and all(length in FORMATS.get(data_type, ())
+                                       for data_type, length in zip(self._data_types, lengths)):
+            headers = [data_type._RAW_TAG + bytes((length,)) + (FIXED[data_type][1] if data_type in FIXED else b'')
+                       for data_type, length in zip(self._data_types, lengths)]
+            self._headers = tuple(headers)
+            self._decoder = Struct('!' + ''.join(f'{len(header)}s{FORMATS[data_type][length]}' for header, data_type,
+                                                 length in zip(headers, self._data_types, lengths)))
+        if all(data_type in FIXED for data_type in self._data_types):
+            headers = [data_type._RAW_TAG + bytes((FIXED[data_type][0],)) + FIXED[data_type][1]
+                       for data_type in self._data_types]
+            self._encoder = Struct('!' + ''.join(f'{len(header)}s{FIXED[data_type][2]}'
+                                                 for header, data_type in zip(headers, self._data_types)))
+            self._arguments = [field for header in headers for field in (header, None)]
+            self._scales = [FIXED[data_type][3] for data_type in self._data_types]
+            self._prefix = AllData._RAW_TAG + Base.pack_length(self._encoder.size)
+
+    def encode(self, values: Sequence[Any]) -> bytes:
+        """Encode `values` into an `AllData`, byte-identical to `bytes(AllData(...))` of the same members.
+
+        Raises:
+            TypeError: If a fixed size value is not of a number.
+            ValueError: If there is not a value per member.
+            Same as the `encode` of each member type.
+        """
+        if len(values) != len(self._data_types):
+            raise ValueError('values out of supported length')
+        if self._encoder is None:
+            return Base.pack_tlv(AllData._RAW_TAG, b''.join([data_type.encode(value) for data_type, value
+                                                             in zip(self._data_types, values)]))
+        arguments = list(self._arguments)
+        arguments[1::2] = map(mul, values, self._scales)
+        try:
+            return self._prefix + self._encoder.pack(*arguments)
+        except StructError as error:
+            raise TypeError(f'values do not match the data set: {error}')
+
+    def decode(self, byte_stream: Union[bytes, memoryview], offset: int = 0) -> Tuple[Tuple[Any, ...], int]:
+        """Decode the `AllData` found at `offset`, returning its values and the offset of whatever follows it.
+
+        Raises:
+            ValueError: If the `AllData` does not match the data set.
+        """
+        tag, start, end = Base.unpack_tlv(byte_stream, offset)
+        if tag != AllData._RAW_TAG[0]:
+            raise ValueError(f'tag {tag:#04x} not supported by {AllData.__name__}')
+        return self.decode_value(memoryview(byte_stream)[start:end]), end
+
+    def decode_value(self, raw_value: Union[bytes, memoryview]) -> Tuple[Any, ...]:
+        """Decode the value field of an `AllData`.
+
+        Raises:
+            ValueError: If the members do not match the data set.
+        """
+        if self._decoder is None:
+            return self._decode_members(raw_value)
+        if len(raw_value) != self._decoder.size:
+            raise ValueError('all_data does not match the data set')
+        fields = self._decoder.unpack(raw_value)
+        if fields[0::2] != self._headers:
+            raise ValueError('all_data does not match the data set')
+        return fields[1::2]
+
+    def _decode_members(self, raw_value: Union[bytes, memoryview]) -> Tuple[Any, ...]:
+        values, offset = [], 0
+        for raw_tag, data_type in zip(self._raw_tags, self._data_types):
+            tag, start, offset = Base.unpack_tlv(raw_value, offset)
+            if tag != raw_tag:
+                raise ValueError('all_data does not match the data set')
+            values.append(data_type._decode_value(bytes(raw_value[start:offset])))
+        if offset != len(raw_value):
+            raise ValueError('all_data does not match the data set')
+        return tuple(values)
+
+    @property
+    def data_types(self) -> Tuple[type, ...]:
+        return self._data_types
+
+    @property
+    def fixed(self) -> bool:
+        """Whether the value field is decoded by a single `Struct`."""
+        return self._decoder is not None
+
+
+CACHED_CODECS = 1024  # the most recently compiled codecs, shared by `compile_codec`
+
+
+def compile_codec(data_types: Sequence[type], lengths: Optional[Sequence[int]] = None) -> DataSetCodec:
+    """Return the codec of `data_types` (and `lengths`, see `DataSetCodec`), compiled once, then shared.
+
+    Only the last `CACHED_CODECS` used layouts are kept, the others are compiled again when needed.
+    """
+    return _compile_codec(tuple(data_types), None if lengths is None else tuple(lengths))
+
+
+@lru_cache(maxsize=CACHED_CODECS)
+def _compile_codec(data_types: Tuple[type, ...], lengths: Optional[Tuple[int, ...]]) -> DataSetCodec:
+    return DataSetCodec(data_types, lengths)
+
+
+def layout_of(raw_value: Union[bytes, memoryview]) -> Tuple[Tuple[type, ...], Tuple[int, ...]]:
+    """The type, and the length of the value field, of each member of the value field of an `AllData`.
+
+    Raises:
+        ValueError: If a member type is not supported by `AllData`.
+    """
+    spans = Base.index_tlv(raw_value)
+    return (tuple(AllData._data_type(tag, end - start) for tag, start, end in spans),
+            tuple(end - start for _, start, end in spans))
+
+
+class Codecs:
+    """The data set codec of each GOOSE control block, by gocbRef and confRev, shared by every `Subscriber`.
+
+    As the data set of a control block only changes along with its confRev, its codec is learned
+    from the first `AllData` received, then reused for every frame after.
+    """
+
+    def __init__(self) -> None:
+        self._codecs: Dict[Tuple[str, int], DataSetCodec] = {}
+
+    def __len__(self) -> int:
+        return len(self._codecs)
+
+    def get(self, control_block_reference: str, configuration_revision: int) -> Optional[DataSetCodec]:
+        """Return the codec of the control block, `None` if unknown."""
+        return self._codecs.get((control_block_reference, configuration_revision))
+
+    def add(self, control_block_reference: str, configuration_revision: int, data_types: Sequence[type],
+            lengths: Optional[Sequence[int]] = None) -> DataSetCodec:
+        """Compile (see `compile_codec`) and keep the codec of the control block, replacing any other."""
+        codec = self._codecs[(control_block_reference, configuration_revision)] = compile_codec(data_types, lengths)
+        return codec
+
+    def learn(self, control_block_reference: str, configuration_revision: int,
+              raw_value: Union[bytes, memoryview]) -> DataSetCodec:
+        """Add the codec of the members of the value field of an `AllData`, see `layout_of`."""
+        return self.add(control_block_reference, configuration_revision, *layout_of(raw_value))
+
+    def decode_value(self, control_block_reference: str, configuration_revision: int,
+                     raw_value: Union[bytes, memoryview]) -> Tuple[Any, ...]:
+        """Decode the value field of an `AllData` of the control block, learning its codec if needed.
+
+        The codec is learned again if the members do not match it, e.g. an integer got longer,
+        thus most data sets are decoded by a single `Struct`, see `DataSetCodec`.
+
+        Raises:
+            ValueError: If a member type is not supported by `AllData`.
+        """
+        codec = self.get(control_block_reference, configuration_revision)
+        if codec is not None:
+            try:
+                return codec.decode_value(raw_value)
+            except ValueError:
+                pass
+        return self.learn(control_block_reference, configuration_revision, raw_value).decode_value(raw_value)
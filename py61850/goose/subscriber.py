@@ -0,0 +1,185 @@
+from typing import Any, Callable, Dict, Optional, Tuple, TYPE_CHECKING, Union
+
+from py61850.goose.frame import Frame
+from py61850.goose.pdu import ConfigurationRevision, GooseControlBlockReference, SequenceNumber, StatusNumber
+from py61850.goose.pdu import TimeAllowedToLive
+from py61850.goose.schema import Codecs
+from py61850.types.base import Base
+
+if TYPE_CHECKING:
+    from py61850.goose.supervision import Supervisor
+
+# the PDU fields tracked by the subscriber, by tag (Table 56, 61850-8-1)
+REFERENCE, TIME_ALLOWED_TO_LIVE, STATUS, SEQUENCE, REVISION, ALL_DATA = 0x80, 0x81, 0x85, 0x86, 0x88, 0xAB
+TRACKED = (REFERENCE, TIME_ALLOWED_TO_LIVE, STATUS, SEQUENCE, REVISION, ALL_DATA)
+
+
+class Stream:
+    """The last state received from a GOOSE control block.
+
+    Attributes:
+        app_id: The APPID of the frames.
+        control_block_reference: The gocbRef of the PDU.
+        status_number: The last stNum.
+        sequence_number: The last sqNum.
+        configuration_revision: The last confRev.
+        time_allowed_to_live: The last time allowed to live, in milliseconds.
+        raw_all_data: The encoded value field of the last `AllData`.
+        all_data: The decoded values of `raw_all_data`, e.g. `(True, 'Okay')`.
+        expired: Whether the stream went silent for longer than its time allowed to live, see `Supervisor`.
+    """
+
+    __slots__ = ('app_id', 'control_block_reference', 'status_number', 'sequence_number', 'configuration_revision',
+                 'time_allowed_to_live', 'raw_all_data', 'all_data', 'expired')
+
+    def __init__(self, app_id: int, control_block_reference: str) -> None:
+        self.app_id = app_id
+        self.control_block_reference = control_block_reference
+        self.status_number = None
+        self.sequence_number = None
+        self.configuration_revision = None
+        self.time_allowed_to_live = None
+        self.raw_all_data = None
+        self.all_data = None
+        self.expired = False
+
+
+class Subscriber:
+    """Track the state of every received GOOSE stream, by APPID and gocbRef, decoding only what changed.
+
+    Most frames are retransmissions, where only sqNum (and maybe the time allowed to live) moved,
+    thus `AllData` is only decoded when its encoding differs from the last one,
+    and the callbacks are only called on real changes.
+
+    Args:
+        on_change: Called with the stream, once its `all_data` changed (or on its first frame).
+        on_gap: Called with the stream, and the stNum and sqNum expected instead of the received ones,
+            e.g. after a lost frame or a publisher restart.
+        on_revision: Called with the stream, and the previous confRev, once it changed.
+        supervisor: Refreshed with the stream on each frame, see `supervision.Supervisor`.
+        codecs: The data set codecs, by gocbRef and confRev, possibly shared with other subscribers,
+            defaults to codecs of its own, see `schema.Codecs`.
+    """
+
+    def __init__(self, on_change: Optional[Callable[[Stream], Any]] = None,
+                 on_gap: Optional[Callable[[Stream, int, int], Any]] = None,
+                 on_revision: Optional[Callable[[Stream, int], Any]] = None,
+                 supervisor: Optional['Supervisor'] = None, codecs: Optional[Codecs] = None) -> None:
+        self._supervisor = supervisor
+        self._codecs = Codecs() if codecs is None else codecs
+        self._on_change = on_change
+        self._on_gap = on_gap
+        self._on_revision = on_revision
+        self._streams: Dict[Tuple[int, bytes], Stream] = {}
+        self._decoded = 0
+        self._skipped = 0
+
+    def receive(self, frame: Union[bytes, bytearray, memoryview]) -> Stream:
+        """Update the stream of `frame`, calling back on any change, then return it.
+
+        Raises:
+            ValueError: If `frame` is not a (supported) GOOSE frame.
+        """
+        view = memoryview(frame)
+        _, app_id, offset = Frame.unpack_header(view)
+        offsets = self._index(view, offset)
+        raw_reference = bytes(view[offsets[REFERENCE][1]:offsets[REFERENCE][2]])
+        stream = self._streams.get((app_id, raw_reference))
+        if stream is None:
+            reference = GooseControlBlockReference.decode(view, offsets[REFERENCE][0])[0]
+            stream = self._streams[(app_id, raw_reference)] = Stream(app_id, reference)
+        self._update(stream, view, offsets)
+        if self._supervisor is not None:
+            self._supervisor.refresh(stream)
+        return stream
+
+    def stream(self, app_id: int, control_block_reference: str) -> Optional[Stream]:
+        """Return the stream of `control_block_reference` sent with `app_id`, `None` if never received."""
+        return self._streams.get((app_id, control_block_reference.encode('utf8')))
+
+    @staticmethod
+    def _index(view: memoryview, offset: int) -> Dict[int, Tuple[int, int, int]]:
+        # the tag, start and end offsets of each tracked field, without decoding any of them
+        tag, offset, end = Base.unpack_tlv(view, offset)
+        if tag != 0x61:
+            raise ValueError('frame does not carry a GOOSE PDU')
+        offsets = {}
+        while offset < end:
+            tag, start, stop = Base.unpack_tlv(view, offset)
+            if tag in TRACKED:
+                offsets[tag] = (offset, start, stop)
+            offset = stop
+        if len(offsets) != len(TRACKED):
+            raise ValueError(f'{Subscriber.__name__} is missing a mandatory field')
+        return offsets
+
+    def _update(self, stream: Stream, view: memoryview, offsets: Dict[int, Tuple[int, int, int]]) -> None:
+        # decode every field first, so the stream is left as it was if any of them is malformed
+        status_number = StatusNumber.decode(view, offsets[STATUS][0])[0]
+        sequence_number = SequenceNumber.decode(view, offsets[SEQUENCE][0])[0]
+        revision = ConfigurationRevision.decode(view, offsets[REVISION][0])[0]
+        time_allowed_to_live = TimeAllowedToLive.decode(view, offsets[TIME_ALLOWED_TO_LIVE][0])[0]
+        previous_revision = stream.configuration_revision
+        all_data = self._decode_all_data(stream, view, offsets[ALL_DATA], revision, previous_revision != revision)
+
+        expected = self._expected(stream, status_number)
+        stream.status_number, stream.sequence_number = status_number, sequence_number
+        stream.configuration_revision = revision
+        stream.time_allowed_to_live = time_allowed_to_live
+        if all_data is not None:
+            stream.raw_all_data, stream.all_data = all_data
+
+        if previous_revision is not None and previous_revision != revision and self._on_revision is not None:
+            self._on_revision(stream, previous_revision)
+        if expected is not None and expected != (status_number, sequence_number) and self._on_gap is not None:
+            self._on_gap(stream, *expected)
+        if all_data is not None and self._on_change is not None:
+            self._on_change(stream)
+
+    def _decode_all_data(self, stream: Stream, view: memoryview, span: Tuple[int, int, int], revision: int,
+                         revised: bool) -> Optional[Tuple[bytes, Tuple[Any, ...]]]:
+        # decode `AllData` only if its encoding differs, or if the data set may have been rearranged,
+        # return its encoded and decoded value fields, `None` if unchanged
+        raw_all_data = view[span[1]:span[2]]
+        if not revised and raw_all_data == stream.raw_all_data:
+            self._skipped += 1
+            return None
+        raw_all_data = bytes(raw_all_data)
+        all_data = self._codecs.decode_value(stream.control_block_reference, revision, raw_all_data)
+        self._decoded += 1
+        return raw_all_data, all_data
+
+    @staticmethod
+    def _expected(stream: Stream, status_number: int) -> Optional[Tuple[int, int]]:
+        # the stNum and sqNum expected next, `None` if nothing was received yet
+        if stream.status_number is None:
+            return None
+        return expected_numbers(stream.status_number, stream.sequence_number, status_number)
+
+    @property
+    def streams(self) -> Tuple[Stream, ...]:
+        return tuple(self._streams.values())
+
+    @property
+    def decoded(self) -> int:
+        """How many times `AllData` was decoded."""
+        return self._decoded
+
+    @property
+    def skipped(self) -> int:
+        """How many times decoding `AllData` was skipped, as it did not change."""
+        return self._skipped
+
+
+def expected_numbers(status_number: int, sequence_number: int, received_status_number: int) -> Tuple[int, int]:
+    """Return the stNum and sqNum expected after `status_number` and `sequence_number`, given the received stNum.
+
+    Both roll over to 1, as 0 is reserved (see `StatusNumber` and `SequenceNumber`).
+    """
+    if received_status_number == status_number:
+        return status_number, _next(sequence_number)
+    return _next(status_number), 0
+
+
+def _next(number: int) -> int:
+    return 1 if number == 0xFFFFFFFF else number + 1
@@ -0,0 +1,63 @@
+from time import perf_counter
+from typing import Any, Callable, Optional, Tuple
+
+from py61850.goose.subscriber import Stream
+from py61850.utils.timing_wheel import TimingWheel
+
+
+class Supervisor:
+    """Detect the subscribed streams gone silent, i.e. not refreshed within their time allowed to live.
+
+    Each stream has a single deadline within a `TimingWheel`, moved on each received frame,
+    thus refreshing and expiring a stream are O(1), whatever the number of streams.
+    Once expired, the `expired` flag of the stream is set, until refreshed again.
+
+    Args:
+        on_timeout: Called with each expired stream.
+        resolution: The seconds of each tick, i.e. how late a timeout may be detected.
+        slots: How many ticks a turn of the wheel has.
+        clock: Returns the current time, in seconds.
+
+    Raises:
+        ValueError: If `resolution` or `slots` are out of the supported range.
+    """
+
+    def __init__(self, on_timeout: Optional[Callable[[Stream], Any]] = None, resolution: float = 0.001,
+                 slots: int = 1024, clock: Callable[[], float] = perf_counter) -> None:
+        self._wheel = TimingWheel(clock(), resolution, slots)
+        self._on_timeout = on_timeout
+        self._clock = clock
+
+    def refresh(self, stream: Stream, now: Optional[float] = None) -> None:
+        """Restart the time allowed to live of `stream`, from `now` (defaults to the clock)."""
+        stream.expired = False
+        self._wheel.schedule(stream, (self._clock() if now is None else now) + stream.time_allowed_to_live / 1000)
+
+    def remove(self, stream: Stream) -> None:
+        """Stop supervising `stream`, if supervised."""
+        if stream in self._wheel:
+            self._wheel.cancel(stream)
+
+    def check(self, now: Optional[float] = None) -> Tuple[Stream, ...]:
+        """Flag every stream expired up to `now` (defaults to the clock), calling back for each one.
+
+        Returns:
+            The expired streams.
+        """
+        expired = []
+        for _, stream in self._wheel.expire(self._clock() if now is None else now):
+            stream.expired = True
+            expired.append(stream)
+            if self._on_timeout is not None:
+                self._on_timeout(stream)
+        return tuple(expired)
+
+    @property
+    def streams(self) -> int:
+        """How many streams are supervised, i.e. not expired."""
+        return len(self._wheel)
+
+    @property
+    def next_deadline(self) -> Optional[float]:
+        """When the earliest stream expires, `None` if there is none."""
+        return self._wheel.next_deadline
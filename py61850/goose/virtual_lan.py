@@ -1,4 +1,4 @@
-from struct import pack as s_pack
+from py61850.utils.codec import UINT16
 from py61850.utils.numbers import U12
 
 GOOSE_ETHER_TYPE = b'\x88\xb8'
@@ -24,7 +24,7 @@ class VirtualLAN:
     def __bytes__(self):
         prio_dei = self._priority << 1  # add the DPI bit (which is always 0)
         vlan_data = (prio_dei << 12) + self._vid
-        return s_pack('!H', vlan_data) + self._ether_type
+        return UINT16.pack(vlan_data) + self._ether_type
 
     @property
     def priority(self):
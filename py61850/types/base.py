@@ -1,11 +1,12 @@
 from abc import ABC
-from typing import Any, Optional, Tuple, Union
-from struct import pack as s_pack
+from typing import Any, Dict, Optional, Tuple, Union
 
+from py61850.utils.codec import BER_LENGTH, UINT16
 from py61850.utils.errors import raise_type
 
 
 class Generic(ABC):
+    __slots__ = ()
 
     def _parse(self, anything: Any) -> Tuple[Optional[bytes], Any]:
 
@@ -43,6 +44,12 @@ class Base(Generic, ABC):
     Thus, the `Base` expects the already encoded value field, but handles
     the encoding/decoding of both tag and length field.
 
+    The class methods `encode` and `decode` do the same without building
+    any instance, e.g. `VisibleString.encode('arthur') == b'\x8A\x06arthur'`.
+
+    A `Base` holding other `Base` (e.g. `AllData`) is only marked dirty when any
+    of them changes, the new value field is encoded once, when next read.
+
     Args:
         raw_tag: The encoded tag field.
         raw_value: The encoded value field.
@@ -53,10 +60,15 @@ class Base(Generic, ABC):
         ValueError: If `raw_tag` length is different from 1.
     """
 
+    __slots__ = ('_parent', '_dirty', '_raw_tag', '_raw_length', '_raw_value', '_length', '_value')
+
+    _RAW_TAG: Optional[bytes] = None  # the default tag of the subclass
+
     def __init__(self, raw_tag: bytes, raw_value: Optional[bytes] = None) -> None:
+        self._parent = None
+        self._dirty = False
         self._set_tag(raw_tag)
         self._set_raw_value(raw_value)
-        self._parent = None
 
     def __bytes__(self) -> bytes:
         """Return the encoded data, including all existing fields.
@@ -65,6 +77,8 @@ class Base(Generic, ABC):
 
         If value field is not `None`: return tag + length + value.
         """
+        if self._dirty:
+            self._refresh()
         if self._raw_value is None:
             return self._raw_tag + self._raw_length
         return self._raw_tag + self._raw_length + self._raw_value
@@ -89,10 +103,24 @@ class Base(Generic, ABC):
         self._parent = parent
 
     def _update(self, caller: 'Base'):
-        byte_stream = b''
-        for value in self._value:
-            byte_stream += bytes(value)
-        self._set_raw_value(byte_stream)
+        # a child changed, mark this and every ancestor as dirty
+        self._dirty = True
+        if self._parent is not None:
+            self._parent._update(self)
+
+    def _refresh(self) -> None:
+        # encode the value field again, from the already encoded children
+        self._dirty = False
+        self._store_raw_value(b''.join([bytes(value) for value in self._value]))
+
+    def _reencode(self) -> None:
+        # the encoding changed, not the value, thus every ancestor is only marked dirty, without being notified
+        if self._value is not None:
+            self._store_raw_value(self._encode(self._value))
+        parent = self._parent
+        while parent is not None:
+            parent._dirty = True
+            parent = parent._parent
 
     def _set_tag(self, raw_tag: bytes) -> None:
         # assert `raw_tag` is `bytes` and has length of 1, then set `raw_tag` and `tag`
@@ -101,8 +129,6 @@ class Base(Generic, ABC):
         if len(raw_tag) != 1:
             raise ValueError('raw_tag out of supported length')
         self._raw_tag = raw_tag
-        # self._tag = raw_tag.hex()
-        self._tag = self.__class__.__name__
 
     @staticmethod
     def unpack_extra_value(value_a: Union[bytes, Tuple[bytes, Any]],
@@ -115,10 +141,115 @@ class Base(Generic, ABC):
             value_b, value_c = value_b
         return value_a, value_b, value_c
 
+    @classmethod
+    def encode(cls, value: Any, tag: Optional[bytes] = None) -> bytes:
+        """Encode `value` into tag + length + value, without building an instance.
+
+        Args:
+            value: The value to be encoded.
+            tag: The encoded tag field, defaults to the tag of the class.
+
+        Raises:
+            Same as the class constructor.
+        """
+        return cls.pack_tlv(cls._RAW_TAG if tag is None else tag, cls._encode_value(value))
+
+    @classmethod
+    def decode(cls, byte_stream: Union[bytes, memoryview], offset: int = 0,
+               tag: Optional[bytes] = None) -> Tuple[Any, int]:
+        """Decode the data found at `offset`, without building an instance.
+
+        Args:
+            byte_stream: The encoded data.
+            offset: Where the tag field starts.
+            tag: The expected tag field, defaults to the tag of the class.
+
+        Returns:
+            The decoded value, and the offset of whatever follows the data.
+
+        Raises:
+            ValueError: If the tag field is not the expected one.
+            Same as `unpack_tlv` and the class constructor.
+        """
+        raw_tag, start, end = cls.unpack_tlv(byte_stream, offset)
+        if raw_tag != (cls._RAW_TAG if tag is None else tag)[0]:
+            raise ValueError(f'tag {raw_tag:#04x} not supported by {cls.__name__}')
+        return cls._decode_value(bytes(byte_stream[start:end])), end
+
+    @classmethod
+    def _encode_value(cls, value: Any) -> Optional[bytes]:
+        # encode the value field using the class defaults, subclasses with per instance settings override it
+        return cls._encode(value)
+
+    @classmethod
+    def _decode_value(cls, raw_value: bytes) -> Any:
+        # decode the value field using the class defaults, subclasses with per instance settings override it
+        return cls._decode(raw_value)
+
+    @staticmethod
+    def pack_tlv(raw_tag: bytes, raw_value: Optional[bytes]) -> bytes:
+        """Join the tag, the length and the value fields, according to ASN.1 BER."""
+        if raw_value is None:
+            return raw_tag + b'\x00'
+        return raw_tag + Base.pack_length(len(raw_value)) + raw_value
+
+    @staticmethod
+    def unpack_tlv(byte_stream: Union[bytes, memoryview], offset: int = 0) -> Tuple[int, int, int]:
+        """Decode the tag and length fields found at `offset`, according to ASN.1 BER.
+
+        Nothing is copied from `byte_stream`, only offsets are returned,
+        so a whole frame can be walked through a single `memoryview`.
+
+        Args:
+            byte_stream: The encoded data.
+            offset: Where the tag field starts.
+
+        Returns:
+            The tag, and both the start and the end offsets of the value field.
+
+        Raises:
+            ValueError: If the length field is not supported, or if `byte_stream` is too short.
+        """
+        try:
+            tag = byte_stream[offset]
+            length = byte_stream[offset + 1]
+            start = offset + 2
+            if length == 0x81:
+                length = byte_stream[start]
+                start += 1
+            elif length == 0x82:
+                length = (byte_stream[start] << 8) + byte_stream[start + 1]
+                start += 2
+            elif length >= 0x80:
+                raise ValueError('raw_length out of supported range')
+        except IndexError:
+            raise ValueError('byte_stream out of supported length')
+        end = start + length
+        if end > len(byte_stream):
+            raise ValueError('byte_stream out of supported length')
+        return tag, start, end
+
+    @staticmethod
+    def index_tlv(byte_stream: Union[bytes, memoryview]) -> Tuple[Tuple[int, int, int], ...]:
+        """Decode the tag and length fields of every data found in `byte_stream`.
+
+        Returns:
+            The tag, and both the start and the end offsets of the value field, for each data.
+
+        Raises:
+            ValueError: Same as `unpack_tlv`.
+        """
+        spans, offset = [], 0
+        while offset < len(byte_stream):
+            span = Base.unpack_tlv(byte_stream, offset)
+            spans.append(span)
+            offset = span[2]
+        return tuple(spans)
+
     @property
     def tag(self) -> str:
         """The class name."""
-        return self._tag
+        return self.__class__.__name__
 
     @property
     def raw_tag(self) -> bytes:
@@ -126,6 +257,12 @@ class Base(Generic, ABC):
         return self._raw_tag
 
     def _set_length(self, length: int) -> None:
+        """Set the length field. See `pack_length`."""
+        self._raw_length = self.pack_length(length)
+        self._length = length
+
+    @staticmethod
+    def pack_length(length: int) -> bytes:
         """Encode length according to ASN.1 BER.
 
         `raw_length` will be of 1 byte long if < 128.
@@ -144,19 +281,17 @@ class Base(Generic, ABC):
         """
         # NOTE enable extra_length > 2?
         # NOTE indefinite length?
-        if 0 <= length < 0x80:
-            self._raw_length = s_pack('!B', length)
-        elif 0x80 <= length <= 0xFF:
-            self._raw_length = s_pack('!BB', 0x81, length)
+        if 0 <= length <= 0xFF:
+            return BER_LENGTH[length]
         elif 0xFF < length <= 0xFFFF:
-            self._raw_length = s_pack('!BH', 0x82, length)
-        else:
-            raise ValueError(f'data length greater than {0xFFFF}')
-        self._length = length
+            return b'\x82' + UINT16.pack(length)
+        raise ValueError(f'data length greater than {0xFFFF}')
 
     @property
     def raw_value(self) -> Optional[bytes]:
         """The encoded value field."""
+        if self._dirty:
+            self._refresh()
         return self._raw_value
 
     def _set_raw_value(self, raw_value: Optional[bytes]) -> None:
@@ -174,6 +309,12 @@ class Base(Generic, ABC):
             ValueError: If the length of `raw_value` is greater than `0xFFFF`.
             TypeError: If `raw_value` type is different from `bytes` and `NoneType`.
         """
+        self._store_raw_value(raw_value)
+        if self._parent is not None:
+            self._parent._update(self)
+
+    def _store_raw_value(self, raw_value: Optional[bytes]) -> None:
+        # same as `_set_raw_value`, without notifying the parent
         if raw_value is None:
             self._raw_value = raw_value
             self._set_length(0)
@@ -183,11 +324,6 @@ class Base(Generic, ABC):
             self._raw_value = raw_value
             self._set_length(len(raw_value))
 
-        try:
-            self._parent._update(self)
-        except AttributeError:
-            pass
-
     @property
     def raw_length(self):
         """The encoded length field.
@@ -195,11 +331,15 @@ class Base(Generic, ABC):
         Note:
             For the full data length, including the tag and length fields, use the `len` method.
         """
+        if self._dirty:
+            self._refresh()
         return self._raw_length
 
     @property
     def length(self):
         """The decoded length field"""
+        if self._dirty:
+            self._refresh()
         return self._length
 
     @property
@@ -212,3 +352,64 @@ class Base(Generic, ABC):
         raw_value = self._encode(value)
         self._set_raw_value(raw_value)
         self._value = value
+
+
+class Interned(Base, ABC):
+    """An immutable flavor of a `Base` subclass, with a single instance per distinct raw value.
+
+    It must come before the flavored type, e.g. `class InternedBoolean(Interned, Boolean)`.
+    Building it again with an already seen argument returns the cached instance,
+    neither encoding nor validating anything.
+    Only the raw values and the values are cached, thus the cache never outgrows the (small) domain of the type,
+    whatever else it is built from, e.g. `bool` for `InternedUnsigned`.
+
+    The same instance may be shared by many parents, thus it never keeps any of them.
+
+    Args:
+        anything: Same as the flavored type, either the value or the encoded value field.
+
+    Raises:
+        AttributeError: If the value is set.
+        Same as the flavored type.
+    """
+
+    __slots__ = ()
+
+    _instances: Dict[Tuple[type, Any], 'Interned'] = {}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._instances = {}
+
+    def __new__(cls, anything: Any) -> 'Interned':
+        try:
+            return cls._instances[(anything.__class__, anything)]
+        except KeyError:
+            pass
+        except TypeError:  # unhashable, let the flavored type handle it
+            pass
+        instance = super().__new__(cls)
+        instance._build(anything)
+        # a single instance per raw value, whatever it was built from
+        instance = cls._instances.setdefault((bytes, instance._raw_value), instance)
+        # only the decoded value itself is a key too, keeping the cache within the domain of the type
+        if anything.__class__ is instance._value.__class__:
+            cls._instances.setdefault((anything.__class__, anything), instance)
+        return instance
+
+    def __init__(self, anything: Any) -> None:
+        # already built by `__new__`
+        pass
+
+    def _build(self, anything: Any) -> None:
+        # build using the constructor of the flavored type
+        super(Interned, self).__init__(anything)
+
+    def set_parent(self, parent: Base) -> None:
+        if not isinstance(parent, Base):
+            raise_type('parent', Base, type(parent))
+
+    @property
+    def value(self) -> Any:
+        """The decoded value field, which cannot be set."""
+        return self._value
@@ -0,0 +1,43 @@
+from typing import Union
+
+from py61850.types.base import Base
+from py61850.utils.errors import raise_type
+
+
+class BitString(Base):
+    """A bit string, e.g. the quality of a data attribute, as a string of '0' and '1', first bit first.
+
+    The value field starts with the number of unused bits of its last byte, e.g. the 13 bits
+    of a quality are encoded as `b'\x03'` followed by 2 bytes.
+    """
+
+    __slots__ = ()
+
+    _RAW_TAG = b'\x84'
+
+    def __init__(self, anything: Union[str, bytes], raw_tag: bytes = b'\x84') -> None:
+        raw_value, value = self._parse(anything)
+        super().__init__(raw_tag=raw_tag, raw_value=raw_value)
+        self._value = value
+
+    @staticmethod
+    def _encode(value: str) -> bytes:
+        if not isinstance(value, str):
+            raise_type('value', str, type(value))
+        if value.strip('01'):
+            raise ValueError('value out of supported range')
+        unused = -len(value) % 8
+        length = (len(value) + unused) // 8
+        if length == 0:
+            return b'\x00'
+        return bytes((unused,)) + int(value + '0' * unused, 2).to_bytes(length, 'big')
+
+    @staticmethod
+    def _decode(raw_value: bytes) -> str:
+        if len(raw_value) == 0:
+            raise ValueError('raw_value out of supported length')
+        unused = raw_value[0]
+        if unused > 7 or (unused and len(raw_value) == 1):
+            raise ValueError('raw_value out of supported range')
+        bits = ''.join(f'{byte:08b}' for byte in raw_value[1:])
+        return bits[:len(bits) - unused]
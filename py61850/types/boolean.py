@@ -1,10 +1,13 @@
 from typing import Union
 
-from py61850.types.base import Base
+from py61850.types.base import Base, Interned
 from py61850.utils.errors import raise_type
 
 
 class Boolean(Base):
+    __slots__ = ()
+
+    _RAW_TAG = b'\x83'
 
     def __init__(self, anything: Union[bool, bytes], raw_tag: bytes = b'\x83') -> None:
         raw_value, value = self._parse(anything)
@@ -22,3 +25,9 @@ class Boolean(Base):
         if len(raw_value) != 1:
             raise ValueError('value out of supported length')
         return raw_value != b'\x00'
+
+
+class InternedBoolean(Interned, Boolean):
+    """An immutable `Boolean`, there are only two instances, see `Interned`."""
+
+    __slots__ = ()
@@ -1,37 +1,56 @@
-from struct import pack as s_pack, unpack as s_unpack
-from typing import Union
+from struct import Struct
+from typing import Tuple, Union
 
 from py61850.types.base import Base
+from py61850.utils.codec import FLOAT32, FLOAT64
 from py61850.utils.errors import raise_type
 
 
 class FloatingPoint(Base):
+    __slots__ = ('_precision',)
+
+    # exponent, struct, length and name of each precision, shared by every instance
+    _SINGLE = (b'\x08', FLOAT32, 5, 'SinglePrecision')
+    _DOUBLE = (b'\x11', FLOAT64, 9, 'DoublePrecision')
+
+    _RAW_TAG = b'\x87'
+    _PRECISION = None  # the precision of the subclass
+
     def __init__(self, anything: Union[float, bytes], double_precision: bool) -> None:
-        if double_precision:
-            self._exponent = b'\x11'
-            self._format = '!d'
-            self._length = 9
-            self._name = 'DoublePrecision'
-        else:
-            self._exponent = b'\x08'
-            self._format = '!f'
-            self._length = 5
-            self._name = 'SinglePrecision'
+        self._precision = self._DOUBLE if double_precision else self._SINGLE
         raw_value, value = self._parse(anything)
         super().__init__(raw_tag=b'\x87', raw_value=raw_value)
         self._value = value
 
     def _encode(self, value: float) -> bytes:
+        return self._encode_float(value, self._precision)
+
+    def _decode(self, raw_value: bytes) -> float:
+        return self._decode_float(raw_value, self._precision)
+
+    @classmethod
+    def _encode_value(cls, value: float) -> bytes:
+        return cls._encode_float(value, cls._PRECISION)
+
+    @classmethod
+    def _decode_value(cls, raw_value: bytes) -> float:
+        return cls._decode_float(raw_value, cls._PRECISION)
+
+    @staticmethod
+    def _encode_float(value: float, precision: Tuple[bytes, Struct, int, str]) -> bytes:
         if not isinstance(value, float):
             raise_type('value', float, type(value))
-        return self._exponent + s_pack(self._format, value)
+        exponent, struct, _, _ = precision
+        return exponent + struct.pack(value)
 
-    def _decode(self, raw_value: bytes) -> float:
-        if len(raw_value) != self._length:
-            raise ValueError(f'{self._name} floating point out of supported length')
-        if raw_value[0:1] != self._exponent:
-            raise ValueError(f"{self._name} floating point's exponent out of supported range")
-        return s_unpack(self._format, raw_value[1:self._length])[0]
+    @staticmethod
+    def _decode_float(raw_value: bytes, precision: Tuple[bytes, Struct, int, str]) -> float:
+        exponent, struct, length, name = precision
+        if len(raw_value) != length:
+            raise ValueError(f'{name} floating point out of supported length')
+        if raw_value[0:1] != exponent:
+            raise ValueError(f"{name} floating point's exponent out of supported range")
+        return struct.unpack_from(raw_value, 1)[0]
 
     @property
     def tag(self) -> str:
@@ -40,10 +59,18 @@ class FloatingPoint(Base):
 
 
 class SinglePrecision(FloatingPoint):
+    __slots__ = ()
+
+    _PRECISION = FloatingPoint._SINGLE
+
     def __init__(self, value: Union[float, bytes]) -> None:
         super().__init__(value, double_precision=False)
 
 
 class DoublePrecision(FloatingPoint):
+    __slots__ = ()
+
+    _PRECISION = FloatingPoint._DOUBLE
+
     def __init__(self, value: Union[float, bytes]) -> None:
         super().__init__(value, double_precision=True)
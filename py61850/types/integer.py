@@ -1,49 +1,64 @@
-from struct import pack as s_pack, unpack as s_unpack
 from typing import Union
 
-from py61850.types.base import Base
+from py61850.types.base import Base, Interned
+from py61850.utils.codec import INT8, INT16, INT32, INT64, UINT16, UINT32, UINT8_BYTES
 from py61850.utils.errors import raise_type
 
 
 class Unsigned(Base):
+    __slots__ = ('_min_range', '_max_range', '_fixed_length')
+
+    _RAW_TAG = b'\x86'
+    _MIN_RANGE = 0
+    _MAX_RANGE = 0xFFFFFFFF
+
     def __init__(self,
                  anything: Union[int, bytes], min_range: int = 0, max_range: int = 0xFFFFFFFF,
-                 raw_tag: bytes = b'\x86') -> None:
+                 raw_tag: bytes = b'\x86', fixed_length: bool = False) -> None:
         self._min_range = min_range
         self._max_range = max_range
+        self._fixed_length = fixed_length
         raw_value, value = self._parse(anything)
         super().__init__(raw_tag=raw_tag, raw_value=raw_value)
         self._value = value
 
     def _encode(self, value: int) -> bytes:
+        return self._encode_integer(value, self._min_range, self._max_range, self._fixed_length)
+
+    @classmethod
+    def _encode_value(cls, value: int) -> bytes:
+        return cls._encode_integer(value, cls._MIN_RANGE, cls._MAX_RANGE)
+
+    @staticmethod
+    def _encode_integer(value: int, min_range: int, max_range: int, fixed_length: bool = False) -> bytes:
         if not isinstance(value, int):
             raise_type('value', int, type(value))
         if value < 0:
             raise ValueError('Unsigned integer cannot be negative')
-        elif value <= 0xFF and self._min_range <= value <= self._max_range:
-            return s_pack('!B', value)
-        elif value <= 0xFFFF and self._min_range <= value <= self._max_range:
-            return s_pack('!H', value)
-        # elif value <= 0xFFFFFF and self._min_range <= value <= self._max_range:
+        elif value <= 0xFF and min_range <= value <= max_range and not fixed_length:
+            return UINT8_BYTES[value]
+        elif value <= 0xFFFF and min_range <= value <= max_range and not fixed_length:
+            return UINT16.pack(value)
+        # elif value <= 0xFFFFFF and min_range <= value <= max_range:
         #     # NOTE regular MMS does not have 24 bits unsigned int
         #     # NOTE 24 bits unsigned int seems to be used only for timestamp
-        #     return s_pack('!I', value)[1:]
-        elif value <= 0xFFFFFFFF and self._min_range <= value <= self._max_range:
-            return s_pack('!I', value)
+        #     return UINT32.pack(value)[1:]
+        elif value <= 0xFFFFFFFF and min_range <= value <= max_range:
+            return UINT32.pack(value)
         raise ValueError('Unsigned integer out of supported range')
 
     @staticmethod
     def _decode(raw_value: bytes) -> int:
         if len(raw_value) == 1:
-            return s_unpack('!B', raw_value)[0]
+            return raw_value[0]
         elif len(raw_value) == 2:
-            return s_unpack('!H', raw_value)[0]
+            return UINT16.unpack(raw_value)[0]
         # elif len(raw_value) == 3:
         #     # NOTE regular MMS does not have 24 bits unsigned int
         #     # NOTE 24 bits unsigned int seems to be used only for timestamp
-        #     return s_unpack('!I', b'\x00' + raw_value)[0]
+        #     return UINT32.unpack(b'\x00' + raw_value)[0]
         elif len(raw_value) == 4:
-            return s_unpack('!I', raw_value)[0]
+            return UINT32.unpack(raw_value)[0]
         raise ValueError('Unsigned integer out of supported range')
 
     @property
@@ -51,40 +66,90 @@ class Unsigned(Base):
         """The class name."""
         return self.__class__.__name__ + 'Integer'
 
+    @property
+    def fixed_length(self) -> bool:
+        """Whether the value field is always 4 bytes long, instead of the shortest length (61850-8-1 Ed2)."""
+        return self._fixed_length
+
+    @fixed_length.setter
+    def fixed_length(self, fixed_length: bool) -> None:
+        self._fixed_length = fixed_length
+        self._reencode()
+
+
+class InternedUnsigned(Interned, Unsigned):
+    """An immutable `Unsigned` of up to `0xFF`, there are at most 256 instances, see `Interned`."""
+
+    __slots__ = ()
+
+    _MAX_RANGE = 0xFF
+
+    def _build(self, anything: Union[int, bytes]) -> None:
+        Unsigned.__init__(self, anything, max_range=self._MAX_RANGE)
+        if self._value is not None and self._value > self._MAX_RANGE:
+            raise ValueError('Unsigned integer out of supported range')
+
+    @property
+    def fixed_length(self) -> bool:
+        """Always `False`, which cannot be set, as the instance may be shared."""
+        return False
+
 
 class Signed(Base):
-    def __init__(self, anything: Union[int, bytes]) -> None:
+    __slots__ = ('_fixed_length',)
+
+    _RAW_TAG = b'\x85'
+
+    def __init__(self, anything: Union[int, bytes], fixed_length: bool = False) -> None:
+        self._fixed_length = fixed_length
         raw_value, value = self._parse(anything)
         super().__init__(raw_tag=b'\x85', raw_value=raw_value)
         self._value = value
 
+    def _encode(self, value: int) -> bytes:
+        return self._encode_integer(value, self._fixed_length)
+
+    @classmethod
+    def _encode_value(cls, value: int) -> bytes:
+        return cls._encode_integer(value)
+
     @staticmethod
-    def _encode(value: int) -> bytes:
+    def _encode_integer(value: int, fixed_length: bool = False) -> bytes:
         if not isinstance(value, int):
             raise_type('value', int, type(value))
-        if -0x80 <= value < 0x80:
-            return s_pack('!b', value)
-        elif -0x8000 <= value < 0x8000:
-            return s_pack('!h', value)
+        if -0x80 <= value < 0x80 and not fixed_length:
+            return UINT8_BYTES[value & 0xFF]
+        elif -0x8000 <= value < 0x8000 and not fixed_length:
+            return INT16.pack(value)
         elif -0x80000000 <= value < 0x80000000:
-            return s_pack('!i', value)
+            return INT32.pack(value)
         elif -0x80 ** 0x9 <= value < 0x80 ** 0x9:  # NOTE change support from 64 to 128?
-            return s_pack('!q', value)
+            return INT64.pack(value)
         raise ValueError('Signed integer out of supported range')
 
     @staticmethod
     def _decode(raw_value: bytes) -> int:
         if len(raw_value) == 1:
-            return s_unpack('!b', raw_value)[0]
+            return INT8.unpack(raw_value)[0]
         elif len(raw_value) == 2:
-            return s_unpack('!h', raw_value)[0]
+            return INT16.unpack(raw_value)[0]
         elif len(raw_value) == 4:
-            return s_unpack('!i', raw_value)[0]
+            return INT32.unpack(raw_value)[0]
         elif len(raw_value) == 8:
-            return s_unpack('!q', raw_value)[0]
+            return INT64.unpack(raw_value)[0]
         raise ValueError('Signed integer out of supported range')
 
     @property
     def tag(self) -> str:
         """The class name."""
         return self.__class__.__name__ + 'Integer'
+
+    @property
+    def fixed_length(self) -> bool:
+        """Whether the value field is always 4 bytes long (8 beyond 32 bits), instead of the shortest length."""
+        return self._fixed_length
+
+    @fixed_length.setter
+    def fixed_length(self, fixed_length: bool) -> None:
+        self._fixed_length = fixed_length
+        self._reencode()
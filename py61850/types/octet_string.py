@@ -0,0 +1,29 @@
+from typing import Optional
+
+from py61850.types.base import Base
+from py61850.utils.errors import raise_type
+
+
+class OctetString(Base):
+    """An octet string, its value is the value field itself."""
+
+    __slots__ = ()
+
+    _RAW_TAG = b'\x89'
+
+    def __init__(self, anything: Optional[bytes] = None, raw_tag: bytes = b'\x89') -> None:
+        raw_value, value = self._parse(anything)
+        super().__init__(raw_tag=raw_tag, raw_value=raw_value)
+        self._value = value
+
+    @staticmethod
+    def _encode(value: Optional[bytes]) -> Optional[bytes]:
+        if value is None:
+            return None
+        if not isinstance(value, bytes):
+            raise_type('value', bytes, type(value))
+        return value or None
+
+    @staticmethod
+    def _decode(raw_value: bytes) -> Optional[bytes]:
+        return raw_value or None
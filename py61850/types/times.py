@@ -1,45 +1,73 @@
-from struct import pack as s_pack, unpack as s_unpack
-from typing import Optional, Tuple, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 from py61850.types.base import Base, Generic
+from py61850.utils.codec import QUALITY, UINT32, UINT8_BYTES
 from py61850.utils.errors import raise_type
 
 
 class Quality(Generic):
-    def __init__(self, leap_seconds_known: bool = False, clock_failure: bool = False,
-                 clock_not_synchronized: bool = True, time_accuracy: int = 0, raw_value: Optional[bytes] = None):
+    """The time quality, immutable, with a single instance per each of its 256 encodings.
+
+    Args:
+        leap_seconds_known: The leap seconds known flag.
+        clock_failure: The clock failure flag.
+        clock_not_synchronized: The clock not synchronized flag.
+        time_accuracy: The number of significant bits of the fraction of second, `0x1F` if unspecified.
+        raw_value: The encoded quality, if given, the other arguments are ignored.
+
+    Raises:
+        TypeError: If any argument is not of its type.
+        ValueError: If `time_accuracy`, or `raw_value`, is out of the supported range.
+    """
+
+    __slots__ = ('_raw_value', '_leap_seconds', '_clock_failure', '_clock_not_sync', '_accuracy')
+
+    _instances: Dict[bytes, 'Quality'] = {}
+
+    def __new__(cls, leap_seconds_known: bool = False, clock_failure: bool = False,
+                clock_not_synchronized: bool = True, time_accuracy: int = 0, raw_value: Optional[bytes] = None):
         if raw_value is None:
-            raw_value = self._encode((leap_seconds_known, clock_failure, clock_not_synchronized, time_accuracy))
-        else:
-            leap_seconds_known, clock_failure, clock_not_synchronized, time_accuracy = self._decode(raw_value)
-        self._raw_value = raw_value
-        self._leap_seconds = leap_seconds_known
-        self._clock_failure = clock_failure
-        self._clock_not_sync = clock_not_synchronized
-        self._accuracy = time_accuracy
+            raw_value = cls._encode((leap_seconds_known, clock_failure, clock_not_synchronized, time_accuracy))
+        try:
+            return cls._instances[raw_value]
+        except (KeyError, TypeError):
+            pass
+        leap_seconds_known, clock_failure, clock_not_synchronized, time_accuracy = cls._decode(raw_value)
+        instance = super().__new__(cls)
+        instance._raw_value = raw_value
+        instance._leap_seconds = leap_seconds_known
+        instance._clock_failure = clock_failure
+        instance._clock_not_sync = clock_not_synchronized
+        instance._accuracy = time_accuracy
+        return cls._instances.setdefault(raw_value, instance)
 
     def __bytes__(self):
         return self._raw_value
 
-    def _decode(self, raw_value: bytes) -> Tuple[bool, bool, bool, int]:
+    @classmethod
+    def encode(cls, value: Tuple[bool, bool, bool, int]) -> bytes:
+        """Encode leap seconds known, clock failure, clock not synchronized and time accuracy, into 1 byte."""
+        return cls._encode(value)
+
+    @classmethod
+    def decode(cls, byte_stream: Union[bytes, memoryview], offset: int = 0) -> Tuple[Tuple[bool, bool, bool, int], int]:
+        """Decode the byte found at `offset`, returning the decoded value and the offset of whatever follows."""
+        return cls._decode(bytes(byte_stream[offset:offset + 1])), offset + 1
+
+    @staticmethod
+    def _decode(raw_value: bytes) -> Tuple[bool, bool, bool, int]:
         if not isinstance(raw_value, bytes):
             raise_type('raw_value', bytes, type(raw_value))
         if len(raw_value) != 1:
             raise ValueError('raw_value out of supported length')
 
-        bits = s_unpack('!B', raw_value)[0]
-
-        time_accuracy = bits & 0x1F
-        if time_accuracy > 24 and time_accuracy != 0x1F:
+        value = QUALITY[raw_value[0]]
+        if value is None:
             raise ValueError('bits out of supported range')
+        return value
 
-        leap_seconds_known = (bits & 0x80) == 0x80
-        clock_failure = (bits & 0x40) == 0x40
-        clock_not_synchronized = (bits & 0x20) == 0x20
-
-        return leap_seconds_known, clock_failure, clock_not_synchronized, time_accuracy
-
-    def _encode(self, value: Tuple[bool, bool, bool, int]) -> bytes:
+    @staticmethod
+    def _encode(value: Tuple[bool, bool, bool, int]) -> bytes:
         leap_seconds_known, clock_failure, clock_not_synchronized, time_accuracy = value
         if not isinstance(leap_seconds_known, bool):
             raise_type('leap_seconds_known', bool, type(leap_seconds_known))
@@ -50,14 +78,12 @@ class Quality(Generic):
         if not isinstance(time_accuracy, int):
             raise_type('time_accuracy', int, type(time_accuracy))
 
-        if 0 <= time_accuracy <= 24 or time_accuracy == 0x1F:
-            self._accuracy = time_accuracy
-        else:
+        if not (0 <= time_accuracy <= 24 or time_accuracy == 0x1F):
             raise ValueError('time_accuracy out of supported range')
 
         bits = (leap_seconds_known << 7) + (clock_failure << 6) + \
                (clock_not_synchronized << 5) + time_accuracy
-        return s_pack('!B', bits)
+        return UINT8_BYTES[bits]
 
     @property
     def leap_seconds_known(self):
@@ -77,6 +103,9 @@ class Quality(Generic):
 
 
 class Timestamp(Base):
+    __slots__ = ('_quality',)
+
+    _RAW_TAG = b'\x91'
 
     # UTC Time
     def __init__(self, anything: Union[float, bytes], quality: Optional[Quality] = None, raw_tag: bytes = b'\x91'):
@@ -95,18 +124,22 @@ class Timestamp(Base):
             raise_type('quality', Quality, type(quality))
 
         seconds, fraction = map(int, str(value).split('.'))
-        byte_stream = s_pack('!I', seconds)
-        byte_stream += s_pack('!I', fraction)[1:]
+        byte_stream = UINT32.pack(seconds)
+        byte_stream += UINT32.pack(fraction)[1:]
         return byte_stream + bytes(quality)
 
+    @classmethod
+    def _decode_value(cls, raw_value: bytes) -> Tuple[float, Quality]:
+        return cls._decode((raw_value, None))
+
     @staticmethod
-    def _decode(raw_value: bytes) -> Tuple[float, Quality]:
+    def _decode(raw_value: Tuple[bytes, Any]) -> Tuple[float, Quality]:
         raw_value, _ = raw_value
         if len(raw_value) != 8:
             raise ValueError('raw_value out of supported length')
-        seconds = s_unpack('!I', raw_value[:4])[0]
+        seconds = UINT32.unpack_from(raw_value)[0]
         # TODO Fraction seems to be wrong
-        fraction = s_unpack('!I', b'\x00' + raw_value[4:7])[0]
+        fraction = UINT32.unpack(b'\x00' + raw_value[4:7])[0]
         quality = Quality(raw_value=raw_value[7:8])
         return float(str(f'{seconds}.{fraction}')), quality
 
@@ -5,6 +5,10 @@ from py61850.utils.errors import raise_type
 
 
 class VisibleString(Base):
+    __slots__ = ('_max_length',)
+
+    _RAW_TAG = b'\x8A'
+    _MAX_LENGTH = 0xFF
 
     def __init__(self, anything: Optional[Union[str, bytes]] = None,
                  max_length: int = 0xFF, raw_tag: bytes = b'\x8A') -> None:
@@ -14,19 +18,35 @@ class VisibleString(Base):
         self._value = value
 
     def _encode(self, value: Optional[str]) -> Optional[bytes]:
+        return self._encode_string(value, self._max_length)
+
+    def _decode(self, raw_value: bytes) -> Optional[str]:
+        return self._decode_string(raw_value, self._max_length)
+
+    @classmethod
+    def _encode_value(cls, value: Optional[str]) -> Optional[bytes]:
+        return cls._encode_string(value, cls._MAX_LENGTH)
+
+    @classmethod
+    def _decode_value(cls, raw_value: bytes) -> Optional[str]:
+        return cls._decode_string(raw_value, cls._MAX_LENGTH)
+
+    @staticmethod
+    def _encode_string(value: Optional[str], max_length: int) -> Optional[bytes]:
         if value is None:
             return None
         if not isinstance(value, str):
             raise_type('value', str, type(value))
         if len(value) == 0:
             return None
-        elif 0 < len(value) <= self._max_length:
+        elif 0 < len(value) <= max_length:
             return value.encode('utf8')
         raise ValueError('value out of supported length')
 
-    def _decode(self, raw_value: bytes) -> Optional[str]:
+    @staticmethod
+    def _decode_string(raw_value: bytes, max_length: int) -> Optional[str]:
         if len(raw_value) == 0:
             return None
-        if 0 < len(raw_value) <= self._max_length:
+        if 0 < len(raw_value) <= max_length:
             return raw_value.decode('utf8')
         raise ValueError('raw_value out of supported length')
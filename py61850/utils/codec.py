@@ -0,0 +1,33 @@
+from struct import Struct
+from typing import Optional, Tuple
+
+# precompiled structs, big-endian (network order)
+INT8 = Struct('!b')
+UINT8 = Struct('!B')
+INT16 = Struct('!h')
+UINT16 = Struct('!H')
+UINT16_PAIR = Struct('!HH')
+INT32 = Struct('!i')
+UINT32 = Struct('!I')
+INT64 = Struct('!q')
+UINT64 = Struct('!Q')
+FLOAT32 = Struct('!f')
+FLOAT64 = Struct('!d')
+
+# UINT8_BYTES[n] == UINT8.pack(n), for 0 <= n <= 0xFF
+UINT8_BYTES = tuple(UINT8.pack(byte) for byte in range(0x100))
+
+# BER_LENGTH[n] == Base.pack_length(n), for 0 <= n <= 0xFF
+BER_LENGTH = tuple(UINT8_BYTES[length] if length < 0x80 else b'\x81' + UINT8_BYTES[length] for length in range(0x100))
+
+
+def _quality(bits: int) -> Optional[Tuple[bool, bool, bool, int]]:
+    time_accuracy = bits & 0x1F
+    if time_accuracy > 24 and time_accuracy != 0x1F:
+        return None
+    return (bits & 0x80) == 0x80, (bits & 0x40) == 0x40, (bits & 0x20) == 0x20, time_accuracy
+
+
+# QUALITY[n] == (leap seconds known, clock failure, clock not synchronized, time accuracy) of the byte n,
+# `None` if its time accuracy is out of the supported range
+QUALITY = tuple(_quality(bits) for bits in range(0x100))
@@ -1,12 +1,11 @@
-from struct import pack as s_pack
-
+from py61850.utils.codec import UINT16
 from py61850.utils.errors import raise_type
 
 
 def int_u16(integer: int, min_range: int = 0, max_range: int = 0xFFFF) -> bytes:
     if isinstance(integer, int):
         if min_range <= integer <= max_range:
-            return s_pack('!H', integer)
+            return UINT16.pack(integer)
         raise ValueError('integer out of supported range')
     raise_type('integer', int, type(integer))
 
@@ -0,0 +1,143 @@
+from math import ceil, floor
+from operator import itemgetter
+from typing import Dict, Hashable, Iterator, List, Optional, Tuple
+
+
+class TimingWheel:
+    """The deadlines of many keys, within a hashed timing wheel.
+
+    Each deadline is rounded up to a tick of `resolution` seconds, and kept in the slot
+    `tick % slots` of the wheel, thus scheduling, moving and expiring a deadline are O(1);
+    deadlines further than a whole turn are only looked at once per turn.
+    A moved or cancelled deadline is left within its slot, then dropped once reached.
+
+    Args:
+        start: The time of the first tick, in seconds.
+        resolution: The seconds of each tick.
+        slots: How many ticks a turn of the wheel has.
+
+    Raises:
+        ValueError: If `resolution` or `slots` are out of the supported range.
+    """
+
+    __slots__ = ('_start', '_resolution', '_tick', '_wheel', '_deadlines')
+
+    def __init__(self, start: float, resolution: float = 0.001, slots: int = 1024) -> None:
+        if resolution <= 0:
+            raise ValueError('resolution out of supported range')
+        if slots <= 0:
+            raise ValueError('slots out of supported range')
+        self._start = start
+        self._resolution = resolution
+        self._tick = -1  # the last expired tick
+        self._wheel: List[List[Tuple[int, Hashable]]] = [[] for _ in range(slots)]
+        self._deadlines: Dict[Hashable, int] = {}  # the current tick of each key, older entries are stale
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._deadlines
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def schedule(self, key: Hashable, deadline: float) -> None:
+        """Set the deadline of `key`, or the next tick if already expired."""
+        tick = max(self.to_tick(deadline), self._tick + 1)
+        if self._deadlines.get(key) != tick:
+            self._deadlines[key] = tick
+            self._wheel[tick % len(self._wheel)].append((tick, key))
+
+    def cancel(self, key: Hashable) -> None:
+        """Forget the deadline of `key`.
+
+        Raises:
+            KeyError: If `key` has no deadline.
+        """
+        del self._deadlines[key]
+
+    def expire(self, now: float) -> Iterator[Tuple[float, Hashable]]:
+        """Yield the time of the tick and the key of every deadline up to `now`, tick by tick.
+
+        Each key is forgotten before being yielded, thus it may be scheduled again right away,
+        even within the ticks still to be expired.
+        More than a turn behind, the ticks before the last turn are expired at once, thus each slot is visited
+        at most twice per call; a key scheduled again meanwhile is due within the last turn at the earliest.
+        """
+        last = self.to_tick(now, round_up=False)
+        if last - self._tick > len(self._wheel):
+            yield from self._catch_up(last - len(self._wheel))
+        while self._tick < last:
+            self._tick += 1
+            yield from self._expire(self._tick)
+
+    def _expire(self, tick: int) -> Iterator[Tuple[float, Hashable]]:
+        # the keys due at `tick`, keeping whatever is due on later turns
+        slot = self._wheel[tick % len(self._wheel)]
+        if not slot:
+            return
+        deadlines = self._deadlines
+        kept, due = [], []
+        for entry in slot:
+            (due if entry[0] <= tick else kept).append(entry)
+        slot[:] = kept
+        time = self.to_time(tick)
+        for entry_tick, key in due:
+            if deadlines.get(key) == entry_tick:  # neither cancelled nor moved
+                del deadlines[key]
+                yield time, key
+
+    def _catch_up(self, tick: int) -> Iterator[Tuple[float, Hashable]]:
+        # the keys due up to `tick`, from every slot at once, in the order of their ticks
+        deadlines = self._deadlines
+        due = []
+        for slot in self._wheel:
+            if slot:
+                kept = []
+                for entry in slot:
+                    (due if entry[0] <= tick else kept).append(entry)
+                slot[:] = kept
+        due.sort(key=itemgetter(0))
+        self._tick = tick
+        for entry_tick, key in due:
+            if deadlines.get(key) == entry_tick:  # neither cancelled nor moved
+                del deadlines[key]
+                yield self.to_time(entry_tick), key
+
+    def deadline(self, key: Hashable) -> Optional[float]:
+        """Return the deadline of `key`, rounded up to its tick, `None` if it has none."""
+        tick = self._deadlines.get(key)
+        return None if tick is None else self.to_time(tick)
+
+    def to_tick(self, time: float, round_up: bool = True) -> int:
+        """Return the tick of `time`, rounded up (or down)."""
+        ticks = (time - self._start) / self._resolution
+        # NOTE tolerate the rounding error of adding intervals, e.g. 0.1 + 0.2
+        return ceil(ticks - 1e-6) if round_up else floor(ticks + 1e-6)
+
+    def to_time(self, tick: int) -> float:
+        """Return the time of `tick`."""
+        return self._start + tick * self._resolution
+
+    @property
+    def tick(self) -> int:
+        """The last expired tick, -1 if none."""
+        return self._tick
+
+    @property
+    def time(self) -> float:
+        """The time of the last expired tick."""
+        return self.to_time(self._tick)
+
+    @property
+    def next_deadline(self) -> Optional[float]:
+        """The earliest deadline, `None` if there is none."""
+        if not self._deadlines:
+            return None
+        return self.to_time(min(self._deadlines.values()))
+
+    @property
+    def resolution(self) -> float:
+        return self._resolution
+
+    @property
+    def slots(self) -> int:
+        return len(self._wheel)
@@ -0,0 +1,118 @@
+import os
+from socket import AF_UNIX, SOCK_DGRAM, socketpair
+
+from pytest import mark, raises
+
+from py61850.communication import pacing
+from py61850.communication.pacing import Pacer, PacingStats, perf_counter_ns, set_realtime
+from py61850.communication.scheduler import Scheduler
+from py61850.communication.transmitter import Transmitter
+from py61850.goose.frame import Frame
+from py61850.goose.publisher import Publisher
+from py61850.goose.retransmission import RetransmissionCurve
+
+MILLISECOND = 1_000_000
+
+
+class TestPacer:
+
+    @staticmethod
+    @mark.parametrize('spin', [0.002, 0.0], ids=['spin', 'sleep only'])
+    def test_wait(spin):
+        pacer = Pacer(spin)
+        deadline = perf_counter_ns() + 5 * MILLISECOND
+        error = pacer.wait(deadline)
+        assert perf_counter_ns() >= deadline
+        assert 0 <= error < 5 * MILLISECOND
+
+    @staticmethod
+    def test_late():
+        pacer = Pacer()
+        assert pacer.wait(perf_counter_ns() - MILLISECOND) >= MILLISECOND
+
+    @staticmethod
+    def test_statistics():
+        pacer = Pacer()
+        assert pacer.statistics() == PacingStats(0, 0.0, 0, 0)
+        for _ in range(3):
+            pacer.wait(perf_counter_ns() + MILLISECOND)
+        count, mean, minimum, maximum = pacer.statistics()
+        assert count == 3
+        assert 0 <= minimum <= mean <= maximum
+        pacer.reset()
+        assert pacer.statistics().count == 0
+
+    @staticmethod
+    def test_pace():
+        pacer = Pacer()
+        publisher = Publisher(curve=RetransmissionCurve(t0=0.08, t1=0.01))
+        start = perf_counter_ns()
+        times, frames = [], []
+        for frame in pacer.pace(publisher):
+            times.append(perf_counter_ns() - start)
+            frames.append(Frame(frame).protocol_data_unit.sequence_number.value)
+            if len(frames) == 3:
+                break
+        assert frames == [0, 1, 2]
+        # 0, 10, 30 ms
+        assert times[1] >= 10 * MILLISECOND
+        assert times[2] >= 30 * MILLISECOND
+        assert pacer.statistics().count == 3
+
+    @staticmethod
+    def test_scheduler():
+        sender, receiver = socketpair(AF_UNIX, SOCK_DGRAM)
+        pacer = Pacer()
+        scheduler = Scheduler(Transmitter(sender), resolution=0.0001, pacer=pacer)
+        scheduler.add(Publisher(curve=RetransmissionCurve(t0=0.08, t1=0.01)))
+        assert scheduler.run(0.035) == 3
+        assert pacer.statistics().count > 0
+        sender.close()
+        receiver.close()
+
+    @staticmethod
+    def test_range():
+        with raises(ValueError):
+            Pacer(-1)
+
+    @staticmethod
+    def test_spin():
+        assert Pacer(0.001).spin == 0.001
+
+
+class TestSetRealtime:
+
+    @staticmethod
+    def test_permitted(monkeypatch):
+        calls = []
+        monkeypatch.setattr(os, 'sched_getaffinity', lambda _: {0, 1, 2})
+        monkeypatch.setattr(os, 'sched_setaffinity', lambda *args: calls.append(args))
+        monkeypatch.setattr(os, 'sched_setscheduler', lambda *args: calls.append(args))
+        assert set_realtime(priority=10)
+        assert calls[0] == (0, {2})
+        assert calls[1][1] == os.SCHED_FIFO
+        assert calls[1][2].sched_priority == 10
+
+    @mark.parametrize("error", [PermissionError, OSError], ids=['not_permitted', 'invalid'])
+    def test_not_permitted(self, monkeypatch, error):
+        def refuse(*_):
+            raise error
+
+        calls = []
+        monkeypatch.setattr(os, 'sched_getaffinity', lambda _: {0, 1})
+        monkeypatch.setattr(os, 'sched_setaffinity', lambda *args: calls.append(args))
+        monkeypatch.setattr(os, 'sched_setscheduler', refuse)
+        assert not set_realtime(0)
+        assert calls == [(0, {0}), (0, {0, 1})]  # the original affinity restored
+        assert not Pacer(realtime=True, cpu=0).realtime
+
+    @staticmethod
+    def test_cpu_not_allowed(monkeypatch):
+        affinity = os.sched_getaffinity(0)
+        assert not set_realtime(os.cpu_count() + 1)
+        assert os.sched_getaffinity(0) == affinity
+
+    @staticmethod
+    def test_not_supported(monkeypatch):
+        monkeypatch.delattr(pacing.os, 'sched_setaffinity', raising=False)
+        assert not set_realtime(0)
@@ -0,0 +1,72 @@
+from pytest import fixture, mark, raises, skip
+
+from py61850.communication.receiver import is_goose, RingReceiver
+from py61850.communication.transmitter import Transmitter
+from py61850.goose.frame import Frame
+from py61850.goose.publisher import Publisher
+
+
+@fixture
+def receiver():
+    try:
+        receiver = RingReceiver('lo', block_size=1 << 16, block_number=4, block_timeout=1)
+    except PermissionError:
+        skip('raw sockets not permitted')
+    yield receiver
+    receiver.close()
+
+
+def send(*publishers, number=1):
+    with Transmitter('lo') as transmitter:
+        transmitter.burst(publishers, number)
+
+
+class TestRingReceiver:
+
+    @staticmethod
+    def test_untagged(receiver):
+        send(Publisher(virtual_lan=False, app_id=0x10), number=3)
+        frames = [(Frame(frame.data).app_id, frame.tci) for frame in receiver.frames(timeout=0.2)]
+        assert frames == [('0010', None)] * 3
+
+    @staticmethod
+    def test_tagged(receiver):
+        send(Publisher(vlan_priority=6, vlan_id=5))
+        frame, = receiver.frames(timeout=0.2)
+        assert frame.tci == (6 << 13) + 5
+        assert Frame(frame.data).virtual_lan is None  # stripped by the kernel
+
+    @staticmethod
+    def test_sequence(receiver):
+        send(Publisher(virtual_lan=False, compiled=True), number=200)
+        numbers = [Frame(frame.data).protocol_data_unit.sequence_number.value for frame in receiver.frames(timeout=0.2)]
+        assert numbers == list(range(200))
+        assert receiver.statistics()[1] == 0
+
+    @staticmethod
+    def test_not_goose(receiver):
+        with Transmitter('lo') as transmitter:
+            transmitter.queue(b'\xFF' * 12 + b'\x08\x00' + b'\x00' * 46)
+        assert list(receiver.frames(timeout=0.05)) == []
+
+    @staticmethod
+    def test_time(receiver):
+        send(Publisher())
+        frame, = receiver.frames(timeout=0.2)
+        assert frame.time_ns > 0
+
+
+@mark.parametrize("frame, result", [
+    (b'\x00' * 12 + b'\x88\xb8', True),
+    (b'\x00' * 12 + b'\x81\x00\x80\x00\x88\xb8', True),
+    (b'\x00' * 12 + b'\x08\x00', False),
+    (b'\x00' * 12 + b'\x81\x00\x80\x00\x08\x00', False),
+], ids=['untagged', 'tagged', 'ip', 'tagged_ip'])
+def test_is_goose(frame, result):
+    assert is_goose(memoryview(frame)) is result
+
+
+@mark.parametrize("block_size, frame_size", [(1000, 2048), (1 << 16, 1000)], ids=['block', 'frame'])
+def test_sizes(block_size, frame_size):
+    with raises(ValueError):
+        RingReceiver('lo', block_size=block_size, frame_size=frame_size)
@@ -0,0 +1,110 @@
+from asyncio import new_event_loop, sleep
+from socket import AF_UNIX, SOCK_DGRAM, socketpair
+
+from pytest import fixture, raises
+
+from py61850.communication.runner import PublisherRunner
+from py61850.communication.transmitter import Transmitter
+from py61850.goose.frame import Frame
+from py61850.goose.publisher import Publisher
+from py61850.goose.retransmission import RetransmissionCurve
+from py61850.types import Boolean
+
+CURVE = RetransmissionCurve(t0=0.08, t1=0.01)
+
+
+@fixture
+def loop():
+    loop = new_event_loop()
+    yield loop
+    loop.close()
+
+
+@fixture
+def sockets():
+    sender, receiver = socketpair(AF_UNIX, SOCK_DGRAM)
+    receiver.setblocking(False)
+    yield sender, receiver
+    sender.close()
+    receiver.close()
+
+
+def received(receiver):
+    frames = []
+    try:
+        while True:
+            frames.append(Frame(receiver.recv(0xFFFF)).protocol_data_unit)
+    except BlockingIOError:
+        return frames
+
+
+class TestPublisherRunner:
+
+    @staticmethod
+    def test_curve(loop, sockets):
+        runner = PublisherRunner(Transmitter(sockets[0]), loop)
+        runner.add(Publisher(curve=CURVE))
+        loop.run_until_complete(runner.run(0.2))
+        frames = received(sockets[1])
+        # 0, 10, 30, 70, 150 ms, then the next heartbeat at 230 ms
+        assert [pdu.sequence_number.value for pdu in frames] == [0, 1, 2, 3, 4]
+        assert [pdu.time_allowed_to_live.value for pdu in frames] == [20, 40, 80, 160, 160]
+
+    @staticmethod
+    def test_many(loop, sockets):
+        transmitter = Transmitter(sockets[0])
+        runner = PublisherRunner(transmitter, loop)
+        for app_id in range(1, 51):
+            runner.add(Publisher(app_id=app_id, curve=RetransmissionCurve(t0=2.0, t1=1.0)))
+        assert runner.publishers == 50
+        loop.run_until_complete(runner.run(0.005))
+        assert runner.publishers == 0
+        assert len(received(sockets[1])) == 50
+        assert transmitter.system_calls == 1
+
+    @staticmethod
+    def test_notify(loop, sockets):
+        runner = PublisherRunner(Transmitter(sockets[0]), loop)
+        publisher = Publisher(all_data=(Boolean(True),), curve=CURVE)
+
+        async def event():
+            await sleep(0.1)
+            publisher.protocol_data_unit.all_data[0] = False
+            runner.notify(publisher)
+            await sleep(0.005)
+            runner.stop()
+
+        runner.add(publisher)
+        loop.run_until_complete(event())
+        last = received(sockets[1])[-1]
+        assert (last.status_number.value, last.sequence_number.value) == (2, 0)
+        assert last.time_allowed_to_live.value == 20
+
+    @staticmethod
+    def test_stop(loop, sockets):
+        runner = PublisherRunner(Transmitter(sockets[0]), loop)
+        runner.add(Publisher(curve=CURVE))
+
+        async def stop():
+            await sleep(0.05)
+            runner.stop()
+
+        loop.run_until_complete(loop.create_task(runner.run()) and stop())
+        assert runner.publishers == 0
+
+    @staticmethod
+    def test_remove(loop, sockets):
+        runner = PublisherRunner(Transmitter(sockets[0]), loop)
+        publisher = Publisher(curve=CURVE)
+        runner.add(publisher)
+        runner.remove(publisher)
+        loop.run_until_complete(runner.run(0.02))
+        assert received(sockets[1]) == []
+
+    @staticmethod
+    def test_add_twice(loop, sockets):
+        runner = PublisherRunner(Transmitter(sockets[0]), loop)
+        publisher = Publisher()
+        runner.add(publisher)
+        with raises(ValueError):
+            runner.add(publisher)
@@ -0,0 +1,119 @@
+from socket import AF_UNIX, SOCK_DGRAM, socketpair
+
+from pytest import fixture, mark, raises
+
+from py61850.communication.scheduler import Scheduler
+from py61850.communication.transmitter import Transmitter
+from py61850.goose.frame import Frame
+from py61850.goose.publisher import Publisher
+from py61850.goose.retransmission import RetransmissionCurve
+from py61850.types import Boolean
+
+CURVE = RetransmissionCurve(t0=0.08, t1=0.01)
+
+
+class Clock:
+
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@fixture
+def sockets():
+    sender, receiver = socketpair(AF_UNIX, SOCK_DGRAM)
+    receiver.setblocking(False)
+    yield sender, receiver
+    sender.close()
+    receiver.close()
+
+
+@fixture
+def clock():
+    return Clock()
+
+
+def received(receiver):
+    frames = []
+    try:
+        while True:
+            frames.append(Frame(receiver.recv(0xFFFF)).protocol_data_unit)
+    except BlockingIOError:
+        return frames
+
+
+class TestScheduler:
+
+    @staticmethod
+    @mark.parametrize('slots', [1024, 7], ids=['whole turn', 'many turns'])
+    def test_curve(sockets, clock, slots):
+        scheduler = Scheduler(Transmitter(sockets[0]), slots=slots, clock=clock)
+        scheduler.add(Publisher(curve=CURVE))
+        times = []
+        for millisecond in range(231):
+            clock.now = 100 + millisecond / 1000
+            if scheduler.advance():
+                times.append(millisecond)
+        frames = received(sockets[1])
+        assert times == [0, 10, 30, 70, 150, 230]
+        assert [pdu.sequence_number.value for pdu in frames] == [0, 1, 2, 3, 4, 5]
+
+    @staticmethod
+    def test_batch(sockets, clock):
+        transmitter = Transmitter(sockets[0])
+        scheduler = Scheduler(transmitter, clock=clock)
+        for app_id in range(1, 51):
+            scheduler.add(Publisher(app_id=app_id, curve=CURVE), delay=app_id / 10_000)
+        assert scheduler.publishers == 50
+        assert scheduler.advance(100.01) == 50
+        assert len(received(sockets[1])) == 50
+        assert transmitter.system_calls == 1
+
+    @staticmethod
+    def test_notify(sockets, clock):
+        scheduler = Scheduler(Transmitter(sockets[0]), clock=clock)
+        publisher = Publisher(all_data=(Boolean(True),), curve=CURVE)
+        scheduler.add(publisher)
+        scheduler.advance(100.05)
+        publisher.protocol_data_unit.all_data[0] = False
+        scheduler.notify(publisher)
+        assert scheduler.next_deadline == 100.05
+        assert scheduler.advance(100.05) == 1
+        last = received(sockets[1])[-1]
+        assert (last.status_number.value, last.sequence_number.value) == (2, 0)
+        assert scheduler.next_deadline == 100.06
+
+    @staticmethod
+    def test_remove(sockets, clock):
+        scheduler = Scheduler(Transmitter(sockets[0]), clock=clock)
+        publisher = Publisher(curve=CURVE)
+        scheduler.add(publisher)
+        scheduler.remove(publisher)
+        assert scheduler.next_deadline is None
+        clock.now = 101
+        assert scheduler.advance() == 0
+        scheduler.add(publisher)
+        assert scheduler.advance() == 1
+
+    @staticmethod
+    def test_add_twice(sockets, clock):
+        scheduler = Scheduler(Transmitter(sockets[0]), clock=clock)
+        publisher = Publisher()
+        scheduler.add(publisher)
+        with raises(ValueError):
+            scheduler.add(publisher)
+
+    @staticmethod
+    def test_run(sockets):
+        scheduler = Scheduler(Transmitter(sockets[0]))
+        scheduler.add(Publisher(curve=CURVE))
+        assert scheduler.run(0.035) == 3
+        assert len(received(sockets[1])) == 3
+
+    @staticmethod
+    @mark.parametrize('kwargs', [{'resolution': 0}, {'slots': 0}], ids=['resolution', 'slots'])
+    def test_range(sockets, kwargs):
+        with raises(ValueError):
+            Scheduler(Transmitter(sockets[0]), **kwargs)
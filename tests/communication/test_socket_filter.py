@@ -0,0 +1,160 @@
+from socket import AF_UNIX, SOCK_DGRAM, socketpair
+
+from pytest import fixture, mark, raises, skip
+
+from py61850.communication.receiver import RingReceiver
+from py61850.communication.socket_filter import attach_filter, compile_filter, detach_filter, SOCK_FILTER
+from py61850.communication.transmitter import Transmitter
+from py61850.goose.publisher import Publisher
+from py61850.types import Boolean
+
+
+@fixture
+def sockets():
+    # socket filters run on datagram sockets as well, over the whole datagram
+    sender, receiver = socketpair(AF_UNIX, SOCK_DGRAM)
+    receiver.setblocking(False)
+    yield sender, receiver
+    sender.close()
+    receiver.close()
+
+
+def app_ids(sockets, program, *publishers):
+    sender, receiver = sockets
+    attach_filter(receiver, program)
+    for publisher in publishers:
+        sender.send(bytes(publisher))
+    received = []
+    try:
+        while True:
+            received.append(receiver.recv(0xFFFF))
+    except BlockingIOError:
+        return [frame[18 if frame[12:14] == b'\x81\x00' else 14] * 0x100 +
+                frame[19 if frame[12:14] == b'\x81\x00' else 15] for frame in received]
+
+
+BOTH = [Publisher(app_id=1), Publisher(app_id=2, virtual_lan=False)]
+
+# the PDU length in 1, 2 and 3 bytes, i.e. short, 0x81 and 0x82 forms
+PDU_LENGTHS = {
+    id: ['short', 'long', 'longer'],
+    'all_data': [None, tuple(Boolean(True) for _ in range(20)), tuple(Boolean(True) for _ in range(100))],
+    'length': [1, 2, 3],
+}
+
+
+class TestCompileFilter:
+
+    @staticmethod
+    def test_any(sockets):
+        assert app_ids(sockets, compile_filter(), *BOTH) == [1, 2]
+
+    @staticmethod
+    def test_not_goose(sockets):
+        sender, receiver = sockets
+        attach_filter(receiver, compile_filter())
+        sender.send(b'\x01\x0c\xcd\x01\x00\x00' + b'\x00' * 6 + b'\x08\x00' + b'\x00' * 46)
+        with raises(BlockingIOError):
+            receiver.recv(0xFFFF)
+
+    @mark.parametrize("virtual_lan", [True, False])
+    def test_app_ids(self, sockets, virtual_lan):
+        publishers = [Publisher(app_id=app_id, virtual_lan=virtual_lan) for app_id in range(1, 0x30)]
+        assert app_ids(sockets, compile_filter(app_ids=range(0x10, 0x20)), *publishers) == list(range(0x10, 0x20))
+
+    @staticmethod
+    def test_destinations(sockets):
+        publishers = [Publisher(app_id=app_id, destination=b'\x01\x0c\xcd\x01\x00' + bytes([app_id]))
+                      for app_id in range(0x10)]
+        program = compile_filter(destinations=['01-0C-CD-01-00-03', b'\x01\x0c\xcd\x01\x00\x07'])
+        assert app_ids(sockets, program, *publishers) == [3, 7]
+
+    @staticmethod
+    def test_app_ids_and_destinations(sockets):
+        publishers = [Publisher(app_id=1, destination='01-0C-CD-01-00-01'),
+                      Publisher(app_id=2, destination='01-0C-CD-01-00-01'),
+                      Publisher(app_id=1, destination='01-0C-CD-01-00-02')]
+        program = compile_filter(app_ids=[1], destinations=['01-0C-CD-01-00-01'])
+        assert app_ids(sockets, program, *publishers) == [1]
+
+    @staticmethod
+    def test_untagged_only(sockets):
+        # the datagram has no ancillary tag, thus untagged frames are accepted
+        assert app_ids(sockets, compile_filter(virtual_lan=False), *BOTH) == [2]
+
+    @staticmethod
+    def test_many_app_ids(sockets):
+        program = compile_filter(app_ids=range(2000))
+        assert len(program) // SOCK_FILTER.size < 4096
+        assert app_ids(sockets, program, Publisher(app_id=1999), Publisher(app_id=2000)) == [1999]
+
+    @mark.parametrize("virtual_lan", [True, False])
+    @mark.parametrize("all_data, length", zip(PDU_LENGTHS['all_data'], PDU_LENGTHS['length']), ids=PDU_LENGTHS[id])
+    def test_references(self, sockets, virtual_lan, all_data, length):
+        publishers = [Publisher(app_id=app_id, virtual_lan=virtual_lan, all_data=all_data,
+                                goose_control_block_reference=reference)
+                      for app_id, reference in enumerate(['IED_CFG/LLN0$GO$First', 'IED_CFG/LLN0$GO$Second',
+                                                          'IED_CFG/LLN0$GO$Firs', 'IED_CFG/LLN0$GO$Firsts'], 1)]
+        first = bytes(publishers[0])[27 if virtual_lan else 23]
+        assert (1 if first < 0x80 else first - 0x7F) == length
+        program = compile_filter(goose_control_block_references=['IED_CFG/LLN0$GO$Other', 'IED_CFG/LLN0$GO$First'])
+        assert app_ids(sockets, program, *publishers) == [1]
+
+    @staticmethod
+    def test_references_and_app_ids(sockets):
+        publishers = [Publisher(app_id=1, goose_control_block_reference='A'),
+                      Publisher(app_id=2, goose_control_block_reference='A'),
+                      Publisher(app_id=2, goose_control_block_reference='B')]
+        program = compile_filter(app_ids=[2], goose_control_block_references=['A'])
+        assert app_ids(sockets, program, *publishers) == [2]
+
+    @staticmethod
+    def test_detach(sockets):
+        attach_filter(sockets[1], compile_filter(app_ids=[]))
+        detach_filter(sockets[1])
+        sockets[0].send(b'frame')
+        assert sockets[1].recv(0xFFFF) == b'frame'
+
+    @staticmethod
+    def test_too_long():
+        with raises(ValueError) as info:
+            compile_filter(app_ids=range(0x1000))
+        assert str(info.value) == 'filter out of supported length'
+
+    @mark.parametrize("app_id, error", [('1', TypeError), (0x10000, ValueError)], ids=['type', 'range'])
+    def test_app_id(self, app_id, error):
+        with raises(error):
+            compile_filter(app_ids=[app_id])
+
+    @staticmethod
+    def test_destination():
+        with raises(ValueError):
+            compile_filter(destinations=['01-0C-CD-02-00-01'])
+
+    @mark.parametrize("reference, error", [(b'A', TypeError), ('A' * 66, ValueError)], ids=['type', 'length'])
+    def test_reference(self, reference, error):
+        with raises(error):
+            compile_filter(goose_control_block_references=[reference])
+
+    @staticmethod
+    def test_program():
+        with raises(ValueError):
+            attach_filter(None, b'\x00')
+
+
+class TestRingReceiverFilter:
+
+    @staticmethod
+    def test_tagged():
+        try:
+            receiver = RingReceiver('lo', block_size=1 << 16, block_number=4, block_timeout=1)
+        except PermissionError:
+            skip('raw sockets not permitted')
+        with receiver:
+            receiver.attach_filter(compile_filter(app_ids=[2, 3], virtual_lan=True))
+            with Transmitter('lo') as transmitter:
+                transmitter.burst([Publisher(app_id=app_id) for app_id in range(5)] +
+                                  [Publisher(app_id=2, virtual_lan=False)])
+            received = [(frame.data[14:16].tobytes(), frame.tci) for frame in receiver.frames(timeout=0.2)]
+            assert received == [(b'\x00\x02', 0x8000), (b'\x00\x03', 0x8000)]
+            assert receiver.statistics() == (2, 0)
@@ -0,0 +1,143 @@
+from socket import AF_PACKET, AF_UNIX, htons, SOCK_DGRAM, SOCK_RAW, socket, socketpair
+from time import sleep
+
+from pytest import fixture, mark, raises, skip
+
+from py61850.communication.transmitter import new_transmitter, RingTransmitter, Transmitter
+from py61850.goose.publisher import Publisher
+
+
+@fixture
+def sockets():
+    sender, receiver = socketpair(AF_UNIX, SOCK_DGRAM)
+    receiver.setblocking(False)
+    yield sender, receiver
+    receiver.close()
+
+
+def received(receiver):
+    frames = []
+    try:
+        while True:
+            frames.append(receiver.recv(0xFFFF))
+    except BlockingIOError:
+        return frames
+
+
+class TestTransmitter:
+
+    @staticmethod
+    def test_flush(sockets):
+        sender, receiver = sockets
+        with Transmitter(sender) as transmitter:
+            for index in range(3):
+                transmitter.queue(bytes([index]) * 10)
+            stats = transmitter.flush()
+        assert stats[:3] == (3, 30, 1)
+        assert received(receiver) == [b'\x00' * 10, b'\x01' * 10, b'\x02' * 10]
+
+    @staticmethod
+    def test_full_queue(sockets):
+        sender, receiver = sockets
+        transmitter = Transmitter(sender, batch_size=2)
+        flushed = [transmitter.queue(b'frame') for _ in range(5)]
+        assert [len(stats) for stats in flushed] == [0, 0, 1, 0, 1]
+        assert transmitter.queued == 1
+        assert transmitter.system_calls == 2
+        assert len(received(receiver)) == 4
+
+    @staticmethod
+    def test_close_flushes(sockets):
+        sender, receiver = sockets
+        transmitter = Transmitter(sender)
+        transmitter.queue(b'frame')
+        transmitter.close()
+        assert received(receiver) == [b'frame']
+
+    @staticmethod
+    def test_burst(sockets):
+        sender, receiver = sockets
+        publishers = [Publisher(app_id=app_id, compiled=True) for app_id in range(1, 11)]
+        regular = [iter(Publisher(app_id=app_id)) for app_id in range(1, 11)]
+        transmitter = Transmitter(sender, batch_size=8)
+        stats = transmitter.burst(publishers, number=2)
+        assert [batch.frames for batch in stats] == [8, 8, 4]
+        assert transmitter.frames == 20
+        assert transmitter.system_calls == 3
+        assert received(receiver) == [bytes(next(publisher)) for publisher in regular for _ in range(2)]
+
+    @staticmethod
+    def test_frame_size(sockets):
+        with raises(ValueError) as info:
+            Transmitter(sockets[0], frame_size=10).queue(b'\x00' * 11)
+        assert str(info.value) == 'frame out of supported length'
+
+    @staticmethod
+    def test_interface_type():
+        with raises(TypeError):
+            Transmitter(1)
+
+    @mark.parametrize("batch_size", [0, 1025])
+    def test_batch_size(self, sockets, batch_size):
+        with raises(ValueError):
+            Transmitter(sockets[0], batch_size=batch_size)
+
+
+@fixture
+def loopback():
+    try:
+        receiver = socket(AF_PACKET, SOCK_RAW, htons(0x88B8))
+    except PermissionError:
+        skip('raw sockets not permitted')
+    receiver.bind(('lo', 0))
+    receiver.setblocking(False)
+    yield receiver
+    receiver.close()
+
+
+class TestRingTransmitter:
+
+    @staticmethod
+    def test_burst(loopback):
+        publisher = Publisher(virtual_lan=False, compiled=True)
+        regular = iter(Publisher(virtual_lan=False))
+        with new_transmitter('lo', tx_ring=True, batch_size=5) as transmitter:
+            assert transmitter.slot_number == 6
+            for _ in range(3):
+                stats = transmitter.burst([publisher], number=4)
+                assert [batch.frames for batch in stats] == [4]
+                sleep(0.01)
+                assert received(loopback) == [bytes(next(regular)) for _ in range(4)]
+            assert transmitter.system_calls == 3
+
+    @staticmethod
+    def test_queue(loopback):
+        frame = bytes(Publisher(virtual_lan=False))
+        with RingTransmitter('lo', batch_size=2) as transmitter:
+            flushed = [transmitter.queue(frame) for _ in range(3)]
+            assert [len(stats) for stats in flushed] == [0, 0, 1]
+        sleep(0.01)
+        assert received(loopback) == [frame] * 3
+
+    @staticmethod
+    def test_wrong_format(loopback):
+        frame = bytes(Publisher(virtual_lan=False))
+        with RingTransmitter('lo', batch_size=4) as transmitter:
+            for _ in range(3):  # around the ring, and again
+                for queued in (frame, b'\x00' * 4, frame):
+                    transmitter.queue(queued)
+                with raises(OSError) as info:
+                    transmitter.flush()
+                assert 'queued at (1,)' in str(info.value)
+            transmitter.queue(frame)
+        sleep(0.01)
+        assert received(loopback) == [frame] * 4  # the first of each batch, then the last one
+
+    @staticmethod
+    def test_not_packet(sockets):
+        with raises(OSError):
+            RingTransmitter(sockets[0])
+
+
+def test_new_transmitter(sockets):
+    assert type(new_transmitter(sockets[0])) is Transmitter
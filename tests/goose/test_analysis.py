@@ -0,0 +1,88 @@
+from struct import pack
+
+from pytest import fixture, mark
+
+from py61850.goose.analysis import analyze, analyze_range, StreamReport
+from py61850.goose.capture import Capture
+from py61850.goose.publisher import Publisher
+from py61850.types import Boolean
+
+REFERENCE = 'IED_CFG/LLN0$GO$ControlBlockReference'
+
+
+def frames():
+    # two streams, 3 events and a lost frame on the first one, then a new confRev on the second one
+    first = Publisher(app_id=1, all_data=(Boolean(True),))
+    second = Publisher(app_id=2, all_data=(Boolean(False),))
+    iter(first), iter(second)
+    for index in range(60):
+        if index in (10, 30, 50):
+            first.protocol_data_unit.all_data[0] = not first.protocol_data_unit.all_data[0].value
+        frame = bytes(next(first))
+        if index != 20:
+            yield frame
+        yield bytes(next(second))
+    revised = Publisher(app_id=2, configuration_revision=2, all_data=(Boolean(False),))
+    iter(revised)
+    for _ in range(5):
+        yield bytes(next(revised))
+    yield b'\xFF' * 12 + b'\x88\xB8' + b'\x00\x01\x00\x08' + b'\x00' * 46  # malformed
+
+
+@fixture(scope='module')
+def path(tmp_path_factory):
+    path = tmp_path_factory.mktemp('analysis') / 'capture.pcap'
+    records = [pack('<IHHiIII', 0xA1B2C3D4, 2, 4, 0, 0, 0xFFFF, 1)]
+    for index, frame in enumerate(frames()):
+        records.append(pack('<IIII', index, 0, len(frame), len(frame)) + frame)
+    path.write_bytes(b''.join(records))
+    return str(path)
+
+
+def summary(analysis):
+    return {key: (report.frames, report.events, report.gaps, report.revisions, report.first, report.last)
+            for key, report in analysis.streams.items()}
+
+
+class TestAnalyze:
+
+    @staticmethod
+    def test_single(path):
+        analysis = analyze(path, workers=1)
+        assert (analysis.frames, analysis.malformed) == (125, 1)
+        first, second = analysis.streams[(1, REFERENCE)], analysis.streams[(2, REFERENCE)]
+        assert first.frames == 59
+        assert [(time // 1_000_000_000, status, data) for time, status, data in first.events] == \
+            [(0, 1, (True,)), (20, 2, (False,)), (59, 3, (True,)), (99, 4, (False,))]  # one frame lost at 20
+        assert (first.gaps, first.revisions) == (1, 0)
+        assert second.frames == 65
+        assert len(second.events) == 2
+        assert (second.gaps, second.revisions) == (1, 1)
+        assert second.last[:3] == (1, 4, 2)
+
+    @staticmethod
+    @mark.parametrize('chunks', [2, 7, 40], ids=['2 chunks', '7 chunks', '40 chunks'])
+    def test_chunks(path, chunks):
+        whole = analyze_range(path)
+        with Capture(path) as capture:
+            ranges = capture.split(chunks)
+        assert len(ranges) == chunks
+        parts = [analyze_range(path, start, end) for start, end in ranges]
+        assert sum(part.frames for part in parts) == whole.frames
+        merged = {}
+        for part in parts:
+            for key, report in part.streams.items():
+                if key in merged:
+                    merged[key].merge(report)
+                else:
+                    merged[key] = report
+        assert {key: summary_of(report) for key, report in merged.items()} == \
+            {key: summary_of(report) for key, report in whole.streams.items()}
+
+    @staticmethod
+    def test_workers(path):
+        assert summary(analyze(path, workers=3)) == summary(analyze(path, workers=1))
+
+
+def summary_of(report: StreamReport):
+    return report.frames, report.events, report.gaps, report.revisions, report.first, report.last
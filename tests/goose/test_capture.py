@@ -0,0 +1,168 @@
+from struct import pack
+
+from pytest import fixture, mark, raises
+
+from py61850.goose.capture import Capture
+from py61850.goose.frame import Frame
+from py61850.goose.publisher import Publisher
+
+TAGGED = bytes(Publisher(app_id=0x10))
+UNTAGGED = bytes(Publisher(app_id=0x11, virtual_lan=False))
+IP = b'\xFF' * 12 + b'\x08\x00' + b'\x00' * 46
+FRAMES = (TAGGED, IP, UNTAGGED)
+SECOND = 1_000_000_000
+
+
+def pcap(order='<', nanoseconds=False, link_type=1, frames=FRAMES):
+    magic = 0xA1B23C4D if nanoseconds else 0xA1B2C3D4
+    records = [pack(order + 'IHHiIII', magic, 2, 4, 0, 0, 0xFFFF, link_type)]
+    for index, frame in enumerate(frames):
+        records.append(pack(order + 'IIII', 1000 + index, 5, len(frame), len(frame)) + frame)
+    return b''.join(records)
+
+
+def block(order, block_type, body):
+    body += b'\x00' * (-len(body) % 4)
+    return pack(order + 'II', block_type, len(body) + 12) + body + pack(order + 'I', len(body) + 12)
+
+
+def section(order):
+    return block(order, 0x0A0D0D0A, pack(order + 'IHHq', 0x1A2B3C4D, 1, 0, -1))
+
+
+def interface(order, link_type=1, resolution=None):
+    options = b''
+    if resolution is not None:
+        options = pack(order + 'HHB3x', 9, 1, resolution) + pack(order + 'HH', 0, 0)
+    return block(order, 1, pack(order + 'HHI', link_type, 0, 0xFFFF) + options)
+
+
+def enhanced(order, frame, time, interface_id=0):
+    return block(order, 6, pack(order + 'IIIII', interface_id, time >> 32, time & 0xFFFFFFFF, len(frame), len(frame))
+                 + frame)
+
+
+def pcapng(order='<', resolution=None, frames=FRAMES):
+    blocks = [section(order), interface(order, resolution=resolution)]
+    blocks.extend(enhanced(order, frame, 1000 + index) for index, frame in enumerate(frames))
+    return b''.join(blocks)
+
+
+@fixture
+def write(tmp_path):
+    def write(content):
+        path = tmp_path / 'capture'
+        path.write_bytes(content)
+        return str(path)
+
+    return write
+
+
+def app_ids(capture, **kwargs):
+    return [Frame(frame.data).app_id for frame in capture.frames(**kwargs)]
+
+
+class TestPcap:
+
+    @staticmethod
+    @mark.parametrize('order', ['<', '>'], ids=['little endian', 'big endian'])
+    def test_frames(write, order):
+        with Capture(write(pcap(order))) as capture:
+            frames = list(capture)
+            assert [bytes(frame.data) for frame in frames] == [TAGGED, UNTAGGED]
+            assert [frame.time_ns for frame in frames] == [1000 * SECOND + 5000, 1002 * SECOND + 5000]
+            del frames
+
+    @staticmethod
+    def test_every_frame(write):
+        with Capture(write(pcap())) as capture:
+            assert [bytes(frame.data) for frame in capture.frames(goose_only=False)] == list(FRAMES)
+
+    @staticmethod
+    def test_nanoseconds(write):
+        with Capture(write(pcap(nanoseconds=True))) as capture:
+            assert next(iter(capture)).time_ns == 1000 * SECOND + 5
+
+    @staticmethod
+    def test_truncated(write):
+        with Capture(write(pcap()[:-10])) as capture:
+            assert app_ids(capture) == ['0010']
+
+    @staticmethod
+    @mark.parametrize('number', [1, 2, 3, 7, 40])
+    def test_split(write, number):
+        content = pcap(frames=FRAMES * 5)
+        with Capture(write(content)) as capture:
+            ranges = capture.split(number)
+            assert len(ranges) == number
+            assert ranges[0][0] == 24 and ranges[-1][1] == len(content)
+            assert all(first[1] == second[0] for first, second in zip(ranges, ranges[1:]))
+            parts = [bytes(frame.data) for start, end in ranges for frame in capture.frames(False, start, end)]
+            assert parts == list(FRAMES * 5)
+
+    @staticmethod
+    def test_resync(write):
+        content = pcap()
+        boundaries = [24, 24 + 16 + len(TAGGED), 24 + 32 + len(TAGGED) + len(IP)]
+        with Capture(write(content)) as capture:
+            for start in range(24, len(content)):
+                expected = [frame for boundary, frame in zip(boundaries, FRAMES) if boundary >= start]
+                assert [bytes(frame.data) for frame in capture.frames(False, start)] == expected
+
+    @staticmethod
+    def test_link_type(write):
+        with raises(ValueError):
+            Capture(write(pcap(link_type=105)))
+
+
+class TestPcapng:
+
+    @staticmethod
+    @mark.parametrize('order', ['<', '>'], ids=['little endian', 'big endian'])
+    def test_frames(write, order):
+        with Capture(write(pcapng(order))) as capture:
+            assert app_ids(capture) == ['0010', '0011']
+            assert [frame.time_ns for frame in capture] == [1000 * 1000, 1002 * 1000]
+
+    @staticmethod
+    @mark.parametrize('resolution, time_ns', [(9, 1000), (3, 1000 * 1_000_000), (0x80 | 10, 1000 * SECOND // 1024),
+                                              (12, 1)],
+                      ids=['nanoseconds', 'milliseconds', 'power of 2', 'picoseconds'])
+    def test_resolution(write, resolution, time_ns):
+        with Capture(write(pcapng(resolution=resolution))) as capture:
+            assert next(iter(capture)).time_ns == time_ns
+
+    @staticmethod
+    def test_interfaces(write):
+        # a non Ethernet interface, then a second section, big endian
+        content = b''.join([section('<'), interface('<', link_type=105), interface('<'),
+                            enhanced('<', TAGGED, 1, interface_id=0), enhanced('<', UNTAGGED, 2, interface_id=1),
+                            enhanced('<', UNTAGGED, 3, interface_id=2),
+                            section('>'), interface('>'), enhanced('>', TAGGED, 4),
+                            block('>', 3, pack('>I', len(UNTAGGED)) + UNTAGGED), block('>', 5, b'\x00' * 8)])
+        with Capture(write(content)) as capture:
+            frames = list(capture)
+            assert [(frame.time_ns, Frame(frame.data).app_id) for frame in frames] == \
+                [(2000, '0011'), (4000, '0010'), (0, '0011')]
+            del frames
+
+    @staticmethod
+    def test_truncated(write):
+        with Capture(write(pcapng()[:-10])) as capture:
+            assert app_ids(capture) == ['0010']
+
+
+class TestCapture:
+
+    @staticmethod
+    @mark.parametrize('content', [b'', b'\x00' * 64], ids=['empty', 'unknown'])
+    def test_not_capture(write, content):
+        with raises(ValueError):
+            Capture(write(content))
+
+    @staticmethod
+    def test_close(write):
+        capture = Capture(write(pcap()))
+        frame = next(iter(capture))
+        capture.close()  # the frame is still referenced
+        assert Frame(frame.data).app_id == '0010'
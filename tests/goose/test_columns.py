@@ -0,0 +1,183 @@
+from struct import pack
+
+from pytest import fixture, importorskip, mark, raises
+
+from py61850.goose.capture import Capture
+from py61850.goose.frame import Frame
+from py61850.goose.pdu import AllData
+from py61850.goose.publisher import Publisher
+from py61850.types import Boolean, VisibleString
+from py61850.types.floating_point import DoublePrecision, SinglePrecision
+from py61850.types.integer import Signed, Unsigned
+
+numpy = importorskip('numpy')
+columns = importorskip('py61850.goose.columns')
+
+REFERENCE = 'IED_CFG/LLN0$GO$ControlBlockReference'
+LAYOUT = (('stVal', Boolean), ('mag', DoublePrecision), ('count', Signed), ('ang', SinglePrecision),
+          ('ops', Unsigned))
+
+
+def frames():
+    # 20 frames of the first publisher, a new state at the 10th, then one of a second publisher
+    publisher = Publisher(app_id=1, all_data=(Boolean(True), DoublePrecision(1.5), Signed(-3), SinglePrecision(0.25),
+                                              Unsigned(7)))
+    iter(publisher)
+    for index in range(20):
+        if index == 10:
+            publisher.protocol_data_unit.all_data[1] = 2.5
+        yield bytes(next(publisher))
+    other = Publisher(app_id=2, goose_control_block_reference='IED_CFG/LLN0$GO$Other', all_data=(VisibleString('Okay'),))
+    yield bytes(other)
+
+
+class TestColumns:
+
+    @staticmethod
+    def test_header():
+        frames_ = list(frames())
+        result = columns.decode_columns(frames_)
+        assert (len(result.rows), result.malformed) == (21, 0)
+        assert result.references == (REFERENCE, 'IED_CFG/LLN0$GO$Other')
+        for row, frame in zip(result.rows, frames_):
+            pdu = Frame(frame).protocol_data_unit
+            assert row['app_id'] == int(Frame(frame).app_id, 16)
+            assert result.references[row['reference']] == pdu.goose_control_block_reference.value
+            assert row['status_number'] == pdu.status_number.value
+            assert row['sequence_number'] == pdu.sequence_number.value
+            assert row['time_allowed_to_live'] == pdu.time_allowed_to_live.value
+            assert row['configuration_revision'] == pdu.configuration_revision.value
+            raw_timestamp = pdu.goose_timestamp.raw_value
+            assert row['seconds'] == int.from_bytes(raw_timestamp[:4], 'big')
+            assert row['fraction'] == int.from_bytes(raw_timestamp[4:7], 'big')
+            assert row['quality'] == raw_timestamp[7]
+        assert list(result.rows['time_ns']) == [0] * 21
+
+    @staticmethod
+    @mark.parametrize('batch_size', [1, 7, 4096], ids=['single', 'partial', 'whole'])
+    def test_layout(batch_size):
+        result = columns.decode_columns(frames(), LAYOUT, batch_size)
+        assert (len(result.rows), result.malformed) == (20, 1)  # the second publisher does not match
+        assert result.rows.dtype.names[-5:] == ('stVal', 'mag', 'count', 'ang', 'ops')
+        assert list(result.rows['mag']) == [1.5] * 10 + [2.5] * 10
+        assert result.rows['mag'].dtype == numpy.float64
+        assert result.rows['ang'].dtype == numpy.float32
+        assert numpy.all(result.rows['stVal'])
+        assert set(result.rows['count']) == {-3}
+        assert set(result.rows['ops']) == {7}
+        assert list(result.rows['status_number']) == [1] * 10 + [2] * 10
+
+    @staticmethod
+    def test_columns():
+        result = columns.decode_columns(frames())
+        by_name = result.columns
+        assert tuple(by_name) == result.rows.dtype.names
+        by_name['app_id'][0] = 9  # views, not copies
+        assert result.rows['app_id'][0] == 9
+
+    @staticmethod
+    @mark.parametrize('frame', [b'\x00' * 64, b'\xFF' * 12 + b'\x88\xB8' + b'\x00\x01\x00\x0A' + b'\x00\x00'
+                                + b'\x61\x00'], ids=['not goose', 'empty pdu'])
+    def test_malformed(frame):
+        result = columns.decode_columns([frame])
+        assert (len(result.rows), result.malformed) == (0, 1)
+
+    @staticmethod
+    def test_overflow():
+        frame = bytearray(bytes(Publisher(goose_control_block_reference='R', data_set='D', goose_identifier='I')))
+        index = frame.index(b'\x85\x01\x01', 28)
+        frame[index:index + 3] = b'\x85\x05\x01\x00\x00\x00\x00'  # a stNum of 2**32
+        frame[21] += 4
+        frame[27] += 4
+        result = columns.decode_columns(list(frames())[:5] + [bytes(frame)] + list(frames())[5:])
+        assert (len(result.rows), result.malformed) == (21, 1)
+
+    @staticmethod
+    def test_references(monkeypatch):
+        monkeypatch.setattr(columns, 'MAX_REFERENCES', 1)
+        result = columns.decode_columns(frames())
+        assert (len(result.rows), result.malformed) == (20, 1)
+        assert result.references == (REFERENCE,)
+
+    @staticmethod
+    def test_data_type():
+        with raises(TypeError):
+            columns.dtype((('name', VisibleString),))
+
+
+@fixture
+def path(tmp_path):
+    path = tmp_path / 'capture.pcap'
+    records = [pack('<IHHiIII', 0xA1B2C3D4, 2, 4, 0, 0, 0xFFFF, 1)]
+    for index, frame in enumerate(frames()):
+        records.append(pack('<IIII', index, 0, len(frame), len(frame)) + frame)
+    path.write_bytes(b''.join(records))
+    return str(path)
+
+
+class TestCapture:
+
+    @staticmethod
+    def test_capture(path):
+        with Capture(path) as capture:
+            result = columns.decode_columns(capture, LAYOUT)
+        assert list(result.rows['time_ns']) == [index * 1_000_000_000 for index in range(20)]
+        assert list(result.rows['sequence_number'][8:12]) == [8, 9, 0, 1]
+
+
+def all_data(columns_, layout, row):
+    # the reference encoding, through the objects
+    data = []
+    for name, data_type in layout:
+        value = columns_[name][row].item()
+        data.append(data_type(float(value) if data_type in (SinglePrecision, DoublePrecision) else value))
+    return bytes(AllData(*data))
+
+
+class TestEncode:
+
+    @staticmethod
+    @mark.parametrize('repeat', [1, 10, 30], ids=['short length', '1 byte length', '2 bytes length'])
+    def test_encode(repeat):
+        generator = numpy.random.default_rng(61850)
+        number = 100
+        columns_ = {'stVal': generator.random(number) > 0.5, 'mag': generator.standard_normal(number) * 1e6,
+                    'count': generator.integers(-2 ** 63, 2 ** 63 - 1, number) >> generator.integers(0, 63, number),
+                    'ang': generator.standard_normal(number).astype(numpy.float32),
+                    'ops': generator.integers(0, 2 ** 32, number) >> generator.integers(0, 32, number)}
+        layout = LAYOUT * repeat
+        encoded = columns.encode_all_data(columns_, layout)
+        assert len(encoded) == number
+        assert list(encoded) == [all_data(columns_, layout, row) for row in range(number)]
+
+    @staticmethod
+    def test_structured():
+        rows = columns.decode_columns(frames(), LAYOUT).rows
+        layout = LAYOUT[:1] + LAYOUT[2:]
+        assert columns.encode_all_data(rows, layout) == tuple(all_data(rows, layout, row) for row in range(len(rows)))
+
+    @staticmethod
+    def test_empty():
+        assert columns.encode_all_data({}, ()) == ()
+        assert columns.encode_all_data({'ops': numpy.array([], numpy.uint32)}, LAYOUT[-1:]) == ()
+
+    @staticmethod
+    @mark.parametrize('values, layout', [([1, 2], (('value', Boolean),)), ([True], (('value', Signed),)),
+                                         ([1], (('value', DoublePrecision),)), ([['a']], (('value', Unsigned),)),
+                                         ([1], (('value', VisibleString),))],
+                      ids=['boolean', 'integer', 'floating point', 'dimensions', 'data type'])
+    def test_type(values, layout):
+        with raises(TypeError):
+            columns.encode_all_data({'value': numpy.array(values)}, layout)
+
+    @staticmethod
+    @mark.parametrize('columns_, layout', [({'value': numpy.array([-1])}, (('value', Unsigned),)),
+                                           ({'value': numpy.array([2 ** 32])}, (('value', Unsigned),)),
+                                           ({'value': numpy.array([2 ** 63], numpy.uint64)}, (('value', Signed),)),
+                                           ({'a': numpy.array([True]), 'b': numpy.array([True, False])},
+                                            (('a', Boolean), ('b', Boolean))),
+                                           ({'value': numpy.ones(2)}, (('value', DoublePrecision),) * 6000)],
+                      ids=['negative', 'unsigned', 'signed', 'rows', 'length'])
+    def test_range(columns_, layout):
+        with raises(ValueError):
+            columns.encode_all_data(columns_, layout)
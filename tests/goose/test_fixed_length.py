@@ -0,0 +1,128 @@
+from pytest import fixture, mark, raises
+
+from py61850.goose.fixed_length import FixedLengthDecoder
+from py61850.goose.frame import Frame
+from py61850.goose.pdu import AllData, Structure
+from py61850.goose.publisher import Publisher
+from py61850.types import Boolean, VisibleString
+from py61850.types.bit_string import BitString
+from py61850.types.floating_point import DoublePrecision, SinglePrecision
+from py61850.types.integer import InternedUnsigned, Signed, Unsigned
+from py61850.types.octet_string import OctetString
+from py61850.types.times import Quality, Timestamp
+
+
+def members():
+    return Boolean(True), Signed(-3), Unsigned(7), SinglePrecision(0.5), DoublePrecision(2.5)
+
+
+@fixture
+def publisher():
+    publisher = Publisher(all_data=members(), fixed_length=True, compiled=True)
+    iter(publisher)
+    return publisher
+
+
+class TestEncoding:
+
+    @staticmethod
+    def test_constant_length(publisher):
+        lengths = set()
+        for index in range(600):
+            if index % 100 == 99:
+                publisher.protocol_data_unit.all_data[1] = -index ** 3
+            lengths.add(len(bytes(next(publisher))))
+        assert publisher.protocol_data_unit.status_number.value == 7
+        assert lengths == {len(bytes(publisher))}
+        assert publisher.fixed_length
+
+    @staticmethod
+    def test_fields(publisher):
+        pdu = Frame(bytes(next(publisher))).protocol_data_unit
+        for field in (pdu.time_allowed_to_live, pdu.status_number, pdu.sequence_number,
+                      pdu.configuration_revision, pdu.number_of_data_set_entries, pdu.all_data[1], pdu.all_data[2]):
+            assert field.length == 4
+
+    @staticmethod
+    def test_no_event():
+        publisher = Publisher(all_data=members())
+        iter(publisher)
+        next(publisher)
+        assert not publisher.fixed_length
+        publisher.protocol_data_unit.fixed_length = True
+        assert publisher.fixed_length and publisher.protocol_data_unit.all_data.fixed_length
+        frame = bytes(next(publisher))
+        assert Frame(frame).protocol_data_unit.status_number.value == 1  # the values did not change
+        assert len(frame) == len(bytes(Publisher(all_data=members(), fixed_length=True)))
+
+    @staticmethod
+    def test_same_values(publisher):
+        regular = Publisher(all_data=members())
+        iter(regular)
+        for _ in range(3):
+            fixed, frame = Frame(bytes(next(publisher))).protocol_data_unit, Frame(bytes(next(regular))).protocol_data_unit
+            assert fixed.status_number.value == frame.status_number.value
+            assert fixed.sequence_number.value == frame.sequence_number.value
+            assert AllData.decode(bytes(fixed.all_data))[0] == AllData.decode(bytes(frame.all_data))[0]
+
+    @staticmethod
+    def test_interned():
+        with raises(AttributeError):
+            Publisher(all_data=(InternedUnsigned(1),), fixed_length=True)
+        assert Publisher(all_data=(InternedUnsigned(1),)).fixed_length is False
+
+
+class TestDecoder:
+
+    @staticmethod
+    def test_decode(publisher):
+        decoder = FixedLengthDecoder(bytes(next(publisher)))
+        for index in range(300):
+            if index == 150:
+                publisher.protocol_data_unit.all_data[4] = 7.5
+            frame = bytes(next(publisher))
+            fields = decoder.decode(frame)
+            pdu = Frame(frame).protocol_data_unit
+            assert fields.time_allowed_to_live == pdu.time_allowed_to_live.value
+            assert fields.goose_timestamp == pdu.goose_timestamp.raw_value
+            assert (fields.status_number, fields.sequence_number) == (pdu.status_number.value,
+                                                                      pdu.sequence_number.value)
+            assert (fields.test, fields.configuration_revision, fields.needs_commissioning) == (False, 1, False)
+            assert fields.all_data == AllData.decode(bytes(pdu.all_data))[0]
+        assert decoder.size == len(frame)
+
+    @staticmethod
+    def test_other_stream(publisher):
+        decoder = FixedLengthDecoder(bytes(publisher))
+        other = Publisher(app_id=2, all_data=members(), fixed_length=True)
+        with raises(ValueError):
+            decoder.decode(bytes(other))
+        with raises(ValueError):
+            decoder.decode(bytes(publisher)[:-1])
+        assert decoder.decode(bytes(publisher) + b'\x00' * 4).all_data == (True, -3, 7, 0.5, 2.5)  # padded
+
+    @staticmethod
+    def test_raw_members():
+        publisher = Publisher(all_data=(Boolean(True), BitString('0110'), Timestamp(1.5, Quality()),
+                                        VisibleString('Okay'), OctetString(b'\x01\x02'), Signed(-3)), fixed_length=True)
+        iter(publisher)
+        decoder = FixedLengthDecoder(bytes(publisher))
+        all_data = publisher.protocol_data_unit.all_data
+        with all_data.batch():
+            all_data[3] = 'Fine'
+            all_data[2] = (2.5, Quality())
+        fields = decoder.decode(bytes(next(publisher)))
+        assert fields.status_number == 2
+        assert fields.all_data == (True, all_data[1].raw_value, all_data[2].raw_value, b'Fine', b'\x01\x02', -3)
+        all_data[3] = 'Longer'  # the string length changed
+        with raises(ValueError):
+            decoder.decode(bytes(next(publisher)))
+
+    @staticmethod
+    @mark.parametrize('frame', [bytes(Publisher(all_data=members())),
+                                bytes(Publisher(all_data=(Structure(Boolean(True)),), fixed_length=True)),
+                                b'\x00' * 64],
+                      ids=['variable length', 'structure', 'not goose'])
+    def test_not_fixed(frame):
+        with raises(ValueError):
+            FixedLengthDecoder(frame)
@@ -0,0 +1,81 @@
+from pytest import fixture, mark, raises
+
+from py61850.goose.frame import Frame
+from py61850.goose.publisher import Publisher
+from py61850.types import Boolean, VisibleString
+
+VIRTUAL_LAN = {
+    id: ['vlan', 'no_vlan'],
+    bool: [True, False],
+}
+
+
+def new_publisher(virtual_lan: bool) -> Publisher:
+    return Publisher(destination='01:0C:CD:01:00:13', source='00:11:22:33:44:55', virtual_lan=virtual_lan,
+                     vlan_priority=5, vlan_id=0x123, app_id=0x1234,
+                     all_data=(Boolean(True), VisibleString('Content')))
+
+
+class TestFrame:
+
+    @fixture
+    def publisher(self):
+        return new_publisher(True)
+
+    @fixture
+    def frame(self, publisher):
+        return Frame(bytes(publisher))
+
+    @staticmethod
+    def test_destination(frame):
+        assert frame.destination == '01-0C-CD-01-00-13'
+
+    @staticmethod
+    def test_source(frame):
+        assert frame.raw_source == b'\x00\x11\x22\x33\x44\x55'
+
+    @staticmethod
+    def test_app_id(frame, publisher):
+        assert frame.raw_app_id == publisher.raw_app_id and frame.app_id == '1234'
+
+    @staticmethod
+    def test_virtual_lan(frame):
+        assert (frame.virtual_lan.priority, frame.virtual_lan.vid) == (5, 0x123)
+
+    @staticmethod
+    def test_no_virtual_lan():
+        assert Frame(bytes(new_publisher(False))).virtual_lan is None
+
+    @mark.parametrize("virtual_lan", VIRTUAL_LAN[bool], ids=VIRTUAL_LAN[id])
+    def test_pdu(self, virtual_lan):
+        publisher = new_publisher(virtual_lan)
+        assert bytes(Frame(bytes(publisher)).protocol_data_unit) == bytes(publisher.protocol_data_unit)
+
+    @staticmethod
+    def test_padding(publisher):
+        frame = Frame(memoryview(bytes(publisher) + b'\x00' * 16))
+        assert frame.protocol_data_unit.all_data[1].value == 'Content'
+
+    @staticmethod
+    def test_unpack_header(publisher):
+        assert Frame.unpack_header(bytes(publisher)) == ((5 << 13) + 0x123, 0x1234, 26)
+
+    @staticmethod
+    def test_ether_type_error(publisher):
+        with raises(ValueError):
+            Frame(bytes(publisher)[:16] + b'\x88\xba' + bytes(publisher)[18:])
+
+    @staticmethod
+    def test_length_error(publisher):
+        with raises(ValueError):
+            Frame(bytes(publisher)[:-1])
+
+    @staticmethod
+    def test_short_error():
+        with raises(ValueError):
+            Frame(b'\x00' * 12)
+
+    @staticmethod
+    def test_lazy(publisher):
+        frame = Frame(bytes(publisher), lazy=True)
+        assert bytes(frame.protocol_data_unit) == bytes(publisher.protocol_data_unit)
@@ -1,9 +1,15 @@
-from pytest import fixture, raises
+from pytest import fixture, mark, raises
 
 from py61850.goose.pdu import AllData, ConfigurationRevision, DataSet, GooseControlBlockReference, GooseIdentifier
 from py61850.goose.pdu import GooseTimestamp, NeedsCommissioning, NumberOfDataSetEntries, ProtocolDataUnit
 from py61850.goose.pdu import SequenceNumber, StatusNumber, GooseTest, TimeAllowedToLive
 from py61850.types import Boolean, VisibleString
+from py61850.types.times import Quality
+
+PDU = ProtocolDataUnit(GooseControlBlockReference('IED_CFG/LLN0$GO$ControlBlockReference'), TimeAllowedToLive(1000),
+                       DataSet('IED_CFG/LLN0$DataSet'), GooseIdentifier('IED'), GooseTimestamp(0.0), StatusNumber(1),
+                       SequenceNumber(0), GooseTest(False), ConfigurationRevision(1), NeedsCommissioning(False),
+                       all_data=AllData(Boolean(True), VisibleString('Content')))
 
 
 class TestProtocolDataUnit:
@@ -335,3 +341,339 @@ class TestProtocolDataUnit:
                              st_num, sq_num, go_test, conf_rev, nds_com,
                              None, AllData(*all_data))
         assert str(info.value) == "ProtocolDataUnit out of supported length"
+
+    @staticmethod
+    def test_decode(pdu):
+        decoded = ProtocolDataUnit(raw_value=pdu.raw_value)
+        assert bytes(decoded) == bytes(pdu)
+
+    @staticmethod
+    def test_decode_fields(cb_ref, ttl, dat_set, go_id, t, st_num, sq_num, go_test, conf_rev, nds_com):
+        all_data = AllData(Boolean(True), VisibleString('Content'))
+        pdu = ProtocolDataUnit(cb_ref, ttl, dat_set, go_id, t, st_num, sq_num,
+                               go_test, conf_rev, nds_com, None, all_data)
+        decoded = ProtocolDataUnit(raw_value=memoryview(pdu.raw_value))
+        assert [value.value for value in decoded.all_data] == [True, 'Content']
+        assert decoded.goose_control_block_reference.value == cb_ref.value
+        assert decoded.time_allowed_to_live.value == ttl.value
+        assert decoded.goose_timestamp.value == t.value
+        assert decoded.number_of_data_set_entries.value == 2
+
+    @staticmethod
+    def test_decode_update(pdu):
+        decoded = iter(ProtocolDataUnit(raw_value=pdu.raw_value))
+        next(decoded)
+        next(decoded)
+        assert decoded.sequence_number.value == 1
+        assert bytes(decoded.sequence_number) in bytes(decoded)
+
+    @staticmethod
+    def test_decode_default_fields():
+        raw_value = b'\x80\x01a\x81\x01\x01\x82\x01b\x83\x01c\x84\x08\x00\x00\x00\x00\x00\x00\x00\x20' \
+                    b'\x85\x01\x01\x86\x01\x00\x88\x01\x01\x8a\x01\x00'
+        decoded = ProtocolDataUnit(raw_value=raw_value)
+        assert decoded.goose_test.value is False and decoded.needs_commissioning.value is False
+
+    @staticmethod
+    def test_decode_missing_field(pdu):
+        with raises(ValueError):
+            ProtocolDataUnit(raw_value=pdu.raw_value[len(pdu.goose_control_block_reference):])
+
+    @staticmethod
+    def test_decode_unknown_tag(pdu):
+        with raises(ValueError):
+            ProtocolDataUnit(raw_value=pdu.raw_value + b'\x9f\x00')
+
+    @staticmethod
+    def test_decode_wrong_num_of_entries(pdu):
+        with raises(ValueError):
+            ProtocolDataUnit(raw_value=pdu.raw_value[:-2] + b'\xab\x03\x83\x01\x00')
+
+
+class TestLazyProtocolDataUnit:
+
+    @fixture
+    def pdu(self):
+        return ProtocolDataUnit(GooseControlBlockReference('IED_CFG/LLN0$GO$ControlBlockReference'),
+                                TimeAllowedToLive(1000), DataSet('IED_CFG/LLN0$DataSet'), GooseIdentifier('IED'),
+                                GooseTimestamp(0.0), StatusNumber(1), SequenceNumber(0), GooseTest(False),
+                                ConfigurationRevision(1), NeedsCommissioning(False), None,
+                                AllData(Boolean(True), VisibleString('Content')))
+
+    @fixture
+    def lazy(self, pdu):
+        return ProtocolDataUnit(raw_value=pdu.raw_value, lazy=True)
+
+    @staticmethod
+    def test_not_decoded(lazy):
+        assert lazy.value.decoded == 0
+
+    @staticmethod
+    def test_decoded(lazy):
+        lazy.status_number
+        lazy.sequence_number
+        assert lazy.value.decoded == 2
+
+    @staticmethod
+    def test_cached(lazy):
+        assert lazy.status_number is lazy.status_number
+
+    @staticmethod
+    def test_bytes_not_decoded(pdu, lazy):
+        lazy.status_number
+        assert bytes(lazy) == bytes(pdu)
+        assert lazy.value.decoded == 1
+
+    @staticmethod
+    def test_bytes_all_data_not_decoded(pdu, lazy):
+        assert bytes(lazy.all_data) == bytes(pdu.all_data)
+        assert lazy.all_data.value.decoded == 0
+
+    @staticmethod
+    @mark.parametrize('data_type', [ProtocolDataUnit, AllData], ids=['pdu', 'all_data'])
+    def test_view_not_kept(pdu, data_type):
+        encoded = bytes(pdu if data_type is ProtocolDataUnit else pdu.all_data)
+        buffer = bytearray(encoded[2:])
+        decoded = data_type(raw_value=memoryview(buffer)) if data_type is ProtocolDataUnit else data_type(memoryview(buffer))
+        assert decoded._dirty  # not copied, but encoded again when read
+        buffer[:] = bytes(len(buffer))  # e.g. a receive buffer written again
+        assert bytes(decoded) == encoded
+
+    @staticmethod
+    def test_fields(pdu, lazy):
+        assert [bytes(field) for field in lazy.value] == [bytes(field) for field in pdu.value]
+
+    @staticmethod
+    def test_all_data_not_decoded(lazy):
+        assert lazy.all_data.value.decoded == 0
+
+    @staticmethod
+    def test_all_data(lazy):
+        assert lazy.all_data[1].value == 'Content'
+        assert lazy.all_data.value.decoded == 1
+
+    @staticmethod
+    def test_all_data_number_of_entries(lazy):
+        assert lazy.all_data.number_of_data_set_entries == 2
+
+    @staticmethod
+    def test_all_data_unsupported(pdu):
+        raw_value = pdu.raw_value[:-len(pdu.all_data)] + b'\xab\x05\x8c\x00\x83\x01\x00'
+        lazy = ProtocolDataUnit(raw_value=raw_value, lazy=True)
+        assert lazy.all_data[1].value is False
+        with raises(ValueError):
+            lazy.all_data[0]
+
+    @staticmethod
+    def test_slice(pdu, lazy):
+        assert [bytes(field) for field in lazy.value[5:7]] == [bytes(pdu.status_number), bytes(pdu.sequence_number)]
+
+    @staticmethod
+    def test_index_error(lazy):
+        with raises(IndexError):
+            lazy.all_data[2]
+
+    @staticmethod
+    def test_update(lazy):
+        iter_lazy = iter(lazy)
+        iter_lazy.all_data[0].value = False
+        assert next(iter_lazy).status_number.value == 2
+
+    @staticmethod
+    def test_default_fields():
+        raw_value = b'\x80\x01a\x81\x01\x01\x82\x01b\x83\x01c\x84\x08\x00\x00\x00\x00\x00\x00\x00\x20' \
+                    b'\x85\x01\x01\x86\x01\x00\x88\x01\x01\x8a\x01\x00'
+        lazy = ProtocolDataUnit(raw_value=raw_value, lazy=True)
+        assert lazy.goose_test.value is False and lazy.value.decoded == 4  # numDatSetEntries checked too
+
+    @staticmethod
+    def test_default_fields_parent():
+        raw_value = b'\x80\x01a\x81\x01\x01\x82\x01b\x83\x01c\x84\x08\x00\x00\x00\x00\x00\x00\x00\x20' \
+                    b'\x85\x01\x01\x86\x01\x00\x88\x01\x01\x8a\x01\x00'
+        lazy = ProtocolDataUnit(raw_value=raw_value, lazy=True)
+        bytes(lazy)
+        lazy.goose_test.value = True
+        assert bytes(lazy).endswith(b'\x87\x01\x0f\x88\x01\x01\x89\x01\x00\x8a\x01\x00\xab\x00')
+
+    @staticmethod
+    def test_number_of_entries(pdu):
+        raw_value = pdu.raw_value.replace(b'\x8a\x01\x02', b'\x8a\x01\x03')
+        lazy = ProtocolDataUnit(raw_value=raw_value, lazy=True)
+        assert lazy.status_number.value == 1
+        with raises(ValueError):
+            lazy.all_data
+        with raises(ValueError):
+            ProtocolDataUnit(raw_value=raw_value[:-len(pdu.all_data)], lazy=True)  # no allData, 3 entries
+
+
+class TestProtocolDataUnitUpdate:
+
+    @fixture
+    def pdu(self):
+        return ProtocolDataUnit(GooseControlBlockReference('IED_CFG/LLN0$GO$ControlBlockReference'),
+                                TimeAllowedToLive(1000), DataSet('IED_CFG/LLN0$DataSet'), GooseIdentifier('IED'),
+                                GooseTimestamp(0.0), StatusNumber(1), SequenceNumber(0), GooseTest(False),
+                                ConfigurationRevision(1), NeedsCommissioning(False), None,
+                                AllData(Boolean(True), VisibleString('Content')))
+
+    @staticmethod
+    def test_next_deferred(pdu):
+        iter_pdu = iter(pdu)
+        next(iter_pdu)
+        next(iter_pdu)
+        assert pdu._dirty is True
+
+    @staticmethod
+    def test_next_bytes(pdu):
+        iter_pdu = iter(pdu)
+        next(iter_pdu)
+        next(iter_pdu)
+        assert bytes(pdu).endswith(b'\x86\x01\x01\x87\x01\x00\x88\x01\x01\x89\x01\x00\x8a\x01\x02'
+                                   b'\xab\x0c\x83\x01\x0f\x8a\x07Content')
+
+    @staticmethod
+    def test_all_data_bytes(pdu):
+        pdu.all_data[1].value = 'New Content'
+        assert bytes(pdu).endswith(b'\xab\x10\x83\x01\x0f\x8a\x0bNew Content')
+        assert pdu.length == len(pdu.raw_value)
+
+    @staticmethod
+    def test_field_bytes(pdu):
+        pdu.goose_identifier.value = 'Another IED'
+        assert bytes(pdu.goose_identifier) in bytes(pdu)
+
+
+class TestProtocolDataUnitBatch:
+
+    @fixture
+    def iter_pdu(self):
+        return iter(ProtocolDataUnit(GooseControlBlockReference('IED_CFG/LLN0$GO$ControlBlockReference'),
+                                     TimeAllowedToLive(1000), DataSet('IED_CFG/LLN0$DataSet'), GooseIdentifier('IED'),
+                                     GooseTimestamp(0.0), StatusNumber(1), SequenceNumber(0), GooseTest(False),
+                                     ConfigurationRevision(1), NeedsCommissioning(False), None,
+                                     AllData(Boolean(True), VisibleString('Content'))))
+
+    @staticmethod
+    def test_no_batch(iter_pdu):
+        next(iter_pdu)
+        iter_pdu.all_data[0] = False
+        iter_pdu.all_data[1] = 'New Content'
+        assert iter_pdu.status_number.value == 3
+
+    @staticmethod
+    def test_batch_status_number(iter_pdu):
+        next(iter_pdu)
+        next(iter_pdu)
+        with iter_pdu.all_data.batch() as all_data:
+            all_data[0] = False
+            all_data[1] = 'New Content'
+            assert iter_pdu.status_number.value == 1
+        assert iter_pdu.status_number.value == 2
+        assert iter_pdu.sequence_number.value == 0
+
+    @staticmethod
+    def test_batch_bytes(iter_pdu):
+        with iter_pdu.all_data.batch() as all_data:
+            all_data[1] = 'New Content'
+        assert bytes(iter_pdu).endswith(b'\x85\x01\x02\x86\x01\x00\x87\x01\x00\x88\x01\x01\x89\x01\x00\x8a\x01\x02'
+                                        b'\xab\x10\x83\x01\x0f\x8a\x0bNew Content')
+
+    @staticmethod
+    def test_batch_nested(iter_pdu):
+        with iter_pdu.all_data.batch() as all_data:
+            all_data[0] = False
+            with all_data.batch():
+                all_data[1] = 'New Content'
+            assert iter_pdu.status_number.value == 1
+        assert iter_pdu.status_number.value == 2
+
+    @staticmethod
+    def test_batch_same_value(iter_pdu):
+        next(iter_pdu)
+        next(iter_pdu)
+        with iter_pdu.all_data.batch() as all_data:
+            all_data[0] = False
+            all_data[0] = True
+            all_data[1] = 'Content'
+        assert iter_pdu.status_number.value == 1
+        assert next(iter_pdu).sequence_number.value == 2
+
+    @staticmethod
+    def test_batch_error(iter_pdu):
+        with raises(ValueError):
+            with iter_pdu.all_data.batch() as all_data:
+                all_data[0] = False
+                all_data[1] = 'a' * 0x100
+        assert iter_pdu.status_number.value == 2
+        assert iter_pdu.all_data[0].value is False
+
+
+class TestFunctionalFields:
+
+    @staticmethod
+    def test_status_number_encode():
+        assert StatusNumber.encode(1) == b'\x85\x01\x01'
+
+    @staticmethod
+    def test_status_number_decode():
+        assert StatusNumber.decode(b'\x85\x01\x01') == (1, 3)
+
+    @staticmethod
+    def test_goose_identifier_decode():
+        assert GooseIdentifier.decode(b'\x83\x03IED') == ('IED', 5)
+
+    @staticmethod
+    def test_goose_identifier_max_length():
+        with raises(ValueError):
+            GooseIdentifier.encode('a' * 66)
+
+    @staticmethod
+    def test_all_data_encode():
+        value = ((Boolean, True), (VisibleString, 'Content'))
+        assert AllData.encode(value) == bytes(AllData(Boolean(True), VisibleString('Content')))
+
+    @staticmethod
+    def test_all_data_decode():
+        assert AllData.decode(b'\xab\x0c\x83\x01\x0f\x8a\x07Content') == ((True, 'Content'), 14)
+
+    @staticmethod
+    def test_protocol_data_unit_encode():
+        value = ('IED_CFG/LLN0$GO$ControlBlockReference', 1000, 'IED_CFG/LLN0$DataSet', 'IED', (0.0, Quality()),
+                 1, 0, False, 1, False, None, ((Boolean, True), (VisibleString, 'Content')))
+        assert ProtocolDataUnit.encode(value) == bytes(PDU)
+
+    @staticmethod
+    def test_protocol_data_unit_decode():
+        value, end = ProtocolDataUnit.decode(b'\x00' + bytes(PDU), 1)
+        assert end == len(PDU) + 1
+        assert value[:4] + value[5:] == ('IED_CFG/LLN0$GO$ControlBlockReference', 1000, 'IED_CFG/LLN0$DataSet', 'IED',
+                                         1, 0, False, 1, False, 2, (True, 'Content'))
+        assert value[4][0] == 0.0
+
+    @staticmethod
+    def test_protocol_data_unit_defaults():
+        # test, ndsCom and allData may be left out
+        raw_value = b''.join(bytes(field) for field in PDU.value[:7]) + bytes(PDU.value[8]) + b'\x8a\x01\x00'
+        assert ProtocolDataUnit.decode(ProtocolDataUnit.pack_tlv(b'\x61', raw_value))[0][7:] == (False, 1, False, 0, ())
+
+    @staticmethod
+    def test_protocol_data_unit_errors():
+        value = ('IED_CFG/LLN0$GO$ControlBlockReference', 1000, 'IED_CFG/LLN0$DataSet', 'IED', (0.0, Quality()),
+                 1, 0, False, 1, False, 3, ((Boolean, True),))
+        with raises(ValueError):
+            ProtocolDataUnit.encode(value)  # number of entries
+        with raises(ValueError):
+            ProtocolDataUnit.encode(value[:11])
+        with raises(ValueError):
+            ProtocolDataUnit.decode(b'\x61\x03\x85\x01\x01')  # missing fields
+
+
+class TestGooseTimestamp:
+
+    @staticmethod
+    def test_default_quality():
+        assert GooseTimestamp(1.5).raw_value[7:] == bytes(Quality())
+
+    @staticmethod
+    def test_decode_quality():
+        assert GooseTimestamp(b'\x00\x00\x00\x01\x00\x00\x05\x00').clock_not_synchronized is False
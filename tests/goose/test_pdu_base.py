@@ -2,9 +2,13 @@ from pytest import fixture, mark, raises
 
 from py61850.goose.pdu import AllData, ConfigurationRevision, DataSet, GooseControlBlockReference, GooseIdentifier
 from py61850.goose.pdu import GooseTimestamp, NeedsCommissioning, NumberOfDataSetEntries, SequenceNumber, StatusNumber
-from py61850.goose.pdu import GooseTest, TimeAllowedToLive
-from py61850.types import Boolean
-from py61850.types.times import Quality
+from py61850.goose.pdu import Array, GooseTest, Structure, TimeAllowedToLive
+from py61850.types import Boolean, VisibleString
+from py61850.types.bit_string import BitString
+from py61850.types.floating_point import DoublePrecision, SinglePrecision
+from py61850.types.integer import Signed, Unsigned
+from py61850.types.octet_string import OctetString
+from py61850.types.times import Quality, Timestamp
 
 
 # === BOOLEAN ===
@@ -366,3 +370,72 @@ class TestAllData:
         true = Boolean(True)
         all_data = AllData(Boolean(False), true)
         assert all_data[1] == true
+
+    @staticmethod
+    def test_decode():
+        all_data = AllData(Boolean(True), Signed(-5), Unsigned(6), SinglePrecision(3.5), DoublePrecision(1.25),
+                           VisibleString('Content'), Timestamp(1.1, Quality()))
+        decoded = AllData(bytes(all_data)[2:])
+        assert [value.value for value in decoded] == [value.value for value in all_data]
+
+    @staticmethod
+    def test_decode_number_of_entries():
+        assert AllData(memoryview(b'\x83\x01\x00\x83\x01\x0F')).number_of_data_set_entries == 2
+
+    @staticmethod
+    def test_decode_empty():
+        assert AllData(b'').raw_value is None
+
+    @staticmethod
+    def test_decode_error_tag():
+        assert raises(ValueError, AllData, b'\x8C\x00')  # binary time
+
+    @staticmethod
+    def test_decode_structure():
+        all_data = AllData(Structure(Boolean(True), BitString('0000000000000'), Timestamp(1.1, Quality())),
+                           Array(Signed(1), Signed(-2)), OctetString(b'\x01\x02'))
+        decoded = AllData(bytes(all_data)[2:])
+        assert [type(value) for value in decoded] == [Structure, Array, OctetString]
+        assert [value.value for value in decoded[0]] == [value.value for value in all_data[0]]
+        structure, array, octet_string = AllData.decode(bytes(all_data))[0]
+        assert (structure[:2], array, octet_string) == ((True, '0000000000000'), (1, -2), b'\x01\x02')
+
+    @staticmethod
+    def test_update_structure():
+        all_data = AllData(Structure(Boolean(False), BitString('00')))
+        all_data[0][0].value = True
+        assert bytes(all_data) == b'\xAB\x09\xA2\x07\x83\x01\x0F\x84\x02\x06\x00'
+
+    @staticmethod
+    def test_update_deferred():
+        all_data = AllData(Boolean(False), Boolean(True))
+        all_data[0].value = True
+        assert all_data._dirty is True
+
+    @staticmethod
+    def test_update_bytes():
+        all_data = AllData(Boolean(False), VisibleString('a'))
+        all_data[0].value = True
+        all_data[1].value = 'bc'
+        assert bytes(all_data) == b'\xAB\x07\x83\x01\x0F\x8A\x02bc'
+        assert all_data._dirty is False
+
+    @staticmethod
+    def test_update_len():
+        all_data = AllData(VisibleString('a'))
+        all_data[0].value = 'abc'
+        assert len(all_data) == 7 and all_data.length == 5 and all_data.raw_length == b'\x05'
+
+    @staticmethod
+    def test_set_item():
+        all_data = AllData(Boolean(False), VisibleString('a'))
+        all_data[1] = 'b'
+        assert bytes(all_data) == b'\xAB\x06\x83\x01\x00\x8A\x01b'
+
+    @staticmethod
+    def test_batch():
+        all_data = AllData(Boolean(False), VisibleString('a'))
+        with all_data.batch():
+            all_data[0] = True
+            all_data[1] = 'b'
+        assert bytes(all_data) == b'\xAB\x06\x83\x01\x0F\x8A\x01b'
@@ -0,0 +1,191 @@
+from pytest import fixture, mark, raises
+
+from py61850.goose.publisher import Publisher
+from py61850.types import Boolean, VisibleString
+
+VIRTUAL_LAN = {
+    id: ['vlan', 'no_vlan'],
+    bool: [True, False],
+}
+
+
+def new_publisher(virtual_lan: bool, compiled: bool, **kwargs) -> Publisher:
+    return Publisher(virtual_lan=virtual_lan, compiled=compiled,
+                     all_data=(Boolean(True), VisibleString('Content')), **kwargs)
+
+
+class TestPublisher:
+
+    @fixture
+    def publisher(self):
+        return new_publisher(False, False)
+
+    @staticmethod
+    def test_bytes(publisher):
+        assert bytes(publisher) == b'\x01\x0c\xcd\x01\x00\x00' \
+                                   b'\x00\x00\x00\x00\x00\x00' \
+                                   b'\x88\xb8' \
+                                   b'\x00\x01\x00\x7a\x00\x00\x00\x00' \
+                                   b'\x61\x70' \
+                                   b'\x80\x25IED_CFG/LLN0$GO$ControlBlockReference' \
+                                   b'\x81\x02\x03\xe8' \
+                                   b'\x82\x14IED_CFG/LLN0$DataSet' \
+                                   b'\x83\x03IED' \
+                                   b'\x84\x08\x00\x00\x00\x00\x00\x00\x00\x20' \
+                                   b'\x85\x01\x01' \
+                                   b'\x86\x01\x00' \
+                                   b'\x87\x01\x00' \
+                                   b'\x88\x01\x01' \
+                                   b'\x89\x01\x00' \
+                                   b'\x8a\x01\x02' \
+                                   b'\xab\x0c\x83\x01\x0f\x8a\x07Content'
+
+    @staticmethod
+    def test_no_iter(publisher):
+        with raises(TypeError) as info:
+            next(publisher)
+        assert str(info.value) == "'Publisher' object is not iterable"
+
+    @staticmethod
+    def test_not_compiled(publisher):
+        assert publisher.compiled is False
+
+
+class TestCompiledPublisher:
+
+    @mark.parametrize("virtual_lan", VIRTUAL_LAN[bool], ids=VIRTUAL_LAN[id])
+    def test_bytes(self, virtual_lan):
+        assert bytes(new_publisher(virtual_lan, True)) == bytes(new_publisher(virtual_lan, False))
+
+    @mark.parametrize("virtual_lan", VIRTUAL_LAN[bool], ids=VIRTUAL_LAN[id])
+    def test_iter(self, virtual_lan):
+        compiled = iter(new_publisher(virtual_lan, True))
+        regular = iter(new_publisher(virtual_lan, False))
+        for _ in range(8):
+            assert bytes(next(compiled)) == bytes(next(regular))
+
+    @staticmethod
+    def test_iter_length_change():
+        compiled = iter(new_publisher(True, True, sequence_number=0xFE))
+        regular = iter(new_publisher(True, False, sequence_number=0xFE))
+        frames = [len(bytes(next(compiled))) for _ in range(3)]
+        for _ in range(3):
+            next(regular)
+        assert bytes(compiled) == bytes(regular)
+        assert frames[0] + 1 == frames[2]
+
+    @staticmethod
+    def test_iter_all_data_change():
+        compiled = iter(new_publisher(True, True))
+        regular = iter(new_publisher(True, False))
+        for publisher in (compiled, regular):
+            bytes(next(publisher))
+            publisher.protocol_data_unit.all_data[1].value = 'New Content'
+            next(publisher)
+        assert bytes(compiled) == bytes(regular)
+
+    @staticmethod
+    def test_iter_status_number():
+        compiled = iter(new_publisher(True, True))
+        bytes(next(compiled))
+        compiled.protocol_data_unit.all_data[0].value = False
+        next(compiled)
+        assert compiled.protocol_data_unit.status_number.value == 2
+
+    @staticmethod
+    def test_iter_other_field_change():
+        compiled = iter(new_publisher(True, True))
+        regular = iter(new_publisher(True, False))
+        for publisher in (compiled, regular):
+            bytes(next(publisher))
+            publisher.protocol_data_unit.goose_identifier.value = 'Another IED'
+            next(publisher)
+        assert bytes(compiled) == bytes(regular)
+
+    @staticmethod
+    @mark.parametrize('name, mac_address', [('destination', b'\x01\x0c\xcd\x01\x00\x05'),
+                                            ('source', b'\x00\x01\x02\x03\x04\x05')],
+                      ids=['destination', 'source'])
+    def test_header_change(name, mac_address):
+        compiled = iter(new_publisher(True, True))
+        regular = iter(new_publisher(True, False))
+        for publisher in (compiled, regular):
+            bytes(next(publisher))
+            setattr(publisher, name, mac_address)
+            next(publisher)
+        assert bytes(compiled) == bytes(regular)
+        assert mac_address in bytes(compiled)[:12]
+
+    @staticmethod
+    def test_protocol_data_unit():
+        compiled = iter(new_publisher(True, True))
+        regular = iter(new_publisher(True, False))
+        for _ in range(3):
+            next(compiled)
+            next(regular)
+        assert bytes(compiled.protocol_data_unit) == bytes(regular.protocol_data_unit)
+
+    @staticmethod
+    def test_compiled():
+        assert new_publisher(True, True).compiled is True
+
+
+class TestRenderBatch:
+
+    @mark.parametrize("compiled", [True, False], ids=['compiled', 'not_compiled'])
+    def test_frames(self, compiled):
+        batched = new_publisher(True, compiled)
+        regular = iter(new_publisher(True, False))
+        buffer = bytearray(4096)
+        frames = batched.render_batch(8, buffer)
+        for offset, length in frames:
+            assert buffer[offset:offset + length] == bytes(next(regular))
+
+    @staticmethod
+    def test_back_to_back():
+        frames = new_publisher(True, True).render_batch(3, bytearray(4096), offset=10)
+        assert [offset for offset, _ in frames] == [10, 10 + frames[0][1], 10 + frames[0][1] + frames[1][1]]
+
+    @staticmethod
+    def test_continues():
+        batched = new_publisher(False, True)
+        regular = iter(new_publisher(False, False))
+        buffer = bytearray(4096)
+        batched.render_batch(2, buffer)
+        for _ in range(3):
+            next(regular)
+        (offset, length), = batched.render_batch(1, memoryview(buffer))
+        assert buffer[offset:offset + length] == bytes(regular)
+
+    @staticmethod
+    def test_length_change():
+        batched = new_publisher(True, True, sequence_number=0xFE)
+        regular = iter(new_publisher(True, False, sequence_number=0xFE))
+        buffer = bytearray(4096)
+        for offset, length in batched.render_batch(3, buffer):
+            assert buffer[offset:offset + length] == bytes(next(regular))
+
+    @staticmethod
+    def test_short_buffer():
+        with raises(ValueError) as info:
+            new_publisher(True, True).render_batch(2, bytearray(200))
+        assert str(info.value) == 'buffer out of supported length'
+
+    @staticmethod
+    @mark.parametrize('event', [False, True], ids=['retransmission', 'event'])
+    def test_short_buffer_state(event):
+        batched = new_publisher(True, True)
+        regular = iter(new_publisher(True, False))
+        batched.render_batch(2, bytearray(4096))
+        for _ in range(2):
+            next(regular)
+        if event:
+            for publisher in (batched, regular):
+                publisher.protocol_data_unit.all_data[0] = False
+        sequence_number = batched.protocol_data_unit.sequence_number.value
+        with raises(ValueError):
+            batched.render_batch(3, bytearray(100))  # not even a frame
+        assert batched.protocol_data_unit.sequence_number.value == sequence_number
+        buffer = bytearray(4096)
+        for offset, length in batched.render_batch(8, buffer):  # nothing skipped, time allowed to live included
+            assert buffer[offset:offset + length] == bytes(next(regular))
@@ -0,0 +1,72 @@
+from pytest import fixture, mark, raises
+
+from py61850.goose.frame import Frame
+from py61850.goose.publisher import Publisher
+from py61850.goose.retransmission import RetransmissionCurve
+from py61850.types import Boolean
+
+
+class TestRetransmissionCurve:
+
+    @fixture
+    def curve(self):
+        return RetransmissionCurve(t0=1.0, t1=0.002)
+
+    @mark.parametrize("sequence_number, interval", [(0, 0.002), (1, 0.004), (8, 0.512), (9, 1.0), (1000, 1.0)])
+    def test_interval(self, curve, sequence_number, interval):
+        assert curve.interval(sequence_number) == interval
+
+    @mark.parametrize("sequence_number, time_allowed_to_live", [(0, 4), (1, 8), (9, 2000)])
+    def test_time_allowed_to_live(self, curve, sequence_number, time_allowed_to_live):
+        assert curve.time_allowed_to_live(sequence_number) == time_allowed_to_live
+
+    @staticmethod
+    def test_multiplier():
+        curve = RetransmissionCurve(t0=1.0, t1=0.1, multiplier=3)
+        assert [curve.interval(number) for number in range(4)] == [0.1, 0.30000000000000004, 0.9000000000000001, 1.0]
+
+    @mark.parametrize("kwargs", [{'t1': 0}, {'t1': 2.0}, {'multiplier': 1}, {'tal_factor': 0.5}],
+                      ids=['t1_zero', 't1_t0', 'multiplier', 'tal_factor'])
+    def test_range(self, kwargs):
+        with raises(ValueError):
+            RetransmissionCurve(**kwargs)
+
+
+class TestPublisherCurve:
+
+    @staticmethod
+    def test_next_goose_timer():
+        publisher = iter(Publisher(curve=RetransmissionCurve(t0=1.0, t1=0.25)))
+        timers = [next(publisher).next_goose_timer for _ in range(4)]
+        assert timers == [0.25, 0.5, 1.0, 1.0]
+
+    @staticmethod
+    def test_time_allowed_to_live():
+        publisher = iter(Publisher(curve=RetransmissionCurve(t0=1.0, t1=0.25)))
+        pdu = publisher.protocol_data_unit
+        values = [next(publisher) and pdu.time_allowed_to_live.value for _ in range(4)]
+        assert values == [500, 1000, 2000, 2000]
+
+    @mark.parametrize("compiled", [True, False], ids=['compiled', 'not_compiled'])
+    def test_default_curve(self, compiled):
+        publisher = iter(Publisher(time_allowed_to_live=5000, compiled=compiled))
+        frames = [Frame(bytes(next(publisher))).protocol_data_unit for _ in range(12)]
+        assert [pdu.time_allowed_to_live.value for pdu in frames] == [5000] * 12
+        assert publisher.next_goose_timer == 1.0
+
+    @staticmethod
+    def test_event():
+        publisher = iter(Publisher(all_data=(Boolean(True),),
+                                   curve=RetransmissionCurve(t0=1.0, t1=0.25)))
+        for _ in range(4):
+            next(publisher)
+        publisher.protocol_data_unit.all_data[0] = False
+        next(publisher)
+        assert publisher.next_goose_timer == 0.25
+        assert publisher.protocol_data_unit.time_allowed_to_live.value == 500
+
+    @mark.parametrize("compiled", [True, False], ids=['compiled', 'not_compiled'])
+    def test_bytes(self, compiled):
+        publisher = iter(Publisher(compiled=compiled, curve=RetransmissionCurve(t0=1.0, t1=0.001)))
+        frames = [Frame(bytes(next(publisher))).protocol_data_unit for _ in range(12)]
+        assert [pdu.time_allowed_to_live.value for pdu in frames] == [2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 2000, 2000]
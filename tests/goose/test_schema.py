@@ -0,0 +1,132 @@
+from itertools import islice, product
+
+from pytest import mark, raises
+
+from py61850.goose.pdu import AllData
+from py61850.goose.publisher import Publisher
+from py61850.goose.schema import CACHED_CODECS, Codecs, compile_codec, layout_of, DataSetCodec
+from py61850.goose.subscriber import Subscriber
+from py61850.types import Boolean, VisibleString
+from py61850.types.floating_point import DoublePrecision, SinglePrecision
+from py61850.types.integer import Signed, Unsigned
+from py61850.types.times import Quality, Timestamp
+
+REFERENCE = 'IED_CFG/LLN0$GO$ControlBlockReference'
+
+FIXED = ((Boolean, True), (SinglePrecision, 0.5), (DoublePrecision, -1.25), (Boolean, False))
+VARIABLE = ((Boolean, True), (Unsigned, 300), (Signed, -2), (VisibleString, 'Okay'), (DoublePrecision, 1e100),
+            (Timestamp, (1.5, Quality())))
+
+
+def objects(members):
+    return AllData(*[data_type(*value) if isinstance(value, tuple) else data_type(value) for data_type, value in members])
+
+
+class TestDataSetCodec:
+
+    @staticmethod
+    @mark.parametrize('members, fixed', [(FIXED, True), (FIXED * 20, True), (VARIABLE, False), ((), True)],
+                      ids=['fixed', 'long fixed', 'variable', 'empty'])
+    def test_encode(members, fixed):
+        codec = DataSetCodec([data_type for data_type, _ in members])
+        assert codec.fixed is fixed
+        assert codec.encode([value for _, value in members]) == bytes(objects(members))
+
+    @staticmethod
+    @mark.parametrize('members', [FIXED, FIXED * 20, VARIABLE, ()], ids=['fixed', 'long fixed', 'variable', 'empty'])
+    def test_decode(members):
+        encoded = bytes(objects(members))
+        codec = DataSetCodec([data_type for data_type, _ in members])
+        assert codec.decode(b'\x00' + encoded, 1) == (AllData.decode(encoded)[0], len(encoded) + 1)
+
+    @staticmethod
+    @mark.parametrize('data_types, members', [
+        ((Boolean, DoublePrecision), ((Boolean, True), (SinglePrecision, 1.5))),
+        ((Boolean, Boolean), ((Boolean, True), (Boolean, False), (Boolean, True))),
+        ((Boolean, SinglePrecision), ((Boolean, True), (Signed, 1), (Signed, 1), (Signed, 1))),
+        ((Boolean, Unsigned), ((Boolean, True), (Signed, 1))),
+        ((Boolean, Unsigned), ((Boolean, True), (Unsigned, 1), (Unsigned, 1))),
+    ], ids=['fixed length', 'fixed members', 'fixed tag', 'variable tag', 'variable members'])
+    def test_mismatch(data_types, members):
+        with raises(ValueError):
+            DataSetCodec(data_types).decode_value(objects(members).raw_value)
+
+    @staticmethod
+    def test_decode_tag():
+        with raises(ValueError):
+            DataSetCodec((Boolean,)).decode(bytes(Boolean(True)))
+
+    @staticmethod
+    @mark.parametrize('values, error', [((True,), ValueError), ((True, 'Okay'), TypeError)],
+                      ids=['length', 'type'])
+    def test_encode_error(values, error):
+        with raises(error):
+            DataSetCodec((Boolean, DoublePrecision)).encode(values)
+
+    @staticmethod
+    @mark.parametrize('members', [((Signed, -0x80), (Signed, 0x7FFF), (Signed, -2 ** 31), (Signed, 2 ** 63 - 1)),
+                                  ((Unsigned, 0xFF), (Unsigned, 0xFFFF), (Unsigned, 0xFFFFFFFF), (Boolean, True))],
+                      ids=['signed', 'unsigned'])
+    def test_lengths(members):
+        all_data = objects(members)
+        codec = DataSetCodec(*layout_of(all_data.raw_value))
+        assert codec.fixed
+        assert codec.decode_value(all_data.raw_value) == tuple(value for _, value in members)
+        assert codec.encode([value for _, value in members]) == bytes(all_data)  # not by a `Struct`
+
+    @staticmethod
+    def test_compile():
+        assert compile_codec([Boolean, Unsigned]) is compile_codec((Boolean, Unsigned))
+        assert compile_codec([Boolean]) is not compile_codec([Boolean, Unsigned])
+        assert compile_codec([Boolean]).data_types == (Boolean,)
+
+    @staticmethod
+    def test_compile_bounded():
+        first = compile_codec([Unsigned], [1])
+        for data_types in islice(product((Boolean, SinglePrecision, DoublePrecision), repeat=7), CACHED_CODECS):
+            compile_codec(data_types)
+        assert compile_codec([Unsigned], [1]) is not first
+        assert compile_codec([Unsigned], [1]) is compile_codec((Unsigned,), (1,))
+
+
+class TestCodecs:
+
+    @staticmethod
+    def test_layout_of():
+        data_types = tuple(data_type for data_type, _ in VARIABLE)
+        assert layout_of(objects(VARIABLE).raw_value) == (data_types, (1, 2, 1, 4, 9, 8))
+
+    @staticmethod
+    def test_learn():
+        codecs = Codecs()
+        raw_value = objects(FIXED).raw_value
+        assert codecs.get(REFERENCE, 1) is None
+        assert codecs.decode_value(REFERENCE, 1, raw_value) == (True, 0.5, -1.25, False)
+        codec = codecs.get(REFERENCE, 1)
+        assert codec is compile_codec([data_type for data_type, _ in FIXED], [1, 5, 9, 1])
+        assert codecs.decode_value(REFERENCE, 1, raw_value) == (True, 0.5, -1.25, False)
+        assert codecs.get(REFERENCE, 1) is codec
+        assert codecs.decode_value(REFERENCE, 1, objects(VARIABLE).raw_value)[0:3] == (True, 300, -2)
+        assert codecs.get(REFERENCE, 1) is not codec  # learned again
+        assert not codecs.get(REFERENCE, 1).fixed  # because of the visible string
+        codecs.decode_value(REFERENCE, 2, raw_value)
+        assert len(codecs) == 2
+
+    @staticmethod
+    def test_integers():
+        codecs = Codecs()
+        for members in (((Signed, -1), (Unsigned, 1)), ((Signed, -1000), (Unsigned, 1)),
+                        ((Signed, -1000), (Unsigned, 1))):
+            assert codecs.decode_value(REFERENCE, 1, objects(members).raw_value) == tuple(v for _, v in members)
+            assert codecs.get(REFERENCE, 1).fixed
+        assert codecs.get(REFERENCE, 1) is compile_codec((Signed, Unsigned), (2, 1))
+
+    @staticmethod
+    def test_shared():
+        codecs = Codecs()
+        first, second = Subscriber(codecs=codecs), Subscriber(codecs=codecs)
+        publisher = Publisher(all_data=(Boolean(True), DoublePrecision(1.5)))
+        first.receive(bytes(publisher))
+        assert codecs.get(REFERENCE, 1).data_types == (Boolean, DoublePrecision)
+        assert second.receive(bytes(publisher)).all_data == (True, 1.5)
+        assert len(codecs) == 1
@@ -0,0 +1,139 @@
+from pytest import fixture, raises
+
+from py61850.goose.pdu import Structure
+from py61850.goose.publisher import Publisher
+from py61850.goose.retransmission import RetransmissionCurve
+from py61850.goose.subscriber import Subscriber
+from py61850.types import Boolean, VisibleString
+from py61850.types.bit_string import BitString
+from py61850.types.octet_string import OctetString
+
+REFERENCE = 'IED_CFG/LLN0$GO$ControlBlockReference'
+
+
+class Recorder:
+
+    def __init__(self) -> None:
+        self.changes, self.gaps, self.revisions = [], [], []
+
+    def subscriber(self) -> Subscriber:
+        return Subscriber(on_change=lambda stream: self.changes.append(stream.all_data),
+                          on_gap=lambda stream, *expected: self.gaps.append(expected),
+                          on_revision=lambda stream, previous: self.revisions.append(previous))
+
+
+@fixture
+def recorder():
+    return Recorder()
+
+
+@fixture
+def publisher():
+    publisher = Publisher(all_data=(Boolean(True), VisibleString('Okay')), curve=RetransmissionCurve())
+    iter(publisher)
+    return publisher
+
+
+def frames(publisher, number):
+    return [bytes(next(publisher)) for _ in range(number)]
+
+
+class TestSubscriber:
+
+    @staticmethod
+    def test_retransmissions(recorder, publisher):
+        subscriber = recorder.subscriber()
+        for frame in frames(publisher, 5):
+            stream = subscriber.receive(frame)
+        assert recorder.changes == [(True, 'Okay')]
+        assert recorder.gaps == recorder.revisions == []
+        assert (subscriber.decoded, subscriber.skipped) == (1, 4)
+        assert (stream.status_number, stream.sequence_number) == (1, 4)
+        assert (stream.app_id, stream.control_block_reference) == (1, REFERENCE)
+        assert stream.configuration_revision == 1
+        assert stream.time_allowed_to_live == 64
+
+    @staticmethod
+    def test_change(recorder, publisher):
+        subscriber = recorder.subscriber()
+        for frame in frames(publisher, 3):
+            subscriber.receive(frame)
+        publisher.protocol_data_unit.all_data[0] = False
+        for frame in frames(publisher, 3):
+            stream = subscriber.receive(frame)
+        assert recorder.changes == [(True, 'Okay'), (False, 'Okay')]
+        assert recorder.gaps == []
+        assert (stream.status_number, stream.sequence_number) == (2, 2)
+        assert stream.time_allowed_to_live == 16
+
+    @staticmethod
+    def test_sequence_gap(recorder, publisher):
+        subscriber = recorder.subscriber()
+        first, _, third = frames(publisher, 3)
+        subscriber.receive(first)
+        subscriber.receive(third)
+        assert recorder.gaps == [(1, 1)]
+        assert subscriber.decoded == 1
+
+    @staticmethod
+    def test_status_gap(recorder, publisher):
+        subscriber = recorder.subscriber()
+        subscriber.receive(frames(publisher, 1)[0])
+        publisher.protocol_data_unit.all_data[0] = False
+        frames(publisher, 1)
+        publisher.protocol_data_unit.all_data[0] = True
+        subscriber.receive(frames(publisher, 2)[1])
+        assert recorder.gaps == [(2, 0)]
+        assert recorder.changes == [(True, 'Okay')]
+        assert subscriber.skipped == 1
+
+    @staticmethod
+    def test_revision(recorder, publisher):
+        subscriber = recorder.subscriber()
+        subscriber.receive(frames(publisher, 1)[0])
+        revised = Publisher(configuration_revision=2, sequence_number=1, all_data=(Boolean(True), VisibleString('Okay')))
+        subscriber.receive(bytes(revised))
+        assert recorder.revisions == [1]
+        assert recorder.changes == [(True, 'Okay')] * 2
+        assert recorder.gaps == []
+
+    @staticmethod
+    def test_streams(publisher):
+        subscriber = Subscriber()
+        subscriber.receive(frames(publisher, 1)[0])
+        subscriber.receive(bytes(Publisher(app_id=2)))
+        subscriber.receive(bytes(Publisher(goose_control_block_reference='IED_CFG/LLN0$GO$Other')))
+        assert len(subscriber.streams) == 3
+        assert subscriber.stream(1, REFERENCE).all_data == (True, 'Okay')
+        assert subscriber.stream(2, REFERENCE).all_data == ()
+        assert subscriber.stream(3, REFERENCE) is None
+
+    @staticmethod
+    def test_not_goose():
+        with raises(ValueError):
+            Subscriber().receive(b'\x00' * 64)
+
+    @staticmethod
+    def test_quality(recorder):
+        subscriber = recorder.subscriber()
+        publisher = Publisher(all_data=(Structure(Boolean(True), BitString('0000000000000')), OctetString(b'\x01')))
+        iter(publisher)
+        for frame in frames(publisher, 3):
+            subscriber.receive(frame)
+        assert recorder.changes == [((True, '0000000000000'), b'\x01')]
+
+    @staticmethod
+    def test_malformed_all_data(recorder):
+        subscriber = recorder.subscriber()
+        publisher = Publisher(all_data=(Boolean(True),))
+        iter(publisher)
+        frame = bytes(next(publisher))
+        malformed = frame[:-3] + b'\x8c\x01\x00'  # binary time, not supported by `AllData`
+        for _ in range(3):
+            with raises(ValueError):
+                subscriber.receive(malformed)  # every retransmission, not only the first one
+        stream = subscriber.stream(1, REFERENCE)
+        assert (stream.status_number, stream.raw_all_data, stream.all_data) == (None, None, None)
+        subscriber.receive(frame)
+        assert recorder.changes == [(True,)]
+        assert stream.sequence_number == 0
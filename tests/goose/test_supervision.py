@@ -0,0 +1,68 @@
+from pytest import fixture
+
+from py61850.goose.publisher import Publisher
+from py61850.goose.retransmission import RetransmissionCurve
+from py61850.goose.subscriber import Subscriber
+from py61850.goose.supervision import Supervisor
+
+
+class Clock:
+
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@fixture
+def clock():
+    return Clock()
+
+
+def frames(publisher, number):
+    iter(publisher)
+    return [bytes(next(publisher)) for _ in range(number)]
+
+
+class TestSupervisor:
+
+    @staticmethod
+    def test_timeout(clock):
+        timeouts = []
+        supervisor = Supervisor(timeouts.append, clock=clock)
+        subscriber = Subscriber(supervisor=supervisor)
+        stream = subscriber.receive(frames(Publisher(curve=RetransmissionCurve()), 1)[0])  # time allowed to live of 4 ms
+        assert supervisor.next_deadline == 100.004
+        assert supervisor.check(100.003) == ()
+        assert supervisor.check(100.004) == (stream,)
+        assert timeouts == [stream]
+        assert stream.expired
+        assert supervisor.streams == 0
+
+    @staticmethod
+    def test_refresh(clock):
+        supervisor = Supervisor(clock=clock)
+        subscriber = Subscriber(supervisor=supervisor)
+        publisher = Publisher()
+        iter(publisher)
+        for _ in range(8):
+            stream = subscriber.receive(bytes(next(publisher)))
+            clock.now += publisher.next_goose_timer * 1.5
+            assert supervisor.check() == ()
+        assert not stream.expired
+        clock.now += 2.0
+        assert supervisor.check() == (stream,)
+        subscriber.receive(bytes(next(publisher)))
+        assert not stream.expired
+        assert supervisor.streams == 1
+
+    @staticmethod
+    def test_many(clock):
+        supervisor = Supervisor(clock=clock)
+        subscriber = Subscriber(supervisor=supervisor)
+        streams = [subscriber.receive(frames(Publisher(app_id=app_id), 1)[0]) for app_id in range(1, 101)]
+        for stream in streams[::2]:
+            supervisor.remove(stream)
+        supervisor.remove(streams[0])
+        assert supervisor.check(101) == tuple(streams[1::2])
@@ -166,3 +166,40 @@ def test_a_b_c():
 def test_a_none_b_c():
     a, b, c = Base.unpack_extra_value((b'1', None), (2, 3))
     assert a == b'1' and b == 2 and c == 3
+
+
+# === UNPACK TLV ===
+def test_unpack_tlv_0():
+    assert Base.unpack_tlv(b'\x81\x06string') == (0x81, 2, 8)
+
+
+def test_unpack_tlv_1():
+    assert Base.unpack_tlv(b'\x82\x81\x80' + b'a' * 0x80) == (0x82, 3, 0x83)
+
+
+def test_unpack_tlv_2():
+    assert Base.unpack_tlv(b'\x82\x82\x01\xFF' + b'a' * 0x1FF) == (0x82, 4, 0x203)
+
+
+def test_unpack_tlv_offset():
+    assert Base.unpack_tlv(memoryview(b'\x80\x00\x81\x06string'), 2) == (0x81, 4, 10)
+
+
+def test_unpack_tlv_bytes():
+    base = Base(b'\x82', b'a' * 0x1FF)
+    assert Base.unpack_tlv(bytes(base)) == (0x82, len(base) - base.length, len(base))
+
+
+def test_unpack_tlv_truncated_error():
+    with raises(ValueError):
+        Base.unpack_tlv(b'\x81\x06str')
+
+
+def test_unpack_tlv_length_error():
+    with raises(ValueError):
+        Base.unpack_tlv(b'\x81\x83\x00\x00\x01a')
+
+
+def test_unpack_tlv_empty_error():
+    with raises(ValueError):
+        Base.unpack_tlv(b'\x81')
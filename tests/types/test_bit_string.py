@@ -0,0 +1,41 @@
+from pytest import mark, raises
+
+from py61850.types.bit_string import BitString
+
+
+@mark.parametrize('value, raw_value', [('', b'\x00'), ('1', b'\x07\x80'), ('10100101', b'\x00\xA5'),
+                                       ('0000000000001', b'\x03\x00\x08')],
+                  ids=['empty', 'one bit', 'one byte', 'quality'])
+class TestBitString:
+
+    @staticmethod
+    def test_encode(value, raw_value):
+        assert BitString(value).raw_value == raw_value
+
+    @staticmethod
+    def test_decode(value, raw_value):
+        assert BitString(raw_value).value == value
+
+    @staticmethod
+    def test_functional(value, raw_value):
+        assert BitString.decode(BitString.encode(value))[0] == value
+
+
+def test_tag():
+    assert bytes(BitString('1')) == b'\x84\x02\x07\x80'
+
+
+def test_error_type():
+    with raises(TypeError):
+        BitString(1)
+
+
+def test_error_value():
+    with raises(ValueError):
+        BitString('102')
+
+
+@mark.parametrize('raw_value', [b'', b'\x08\x00', b'\x01'], ids=['empty', 'unused bits', 'no byte'])
+def test_error_raw_value(raw_value):
+    with raises(ValueError):
+        BitString._decode(raw_value)
@@ -0,0 +1,50 @@
+from struct import pack
+
+from pytest import mark
+
+from py61850.types.base import Base
+from py61850.types.integer import Signed, Unsigned
+from py61850.types.times import Quality
+from py61850.utils.codec import BER_LENGTH, QUALITY, UINT8_BYTES
+
+
+def test_uint8_bytes():
+    assert UINT8_BYTES == tuple(pack('!B', byte) for byte in range(0x100))
+
+
+def test_ber_length_short():
+    assert BER_LENGTH[0x7F] == b'\x7F'
+
+
+def test_ber_length_long():
+    assert BER_LENGTH[0x80] == b'\x81\x80'
+
+
+@mark.parametrize("length, raw_length", [(0x100, b'\x82\x01\x00'), (0xFFFF, b'\x82\xFF\xFF')])
+def test_pack_length(length, raw_length):
+    assert Base.pack_length(length) == raw_length
+
+
+def test_quality_valid():
+    assert QUALITY[0x27] == (False, False, True, 7)
+
+
+def test_quality_invalid():
+    assert QUALITY[0x19] is None
+
+
+def test_quality_table():
+    for bits in range(0x100):
+        accuracy = bits & 0x1F
+        if accuracy <= 24 or accuracy == 0x1F:
+            assert bytes(Quality(*QUALITY[bits])) == UINT8_BYTES[bits]
+
+
+@mark.parametrize("value", [-0x80, -1, 0, 0x7F])
+def test_signed_small(value):
+    assert Signed.decode(Signed.encode(value))[0] == value
+
+
+@mark.parametrize("value", [0, 0xFF, 0x100, 0xFFFF, 0x10000])
+def test_unsigned(value):
+    assert Unsigned.decode(Unsigned.encode(value))[0] == value
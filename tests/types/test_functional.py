@@ -0,0 +1,86 @@
+from pytest import mark, raises
+
+from py61850.types import Boolean, VisibleString
+from py61850.types.floating_point import DoublePrecision, SinglePrecision
+from py61850.types.integer import Signed, Unsigned
+from py61850.types.times import Quality, Timestamp
+
+TYPES = {
+    id: ['boolean', 'unsigned', 'signed', 'single', 'double', 'string', 'timestamp'],
+    'type': [Boolean, Unsigned, Signed, SinglePrecision, DoublePrecision, VisibleString, Timestamp],
+    'value': [True, 0x1FF, -1, 1.5, 1.5, 'arthur', 1.5],
+}
+
+
+def new_value(data_type, value):
+    return (value, Quality()) if data_type is Timestamp else value
+
+
+class TestEncode:
+
+    @mark.parametrize("data_type, value", zip(TYPES['type'], TYPES['value']), ids=TYPES[id])
+    def test_encode(self, data_type, value):
+        expected = data_type(value, Quality()) if data_type is Timestamp else data_type(value)
+        assert data_type.encode(new_value(data_type, value)) == bytes(expected)
+
+    @staticmethod
+    def test_encode_visible_string():
+        assert VisibleString.encode('arthur') == b'\x8A\x06arthur'
+
+    @staticmethod
+    def test_encode_tag():
+        assert Boolean.encode(False, tag=b'\x88') == b'\x88\x01\x00'
+
+    @staticmethod
+    def test_encode_none():
+        assert VisibleString.encode(None) == b'\x8A\x00'
+
+    @staticmethod
+    def test_encode_range():
+        with raises(ValueError):
+            Unsigned.encode(-1)
+
+    @staticmethod
+    def test_encode_type():
+        with raises(TypeError):
+            VisibleString.encode(1)
+
+
+class TestDecode:
+
+    @mark.parametrize("data_type, value", zip(TYPES['type'], TYPES['value']), ids=TYPES[id])
+    def test_decode(self, data_type, value):
+        byte_stream = data_type.encode(new_value(data_type, value))
+        decoded, offset = data_type.decode(byte_stream)
+        if data_type is Timestamp:
+            decoded = decoded[0]
+        assert (decoded, offset) == (value, len(byte_stream))
+
+    @staticmethod
+    def test_decode_offset():
+        assert VisibleString.decode(b'\x83\x01\x0F\x8A\x06arthur', 3) == ('arthur', 11)
+
+    @staticmethod
+    def test_decode_memoryview():
+        assert Signed.decode(memoryview(b'\x85\x01\xFF')) == (-1, 3)
+
+    @staticmethod
+    def test_decode_tag():
+        assert Boolean.decode(b'\x88\x01\x00', tag=b'\x88') == (False, 3)
+
+    @staticmethod
+    def test_decode_wrong_tag():
+        with raises(ValueError) as info:
+            Boolean.decode(b'\x85\x01\x00')
+        assert str(info.value) == 'tag 0x85 not supported by Boolean'
+
+
+class TestQualityFunctional:
+
+    @staticmethod
+    def test_encode():
+        assert Quality.encode((True, True, True, 24)) == b'\xF8'
+
+    @staticmethod
+    def test_decode():
+        assert Quality.decode(b'\x00\x27', 1) == ((False, False, True, 7), 2)
@@ -89,6 +89,16 @@ class TestSigned:
 
     # === EXCEPTIONS ===
 
+    @mark.parametrize("value, raw_value", [(0x13, b'\x00\x00\x00\x13'), (-1, b'\xFF\xFF\xFF\xFF'),
+                                           (-0x80 ** 0x9, b'\x80\x00\x00\x00\x00\x00\x00\x00')],
+                      ids=['regular', 'negative', 'extreme'])
+    def test_fixed_length(self, value, raw_value):
+        assert Signed(value, fixed_length=True).raw_value == raw_value
+        signed = Signed(value)
+        signed.fixed_length = True
+        assert (signed.raw_value, signed.fixed_length) == (raw_value, True)
+        assert Signed.decode(bytes(signed)) == (value, len(raw_value) + 2)
+
     @mark.parametrize("value, error", zip(S_ERROR[int], S_ERROR['error']), ids=S_ERROR[id])
     def test_error(self, value, error):
         with raises(error):
@@ -181,3 +191,19 @@ class TestUnsigned:
     def test_error(self, value, error):
         with raises(error):
             Unsigned(value)
+
+    # === FIXED LENGTH ===
+
+    @mark.parametrize("value", [0, 0x13, 0xFFFF, 0xFFFFFFFF], ids=['zero', '1 byte', '2 bytes', '4 bytes'])
+    def test_fixed_length(self, value):
+        unsigned = Unsigned(value, fixed_length=True)
+        assert (unsigned.raw_value, unsigned.fixed_length) == (value.to_bytes(4, 'big'), True)
+        unsigned.fixed_length = False
+        assert unsigned.raw_value == Unsigned(value).raw_value
+        assert Unsigned.decode(bytes(Unsigned(value, fixed_length=True))) == (value, 6)
+
+    def test_fixed_length_range(self):
+        with raises(ValueError):
+            Unsigned(0x100, max_range=0xFF, fixed_length=True)
+        with raises(ValueError):
+            Unsigned(-1, fixed_length=True)
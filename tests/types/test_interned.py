@@ -0,0 +1,100 @@
+from pytest import mark, raises
+
+from py61850.goose.pdu import AllData
+from py61850.types.boolean import Boolean, InternedBoolean
+from py61850.types.integer import InternedUnsigned, Unsigned
+from py61850.types.times import Quality
+
+INTERNED = {
+    id: ['boolean', 'unsigned'],
+    'type': [InternedBoolean, InternedUnsigned],
+    'flavored': [Boolean, Unsigned],
+    'value': [True, 0xFF],
+}
+
+
+class TestInterned:
+
+    @mark.parametrize("data_type, value", zip(INTERNED['type'], INTERNED['value']), ids=INTERNED[id])
+    def test_same_value(self, data_type, value):
+        assert data_type(value) is data_type(value)
+
+    @mark.parametrize("data_type, flavored, value",
+                      zip(INTERNED['type'], INTERNED['flavored'], INTERNED['value']), ids=INTERNED[id])
+    def test_same_raw_value(self, data_type, flavored, value):
+        assert data_type(flavored(value).raw_value) is data_type(value)
+
+    @mark.parametrize("data_type, flavored, value",
+                      zip(INTERNED['type'], INTERNED['flavored'], INTERNED['value']), ids=INTERNED[id])
+    def test_bytes(self, data_type, flavored, value):
+        assert bytes(data_type(value)) == bytes(flavored(value))
+
+    @mark.parametrize("data_type, value", zip(INTERNED['type'], INTERNED['value']), ids=INTERNED[id])
+    def test_immutable(self, data_type, value):
+        with raises(AttributeError):
+            data_type(value).value = value
+
+    @staticmethod
+    def test_distinct():
+        assert InternedBoolean(True) is not InternedBoolean(False)
+
+    @staticmethod
+    def test_boolean_type():
+        with raises(TypeError):
+            InternedBoolean(1)
+
+    @staticmethod
+    def test_unsigned_range():
+        with raises(ValueError):
+            InternedUnsigned(0x100)
+
+    @staticmethod
+    def test_unsigned_raw_range():
+        with raises(ValueError):
+            InternedUnsigned(b'\x01\x00')
+
+    @staticmethod
+    def test_unhashable():
+        with raises(TypeError):
+            InternedUnsigned([1])
+
+    @staticmethod
+    def test_bounded():
+        class Value(int):
+            pass
+
+        for value in range(0x100):
+            InternedUnsigned(Value(value))
+            InternedUnsigned(bool(value % 2))
+        assert len(InternedUnsigned._instances) <= 2 * 0x100
+
+    @staticmethod
+    def test_shared_parent():
+        boolean = InternedBoolean(True)
+        first, second = AllData(boolean), AllData(boolean, Unsigned(1))
+        assert bytes(first) == b'\xab\x03\x83\x01\x0f'
+        assert bytes(second) == b'\xab\x06\x83\x01\x0f\x86\x01\x01'
+
+
+class TestInternedQuality:
+
+    @staticmethod
+    def test_default():
+        assert Quality() is Quality()
+
+    @staticmethod
+    def test_raw_value():
+        assert Quality(raw_value=b'\x20') is Quality()
+
+    @staticmethod
+    def test_attr():
+        assert Quality(True, True, True, 24) is Quality(raw_value=b'\xF8')
+
+    @staticmethod
+    def test_distinct():
+        assert Quality(time_accuracy=1) is not Quality()
+
+    @staticmethod
+    def test_invalid_raw_value():
+        with raises(ValueError):
+            Quality(raw_value=b'\x19')
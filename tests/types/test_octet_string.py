@@ -0,0 +1,31 @@
+from pytest import raises
+
+from py61850.types.octet_string import OctetString
+
+
+def test_value():
+    assert OctetString(b'\x01\x02').value == b'\x01\x02'
+
+
+def test_bytes():
+    assert bytes(OctetString(b'\x01\x02')) == b'\x89\x02\x01\x02'
+
+
+def test_empty():
+    assert OctetString(b'').raw_value is None
+    assert bytes(OctetString()) == b'\x89\x00'
+
+
+def test_functional():
+    assert OctetString.decode(OctetString.encode(b'\xFF')) == (b'\xFF', 3)
+
+
+def test_set_value():
+    octet_string = OctetString(b'\x01')
+    octet_string.value = b'\x02\x03'
+    assert octet_string.raw_value == b'\x02\x03'
+
+
+def test_error_type():
+    with raises(TypeError):
+        OctetString('string')
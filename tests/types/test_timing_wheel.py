@@ -0,0 +1,87 @@
+from pytest import fixture, mark, raises
+
+from py61850.utils.timing_wheel import TimingWheel
+
+
+@fixture
+def wheel():
+    return TimingWheel(10.0, resolution=0.01, slots=8)
+
+
+class TestTimingWheel:
+
+    @staticmethod
+    def test_expire(wheel):
+        wheel.schedule('a', 10.025)
+        wheel.schedule('b', 10.03)
+        wheel.schedule('c', 10.5)  # many turns ahead
+        assert list(wheel.expire(10.02)) == []
+        assert [key for _, key in wheel.expire(10.03)] == ['a', 'b']
+        assert list(wheel.expire(10.49)) == []
+        assert list(wheel.expire(10.5)) == [(10.5, 'c')]
+        assert len(wheel) == 0
+
+    @staticmethod
+    def test_move(wheel):
+        wheel.schedule('a', 10.02)
+        wheel.schedule('a', 10.05)
+        assert wheel.deadline('a') == 10.05
+        assert list(wheel.expire(10.04)) == []
+        assert [key for _, key in wheel.expire(10.05)] == ['a']
+
+    @staticmethod
+    def test_cancel(wheel):
+        wheel.schedule('a', 10.02)
+        wheel.cancel('a')
+        assert 'a' not in wheel
+        assert wheel.next_deadline is None
+        wheel.schedule('a', 10.02)
+        assert [key for _, key in wheel.expire(10.1)] == ['a']
+        with raises(KeyError):
+            wheel.cancel('a')
+
+    @staticmethod
+    def test_schedule_again(wheel):
+        # keys scheduled again while expiring are expired along the same call, tick by tick
+        wheel.schedule('a', 10.0)
+        times = []
+        for time, key in wheel.expire(10.1):
+            times.append(round(time, 2))
+            wheel.schedule(key, time + 0.03)
+        assert times == [10.0, 10.03, 10.06, 10.09]
+        assert wheel.deadline('a') == 10.12
+
+    @staticmethod
+    def test_far_behind(wheel):
+        # many turns behind, each slot is visited at most twice, each key still expired at its own tick
+        wheel.schedule('b', 10.1)
+        wheel.schedule('a', 10.02)
+        wheel.schedule('c', 1000.0)
+        times = []
+        for time, key in wheel.expire(100.0):
+            times.append((round(time, 2), key))
+            if len(times) == 1:
+                wheel.schedule(key, 10.03)  # before the last turn, thus due on its first tick
+        assert times == [(10.02, 'a'), (10.1, 'b'), (99.93, 'a')]
+        assert wheel.tick == 9000
+        assert [key for _, key in wheel.expire(1000.0)] == ['c']
+
+    @staticmethod
+    def test_past(wheel):
+        list(wheel.expire(10.05))
+        wheel.schedule('a', 9.0)
+        assert wheel.tick == 5
+        assert wheel.time == 10.05
+        assert wheel.next_deadline == 10.06
+
+    @staticmethod
+    def test_properties(wheel):
+        assert (wheel.resolution, wheel.slots) == (0.01, 8)
+        assert wheel.to_tick(10.011) == 2
+        assert wheel.to_tick(10.011, round_up=False) == 1
+
+    @staticmethod
+    @mark.parametrize('kwargs', [{'resolution': 0}, {'slots': 0}], ids=['resolution', 'slots'])
+    def test_range(kwargs):
+        with raises(ValueError):
+            TimingWheel(0.0, **kwargs)